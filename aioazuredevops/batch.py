@@ -0,0 +1,112 @@
+"""Batching of single item lookups issued together."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Any
+
+
+class _Batch:
+    """Items waiting to be fetched with one request."""
+
+    __slots__ = ("fetch", "futures", "handle")
+
+    def __init__(
+        self,
+        fetch: Callable[[list[Any]], Awaitable[Mapping[Any, Any]]],
+    ) -> None:
+        """Initialize."""
+        self.fetch: Callable[[list[Any]], Awaitable[Mapping[Any, Any]]] = fetch
+        self.futures: dict[Any, asyncio.Future[Any]] = {}
+        self.handle: asyncio.Handle | None = None
+
+
+class RequestBatcher:
+    """Fetch single item lookups made together with one request.
+
+    Lookups sharing a batch key are collected until the event loop runs
+    its next callbacks, or for delay seconds, then fetched together and
+    handed back to each caller. A batch reaching its maximum size is
+    fetched at once. Items missing from the result resolve to None, and
+    a failed fetch raises in every caller. Only share a batcher between
+    clients using the same credentials.
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+    ) -> None:
+        """Initialize."""
+        self._delay: float = delay
+        self._batches: dict[str, _Batch] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def delay(self) -> float:
+        """Get the time lookups are collected for."""
+        return self._delay
+
+    @property
+    def pending(self) -> int:
+        """Get the number of items waiting to be fetched."""
+        return sum(len(batch.futures) for batch in self._batches.values())
+
+    async def load[K: Hashable, V](
+        self,
+        key: str,
+        item: K,
+        fetch: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        max_batch_size: int,
+    ) -> V | None:
+        """Get an item, fetched with the other items batched under key.
+
+        fetch is called by the first lookup of a batch, so it must give
+        the same result whichever lookup provides it.
+        """
+        loop = asyncio.get_running_loop()
+        if (batch := self._batches.get(key)) is None:
+            batch = self._batches[key] = _Batch(fetch)
+            batch.handle = (
+                loop.call_later(self._delay, self._dispatch, key)
+                if self._delay
+                else loop.call_soon(self._dispatch, key)
+            )
+        if (future := batch.futures.get(item)) is None:
+            future = batch.futures[item] = loop.create_future()
+            if len(batch.futures) >= max_batch_size:
+                self._dispatch(key)
+        # Cancelling one caller must not cancel the lookup for the others
+        return await asyncio.shield(future)
+
+    def _dispatch(self, key: str) -> None:
+        """Start fetching the batch for key."""
+        if (batch := self._batches.pop(key, None)) is None:
+            return
+        if batch.handle is not None:
+            batch.handle.cancel()
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: _Batch) -> None:
+        """Fetch a batch, resolving the future of each item."""
+        try:
+            results = await batch.fetch(list(batch.futures))
+        except asyncio.CancelledError:
+            for future in batch.futures.values():
+                future.cancel()
+            raise
+        except Exception as err:
+            for future in batch.futures.values():
+                if not future.done():
+                    future.set_exception(err)
+                    # Callers may all have been cancelled
+                    future.add_done_callback(_retrieve)
+            return
+        for item, future in batch.futures.items():
+            if not future.done():
+                future.set_result(results.get(item))
+
+
+def _retrieve(future: asyncio.Future[Any]) -> None:
+    """Mark the exception of a future as retrieved."""
+    future.exception()
@@ -0,0 +1,82 @@
+"""Conditional request cache for slow changing resources."""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Final
+
+ETAG_HEADER: Final[str] = "ETag"
+LAST_MODIFIED_HEADER: Final[str] = "Last-Modified"
+IF_NONE_MATCH_HEADER: Final[str] = "If-None-Match"
+IF_MODIFIED_SINCE_HEADER: Final[str] = "If-Modified-Since"
+
+
+@dataclass
+class CacheEntry:
+    """Cached response validators and decoded value."""
+
+    value: Any
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Get the conditional request headers for this entry."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers[IF_NONE_MATCH_HEADER] = self.etag
+        if self.last_modified is not None:
+            headers[IF_MODIFIED_SINCE_HEADER] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Cache decoded responses by URL, revalidated with ETag / Last-Modified.
+
+    On a 304 Not Modified the previously decoded models are returned as is,
+    so they are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+    ) -> None:
+        """Initialize."""
+        self._max_entries: int = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of cached responses."""
+        return len(self._entries)
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Get the cache entry for a URL."""
+        if (entry := self._entries.get(url)) is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    def store(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        value: Any,
+    ) -> None:
+        """Store a decoded response if it carries validators."""
+        etag = headers.get(ETAG_HEADER)
+        last_modified = headers.get(LAST_MODIFIED_HEADER)
+        if etag is None and last_modified is None:
+            self._entries.pop(url, None)
+            return
+
+        self._entries[url] = CacheEntry(
+            value=value,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._entries.move_to_end(url)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self._entries.clear()
@@ -1,58 +1,231 @@
 """Get data from the Azure DevOps API."""
 
-from datetime import datetime
-from typing import Final
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from datetime import UTC, datetime
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Final, Self
+from urllib.parse import quote
 
 import aiohttp
 
-from .models.build import Build, BuildDefinition, BuildLinks
-from .models.core import (
-    Capabilities,
-    DefaultTeam,
-    LinkCollection,
-    Links,
-    ProcessTemplate,
-    Project,
-    VersionControl,
+from .batch import RequestBatcher
+from .cache import ResponseCache
+from .coalesce import RequestCoalescer
+from .decode import (
+    IdentityMap,
+    build_from_json,
+    iteration_from_json,
+    iteration_work_items_from_json,
+    project_from_json,
+    wiql_result_from_json,
+    work_item_from_json,
+    work_item_type_from_json,
 )
-from .models.iteration import Iteration, IterationAttributes
-from .models.iteration_work_item import (
-    IterationWorkItemsResult,
-    WorkItemRelation,
-    WorkItemRelationTarget,
-)
-from .models.wiql import WIQLColumn, WIQLResult, WIQLWorkItem
-from .models.work_item import (
-    WorkItem,
-    WorkItemAvatar,
-    WorkItemFields,
-    WorkItemLinks,
-    WorkItemUser,
-)
-from .models.work_item_type import (
-    Category,
-    Field,
-    Icon,
-    State,
-    Transition,
-    WorkItemType,
+from .json import JSONLoads, json_loads
+from .lazy import LazyWorkItemFields
+from .metrics import (
+    BUILDS_ENDPOINT,
+    WIQL_ENDPOINT,
+    WORK_ITEMS_BATCH_ENDPOINT,
+    DevOpsMetrics,
+    Metric,
+    endpoint_template,
 )
+from .models.build import Build
+from .models.core import Project
+from .models.iteration import Iteration
+from .models.iteration_work_item import IterationWorkItemsResult
+from .models.wiql import WIQLResult
+from .models.work_item import WorkItem, WorkItemBatch
+from .models.work_item_type import WorkItemType
+from .query import BuildQuery
+from .rate_limit import RateLimitController
+from .store import WorkItemStore
+from .table import WorkItemTable
+
+if TYPE_CHECKING:
+    from .project import ProjectContext
 
 DEFAULT_BASE_URL: Final[str] = "https://dev.azure.com"
 DEFAULT_API_VERSION: Final[str] = "7.2-preview"
+CONTINUATION_TOKEN_HEADER: Final[str] = "x-ms-continuationtoken"
+WIQL_DATETIME_FORMAT: Final[str] = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+# Connection pool of clients created with DevOpsClient.create
+DEFAULT_CONNECTION_LIMIT: Final[int] = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST: Final[int] = 16
+DEFAULT_KEEPALIVE_TIMEOUT: Final[float] = 60.0
+DEFAULT_DNS_CACHE_TTL: Final[int] = 300
+DEFAULT_TIMEOUT: Final[aiohttp.ClientTimeout] = aiohttp.ClientTimeout(
+    total=60, sock_connect=10
+)
+
+# Unread bodies up to this size are drained to keep the connection alive
+DRAIN_LIMIT: Final[int] = 64 * 1024
+
+# There is a limit of 200 work items per request
+WORK_ITEMS_CHUNK_SIZE: Final[int] = 200
+# Build ids per request, keeping URLs well under length limits
+BUILD_IDS_CHUNK_SIZE: Final[int] = 100
+
+# The fields read into WorkItemFields
+WORK_ITEM_FIELDS: Final[tuple[str, ...]] = (
+    "System.AreaPath",
+    "System.TeamProject",
+    "System.IterationPath",
+    "System.WorkItemType",
+    "System.State",
+    "System.Reason",
+    "System.AssignedTo",
+    "System.CreatedDate",
+    "System.CreatedBy",
+    "System.ChangedDate",
+    "System.ChangedBy",
+    "System.CommentCount",
+    "System.Title",
+    "Microsoft.VSTS.Common.StateChangeDate",
+    "Microsoft.VSTS.Common.Priority",
+)
+
+
+def _json_items(items: list[dict]) -> list[dict]:
+    """Get JSON items as they are."""
+    return items
+
+
+def _wiql_string(value: str) -> str:
+    """Get a WIQL string literal, escaping single quotes."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _build_parameters(parameters: str | BuildQuery) -> str:
+    """Get the query string of build list parameters."""
+    if isinstance(parameters, BuildQuery):
+        return parameters.parameters()
+    return parameters
+
+
+async def _drain(response: aiohttp.ClientResponse) -> None:
+    """Read a small unread body, so the connection returns to the pool.
+
+    Releasing a response with an unread body closes its connection.
+    """
+    if (
+        response.connection is None
+        or response.content_length is None
+        or response.content_length > DRAIN_LIMIT
+    ):
+        return
+    try:
+        await response.read()
+    except (aiohttp.ClientError, TimeoutError):
+        return
+
+
+def _chunk_ids(ids: list[int]) -> list[list[int]]:
+    """Split work item ids into chunks of WORK_ITEMS_CHUNK_SIZE."""
+    return [
+        ids[i : i + WORK_ITEMS_CHUNK_SIZE]
+        for i in range(0, len(ids), WORK_ITEMS_CHUNK_SIZE)
+    ]
 
 
 class DevOpsClient:
-    """Client for Azure DevOps."""
+    """Client for Azure DevOps.
+
+    Use as an async context manager to close the session when done, if
+    the client owns it.
+    """
 
     def __init__(
         self,
         session: aiohttp.ClientSession,
+        rate_limiter: RateLimitController | None = None,
+        cache: ResponseCache | None = None,
+        coalescer: RequestCoalescer | None = None,
+        json_loads: JSONLoads = json_loads,
+        *,
+        identity_map: IdentityMap | None = None,
+        base_url: str = DEFAULT_BASE_URL,
+        metrics: DevOpsMetrics | None = None,
+        batcher: RequestBatcher | None = None,
     ) -> None:
         """Initilalize."""
         self._authorized: bool = False
         self._pat: str | None = None
+        self._auth_headers: dict[str, str] | None = None
         self._session: aiohttp.ClientSession = session
+        self._rate_limiter: RateLimitController | None = rate_limiter
+        self._cache: ResponseCache | None = cache
+        self._coalescer: RequestCoalescer | None = coalescer
+        self._json_loads: JSONLoads = json_loads
+        self._identity_map: IdentityMap | None = identity_map
+        self._base_url: str = base_url.rstrip("/")
+        self._metrics: DevOpsMetrics | None = metrics
+        self._batcher: RequestBatcher | None = batcher
+        self._owns_session: bool = False
+        # Quoted URL prefixes by organization, or organization and project
+        self._organization_urls: dict[str, str] = {}
+        self._project_urls: dict[tuple[str, str], str] = {}
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache: int | None = DEFAULT_DNS_CACHE_TTL,
+        timeout: aiohttp.ClientTimeout = DEFAULT_TIMEOUT,
+        **kwargs: Any,
+    ) -> Self:
+        """Create a client owning a session with a tuned connection pool.
+
+        Must be called with an event loop running. Other keyword arguments
+        are passed to the client. With metrics, the metrics trace config
+        is added to the session. Close the client, or use it as an async
+        context manager, to close the session.
+        """
+        metrics: DevOpsMetrics | None = kwargs.get("metrics")
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=limit,
+                limit_per_host=limit_per_host,
+                keepalive_timeout=keepalive_timeout,
+                ttl_dns_cache=ttl_dns_cache,
+            ),
+            timeout=timeout,
+            trace_configs=None if metrics is None else [metrics.trace_config()],
+        )
+        client = cls(session, **kwargs)
+        client._owns_session = True
+        return client
+
+    async def close(self) -> None:
+        """Close the session, if the client owns it."""
+        if self._owns_session:
+            await self._session.close()
+
+    async def __aenter__(self) -> Self:
+        """Enter the client."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client."""
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Get the session."""
+        return self._session
 
     @property
     def authorized(self):
@@ -64,38 +237,252 @@ class DevOpsClient:
         """Get the PAT."""
         return self._pat
 
-    async def _get(
+    @property
+    def rate_limiter(self) -> RateLimitController | None:
+        """Get the rate limit controller."""
+        return self._rate_limiter
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """Get the response cache."""
+        return self._cache
+
+    @property
+    def coalescer(self) -> RequestCoalescer | None:
+        """Get the request coalescer."""
+        return self._coalescer
+
+    @property
+    def base_url(self) -> str:
+        """Get the base URL requests are sent to."""
+        return self._base_url
+
+    @property
+    def metrics(self) -> DevOpsMetrics | None:
+        """Get the request metrics."""
+        return self._metrics
+
+    @property
+    def batcher(self) -> RequestBatcher | None:
+        """Get the request batcher."""
+        return self._batcher
+
+    @property
+    def identity_map(self) -> IdentityMap | None:
+        """Get the identity map shared by every response."""
+        return self._identity_map
+
+    def _identities(self) -> IdentityMap:
+        """Get the identity map to decode a response with.
+
+        Without a client identity map, objects are only shared within
+        each response.
+        """
+        if self._identity_map is None:
+            return IdentityMap()
+        return self._identity_map
+
+    def project(self, organization: str, project: str) -> "ProjectContext":
+        """Get the client methods bound to an organization and project."""
+        from .project import ProjectContext  # noqa: PLC0415
+
+        return ProjectContext(self, organization, project)
+
+    def _organization_url(self, organization: str) -> str:
+        """Get the quoted URL of an organization."""
+        if (url := self._organization_urls.get(organization)) is None:
+            url = self._organization_urls[organization] = (
+                f"{self._base_url}/{quote(organization, safe='')}"
+            )
+        return url
+
+    def _project_url(self, organization: str, project: str) -> str:
+        """Get the quoted URL of a project."""
+        if (url := self._project_urls.get((organization, project))) is None:
+            url = self._project_urls[organization, project] = (
+                f"{self._organization_url(organization)}/{quote(project, safe='')}"
+            )
+        return url
+
+    @asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Run a request, always releasing its connection on exit."""
+        response = await self._paced(method, url, **kwargs)
+        try:
+            yield response
+            await _drain(response)
+        finally:
+            self._release(response)
+
+    def _release(self, response: aiohttp.ClientResponse) -> None:
+        """Release a response, recording its total latency if it was unread."""
+        if self._metrics is not None:
+            self._metrics.response_released(response)
+        response.release()
+
+    async def _paced(
         self,
+        method: str,
         url: str,
+        **kwargs,
     ) -> aiohttp.ClientResponse:
-        """Run a GET request and return response."""
-        if self._pat is None:
-            return await self._session.get(url)
-        return await self._session.get(
-            url,
-            headers={
-                "Authorization": aiohttp.BasicAuth("", self._pat).encode(),
-            },
-        )
+        """Send a request, pacing it through the rate limit controller."""
+        if self._auth_headers is not None:
+            kwargs["headers"] = (
+                self._auth_headers
+                if (headers := kwargs.get("headers")) is None
+                else {**headers, **self._auth_headers}
+            )
+        if self._rate_limiter is None:
+            return await self._send(method, url, **kwargs)
+
+        attempt = 0
+        while True:
+            async with self._rate_limiter:
+                response = await self._send(method, url, **kwargs)
+                delay = self._rate_limiter.record(
+                    response.status,
+                    response.headers,
+                    attempt,
+                )
+            if delay is None:
+                return response
+
+            await _drain(response)
+            self._release(response)
+            await asyncio.sleep(delay)
+            attempt += 1
 
-    async def _post(
+    async def _send(
         self,
+        method: str,
         url: str,
-        data: dict,
+        **kwargs,
     ) -> aiohttp.ClientResponse:
-        """Run a POST request and return response."""
-        if self._pat is None:
-            return await self._session.post(
+        """Send a request, counting its status or error in the metrics."""
+        if self._metrics is None:
+            return await self._session.request(method, url, **kwargs)
+
+        endpoint = endpoint_template(url)
+        start = time.perf_counter()
+        try:
+            response = await self._session.request(method, url, **kwargs)
+        except (aiohttp.ClientError, TimeoutError):
+            self._metrics.count_error(endpoint)
+            raise
+        self._metrics.response_received(response, endpoint, start)
+        return response
+
+    async def _read_json(
+        self,
+        response: aiohttp.ClientResponse,
+    ) -> Any:
+        """Read the response body once and decode it as JSON."""
+        body = await response.read()
+        if self._metrics is None:
+            return self._json_loads(body) if body.strip() else None
+
+        endpoint = self._metrics.response_read(response, len(body))
+        if not body.strip():
+            return None
+        start = time.perf_counter()
+        data = self._json_loads(body)
+        self._metrics.observe(endpoint, Metric.DECODE, time.perf_counter() - start)
+        return data
+
+    def _build[T](
+        self,
+        endpoint: str,
+        decode: Callable[[Any], T],
+        data: Any,
+    ) -> T:
+        """Build models from decoded JSON, timing it in the metrics."""
+        if self._metrics is None:
+            return decode(data)
+
+        start = time.perf_counter()
+        value = decode(data)
+        self._metrics.observe(endpoint, Metric.BUILD, time.perf_counter() - start)
+        return value
+
+    def _get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+    ) -> AbstractAsyncContextManager[aiohttp.ClientResponse]:
+        """Run a GET request, releasing the response on exit."""
+        if headers is None:
+            return self._request("GET", url)
+        return self._request("GET", url, headers=headers)
+
+    async def _fetch_decoded[T](
+        self,
+        url: str,
+        decode: Callable[[Any], T],
+        cache: bool,
+    ) -> T | None:
+        """Run a GET request and decode it, revalidating any cached value."""
+        entry = self._cache.get(url) if cache and self._cache is not None else None
+        async with self._get(
+            url,
+            None if entry is None else entry.validators,
+        ) as response:
+            if entry is not None and response.status == 304:
+                return entry.value
+            if response.status != 200:
+                return None
+            if (data := await self._read_json(response)) is None:
+                return None
+
+        value = self._build(endpoint_template(url), decode, data)
+        if cache and self._cache is not None:
+            self._cache.store(url, response.headers, value)
+        return value
+
+    async def _fetch_json(self, url: str) -> Any | None:
+        """Run a GET request, returning its JSON."""
+        async with self._get(url) as response:
+            if response.status != 200:
+                return None
+            return await self._read_json(response)
+
+    async def _get_decoded[T](
+        self,
+        url: str,
+        decode: Callable[[Any], T],
+        cache: bool = False,
+    ) -> T | None:
+        """Run a GET request and decode it, sharing identical requests in flight.
+
+        Only the JSON of uncached requests is shared, each caller decodes
+        it, as callers may decode the same URL differently. Cached URLs
+        are always decoded the same way, so their values are shared.
+        """
+        if self._coalescer is None:
+            return await self._fetch_decoded(url, decode, cache)
+        if cache:
+            return await self._coalescer.run(
                 url,
-                json=data,
+                lambda: self._fetch_decoded(url, decode, cache),
             )
-        return await self._session.post(
-            url,
-            json=data,
-            headers={
-                "Authorization": aiohttp.BasicAuth("", self._pat).encode(),
-            },
-        )
+        if (
+            data := await self._coalescer.run(url, lambda: self._fetch_json(url))
+        ) is None:
+            return None
+        return self._build(endpoint_template(url), decode, data)
+
+    def _post(
+        self,
+        url: str,
+        data: dict,
+    ) -> AbstractAsyncContextManager[aiohttp.ClientResponse]:
+        """Run a POST request, releasing the response on exit."""
+        return self._request("POST", url, json=data)
 
     async def authorize(
         self,
@@ -104,13 +491,11 @@ class DevOpsClient:
     ) -> bool:
         """Authorize the client."""
         self._pat = pat
-        response: aiohttp.ClientResponse = await self._get(
-            f"{DEFAULT_BASE_URL}/{organization}/_apis/projects?api-version={DEFAULT_API_VERSION}"
-        )
-        if response.status == 200:
-            self._authorized = True
-        else:
-            self._authorized = False
+        self._auth_headers = {"Authorization": aiohttp.BasicAuth("", pat).encode()}
+        async with self._get(
+            f"{self._organization_url(organization)}/_apis/projects?api-version={DEFAULT_API_VERSION}"
+        ) as response:
+            self._authorized = response.status == 200
 
         return self._authorized
 
@@ -120,132 +505,119 @@ class DevOpsClient:
         project: str,
     ) -> Project | None:
         """Get Azure DevOps project."""
-        response: aiohttp.ClientResponse = await self._get(
-            f"{DEFAULT_BASE_URL}/{organization}/_apis/projects/{project}?includeCapabilities=true&includeHistory=true&api-version={DEFAULT_API_VERSION}"
+        return await self._get_decoded(
+            f"{self._organization_url(organization)}/_apis/projects/{quote(project, safe='')}?includeCapabilities=true&includeHistory=true&api-version={DEFAULT_API_VERSION}",
+            project_from_json,
+            cache=True,
         )
-        if response.status != 200:
-            return None
-        if (json := await response.json()) is None:
-            return None
 
-        return Project(
-            id=json["id"],
-            name=json["name"],
-            description=json.get("description"),
-            url=json["url"],
-            state=json["state"],
-            capabilities=Capabilities(
-                process_template=ProcessTemplate(
-                    json["capabilities"]["processTemplate"]["templateName"],
-                    json["capabilities"]["processTemplate"]["templateTypeId"],
-                ),
-                versioncontrol=VersionControl(
-                    json["capabilities"]["versioncontrol"]["sourceControlType"],
-                    json["capabilities"]["versioncontrol"]["gitEnabled"],
-                    json["capabilities"]["versioncontrol"]["tfvcEnabled"],
-                ),
-            ),
-            revision=json["revision"],
-            links=Links(
-                links_self=LinkCollection(json["_links"]["self"]["href"]),
-                collection=LinkCollection(json["_links"]["collection"]["href"]),
-                web=LinkCollection(json["_links"]["web"]["href"]),
-            ),
-            visibility=json["visibility"],
-            default_team=DefaultTeam(
-                id=json["defaultTeam"]["id"],
-                name=json["defaultTeam"]["name"],
-                url=json["defaultTeam"]["url"],
+    async def _get_builds_page(
+        self,
+        organization: str,
+        project: str,
+        parameters: str,
+        continuation_token: str | None = None,
+    ) -> tuple[list[Build], str | None] | None:
+        """Get a page of Azure DevOps builds and the next continuation token."""
+        url = f"{self._project_url(organization, project)}/_apis/build/builds{'?' if parameters == '' else parameters}&api-version={DEFAULT_API_VERSION}"
+        if continuation_token is not None:
+            url += f"&continuationToken={quote(continuation_token, safe='')}"
+
+        async with self._get(url) as response:
+            if response.status != 200:
+                return None
+            if (json := await self._read_json(response)) is None:
+                return None
+
+        identities = self._identities()
+        return (
+            self._build(
+                BUILDS_ENDPOINT,
+                lambda data: [build_from_json(build, identities) for build in data],
+                json["value"],
             ),
-            last_update_time=datetime.strptime(
-                json["lastUpdateTime"],
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-            )
-            if "lastUpdateTime" in json
-            else None,
+            response.headers.get(CONTINUATION_TOKEN_HEADER),
         )
 
     async def get_builds(
         self,
         organization: str,
         project: str,
-        parameters: str,
+        parameters: str | BuildQuery,
     ) -> list[Build] | None:
-        """Get Azure DevOps builds."""
-        response: aiohttp.ClientResponse = await self._get(
-            f"{DEFAULT_BASE_URL}/{organization}/{project}/_apis/build/builds{"?" if parameters == "" else parameters}&api-version={DEFAULT_API_VERSION}",
-        )
-        if response.status != 200:
-            return None
-        if (json := await response.json()) is None:
+        """Get Azure DevOps builds.
+
+        Filter with a BuildQuery, or a query string starting with ?. Only
+        the first page is returned, use iter_builds to follow continuation
+        tokens through the full history.
+        """
+        if (
+            page := await self._get_builds_page(
+                organization,
+                project,
+                _build_parameters(parameters),
+            )
+        ) is None:
             return None
 
-        builds = []
-        for build in json["value"]:
-            builds.append(
-                Build(
-                    build["id"],
-                    build.get("buildNumber", None),
-                    build.get("status", None),
-                    build.get("result", None),
-                    build.get("sourceBranch", None),
-                    build.get("sourceVersion", None),
-                    build.get("priority", None),
-                    build.get("reason", None),
-                    build.get("queueTime", None),
-                    build.get("startTime", None),
-                    build.get("startTime", None),
-                    BuildDefinition(
-                        build["definition"]["id"],
-                        build["definition"]["name"],
-                        build["definition"].get("url", None),
-                        build["definition"].get("path", None),
-                        build["definition"].get("type", None),
-                        build["definition"].get("queueStatus", None),
-                        build["definition"].get("revision", None),
-                    )
-                    if "definition" in build
-                    else None,
-                    Project(
-                        id=build["project"]["id"],
-                        name=build["project"]["name"],
-                        description=build["project"].get("description", None),
-                        url=build["project"].get("url", None),
-                        state=build["project"].get("state", None),
-                        revision=build["project"].get("revision", None),
-                        visibility=build["project"].get("visibility", None),
-                        last_update_time=datetime.strptime(
-                            build["project"]["lastUpdateTime"],
-                            "%Y-%m-%dT%H:%M:%S.%fZ",
+        return page[0]
+
+    async def iter_builds(
+        self,
+        organization: str,
+        project: str,
+        parameters: str | BuildQuery = "",
+        prefetch: bool = False,
+    ) -> AsyncGenerator[Build, None]:
+        """Iterate Azure DevOps builds page by page.
+
+        With prefetch, the next page is requested while the current page
+        is being consumed. At most two pages are held in memory. Nothing
+        is yielded if the first page fails; a later page failing raises
+        aiohttp.ClientError rather than silently truncating the history.
+        """
+        parameters = _build_parameters(parameters)
+        next_page: asyncio.Task[tuple[list[Build], str | None] | None] | None = None
+        try:
+            page = await self._get_builds_page(
+                organization,
+                project,
+                parameters,
+            )
+            while page is not None:
+                builds, continuation_token = page
+                if continuation_token is not None and prefetch:
+                    next_page = asyncio.create_task(
+                        self._get_builds_page(
+                            organization,
+                            project,
+                            parameters,
+                            continuation_token,
                         )
-                        if "lastUpdateTime" in build["project"]
-                        else None,
-                    )
-                    if "project" in build
-                    else None,
-                    BuildLinks(
-                        build["_links"]["self"]["href"]
-                        if "self" in build["_links"]
-                        else None,
-                        build["_links"]["web"]["href"]
-                        if "web" in build["_links"]
-                        else None,
-                        build["_links"]["sourceVersionDisplayUri"]["href"]
-                        if "sourceVersionDisplayUri" in build["_links"]
-                        else None,
-                        build["_links"]["timeline"]["href"]
-                        if "timeline" in build["_links"]
-                        else None,
-                        build["_links"]["badge"]["href"]
-                        if "badge" in build["_links"]
-                        else None,
                     )
-                    if "_links" in build
-                    else None,
-                )
-            )
 
-        return builds
+                for build in builds:
+                    yield build
+
+                if continuation_token is None:
+                    return
+                if next_page is not None:
+                    page = await next_page
+                    next_page = None
+                else:
+                    page = await self._get_builds_page(
+                        organization,
+                        project,
+                        parameters,
+                        continuation_token,
+                    )
+                if page is None:
+                    raise aiohttp.ClientError(
+                        f"Failed to get the builds page at continuation token {continuation_token}"
+                    )
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
     async def get_build(
         self,
@@ -253,100 +625,63 @@ class DevOpsClient:
         project: str,
         build_id: int,
     ) -> Build | None:
-        """Get Azure DevOps build."""
-        response: aiohttp.ClientResponse = await self._get(
-            f"{DEFAULT_BASE_URL}/{organization}/{project}/_apis/build/builds/{build_id}?api-version={DEFAULT_API_VERSION}"
-        )
-        if response.status != 200:
-            return None
-        if (build := await response.json()) is None:
-            return None
+        """Get Azure DevOps build.
 
-        return Build(
-            build["id"],
-            build.get("buildNumber", None),
-            build.get("status", None),
-            build.get("result", None),
-            build.get("sourceBranch", None),
-            build.get("sourceVersion", None),
-            build.get("priority", None),
-            build.get("reason", None),
-            build.get("queueTime", None),
-            build.get("startTime", None),
-            build.get("startTime", None),
-            BuildDefinition(
-                build["definition"]["id"],
-                build["definition"]["name"],
-                build["definition"].get("url", None),
-                build["definition"].get("path", None),
-                build["definition"].get("type", None),
-                build["definition"].get("queueStatus", None),
-                build["definition"].get("revision", None),
-            )
-            if "definition" in build
-            else None,
-            Project(
-                id=build["project"]["id"],
-                name=build["project"]["name"],
-                description=build["project"].get("description", None),
-                url=build["project"].get("url", None),
-                state=build["project"].get("state", None),
-                revision=build["project"].get("revision", None),
-                visibility=build["project"].get("visibility", None),
-                last_update_time=datetime.strptime(
-                    build["project"]["lastUpdateTime"],
-                    "%Y-%m-%dT%H:%M:%S.%fZ",
-                )
-                if "lastUpdateTime" in build["project"]
-                else None,
-            )
-            if "project" in build
-            else None,
-            BuildLinks(
-                build["_links"]["self"]["href"] if "self" in build["_links"] else None,
-                build["_links"]["web"]["href"] if "web" in build["_links"] else None,
-                build["_links"]["sourceVersionDisplayUri"]["href"]
-                if "sourceVersionDisplayUri" in build["_links"]
-                else None,
-                build["_links"]["timeline"]["href"]
-                if "timeline" in build["_links"]
-                else None,
-                build["_links"]["badge"]["href"]
-                if "badge" in build["_links"]
-                else None,
+        With a batcher, builds requested together are fetched with one
+        request.
+        """
+        if self._batcher is not None:
+            return await self._batcher.load(
+                f"{self._project_url(organization, project)}/builds",
+                build_id,
+                lambda build_ids: self._get_builds_by_id(
+                    organization, project, build_ids
+                ),
+                BUILD_IDS_CHUNK_SIZE,
             )
-            if "_links" in build
-            else None,
+        return await self._get_decoded(
+            f"{self._project_url(organization, project)}/_apis/build/builds/{build_id}?api-version={DEFAULT_API_VERSION}",
+            lambda data: build_from_json(data, self._identities()),
+        )
+
+    async def get_builds_by_id(
+        self,
+        organization: str,
+        project: str,
+        build_ids: list[int],
+    ) -> list[Build] | None:
+        """Get Azure DevOps builds by id, omitting missing builds."""
+        identities = self._identities()
+        return await self._get_decoded(
+            f"{self._project_url(organization, project)}/_apis/build/builds?buildIds={','.join(str(build_id) for build_id in build_ids)}&api-version={DEFAULT_API_VERSION}",
+            lambda data: [
+                build_from_json(build, identities) for build in data["value"]
+            ],
         )
 
+    async def _get_builds_by_id(
+        self,
+        organization: str,
+        project: str,
+        build_ids: list[int],
+    ) -> dict[int, Build]:
+        """Get Azure DevOps builds by id, keyed by id."""
+        builds = await self.get_builds_by_id(organization, project, build_ids)
+        return {} if builds is None else {build.build_id: build for build in builds}
+
     async def get_iterations(
         self,
         organization: str,
         project: str,
     ) -> list[Iteration] | None:
         """Get Azure DevOps iterations."""
-        response: aiohttp.ClientResponse = await self._get(
-            f"{DEFAULT_BASE_URL}/{organization}/{project}/_apis/work/teamsettings/iterations?api-version={DEFAULT_API_VERSION}"
+        return await self._get_decoded(
+            f"{self._project_url(organization, project)}/_apis/work/teamsettings/iterations?api-version={DEFAULT_API_VERSION}",
+            lambda data: [
+                iteration_from_json(iteration) for iteration in data["value"]
+            ],
+            cache=True,
         )
-        if response.status != 200:
-            return None
-        if (data := await response.json()) is None:
-            return None
-
-        return [
-            Iteration(
-                id=iteration["id"],
-                name=iteration["name"],
-                path=iteration["path"],
-                attributes=IterationAttributes(
-                    start_date=iteration["attributes"]["startDate"],
-                    finish_date=iteration["attributes"]["finishDate"],
-                    time_frame=iteration["attributes"]["timeFrame"],
-                ),
-                url=iteration["url"],
-            )
-            for iteration in data["value"]
-        ]
 
     async def get_iteration(
         self,
@@ -355,24 +690,9 @@ class DevOpsClient:
         iteration_id: str,
     ) -> Iteration | None:
         """Get Azure DevOps iteration."""
-        response: aiohttp.ClientResponse = await self._get(
-            f"{DEFAULT_BASE_URL}/{organization}/{project}/_apis/work/teamsettings/iterations/{iteration_id}?api-version={DEFAULT_API_VERSION}"
-        )
-        if response.status != 200:
-            return None
-        if (iteration := await response.json()) is None:
-            return None
-
-        return Iteration(
-            id=iteration["id"],
-            name=iteration["name"],
-            path=iteration["path"],
-            attributes=IterationAttributes(
-                start_date=iteration["attributes"]["startDate"],
-                finish_date=iteration["attributes"]["finishDate"],
-                time_frame=iteration["attributes"]["timeFrame"],
-            ),
-            url=iteration["url"],
+        return await self._get_decoded(
+            f"{self._project_url(organization, project)}/_apis/work/teamsettings/iterations/{quote(iteration_id, safe='')}?api-version={DEFAULT_API_VERSION}",
+            iteration_from_json,
         )
 
     async def get_iteration_work_items(
@@ -382,27 +702,9 @@ class DevOpsClient:
         iteration_id: str,
     ) -> IterationWorkItemsResult | None:
         """Get Azure DevOps iteration work items."""
-        response: aiohttp.ClientResponse = await self._get(
-            f"{DEFAULT_BASE_URL}/{organization}/{project}/_apis/work/teamsettings/iterations/{iteration_id}/workitems?api-version={DEFAULT_API_VERSION}"
-        )
-        if response.status != 200:
-            return None
-        if (data := await response.json()) is None:
-            return None
-
-        return IterationWorkItemsResult(
-            work_item_relations=[
-                WorkItemRelation(
-                    rel=work_item_relation.get("rel", None),
-                    source=work_item_relation.get("source", None),
-                    target=WorkItemRelationTarget(
-                        id=work_item_relation["target"]["id"],
-                        url=work_item_relation["target"]["url"],
-                    ),
-                )
-                for work_item_relation in data["workItemRelations"]
-            ],
-            url=data["url"],
+        return await self._get_decoded(
+            f"{self._project_url(organization, project)}/_apis/work/teamsettings/iterations/{quote(iteration_id, safe='')}/workitems?api-version={DEFAULT_API_VERSION}",
+            iteration_work_items_from_json,
         )
 
     async def get_work_item_ids_from_wiql(
@@ -410,44 +712,36 @@ class DevOpsClient:
         organization: str,
         project: str,
         states: list[str] | None = None,
+        changed_since: datetime | None = None,
     ) -> WIQLResult | None:
-        """Get Azure DevOps work item ids from wiql."""
+        """Get Azure DevOps work item ids from wiql.
+
+        With changed_since, only work items changed at or after that time
+        are returned.
+        """
         state_condition = (
-            f" AND [System.State] IN({','.join([f'\'{state}\'' for state in states])})"
+            f" AND [System.State] IN({','.join([_wiql_string(state) for state in dict.fromkeys(states)])})"
             if states is not None
             else ""
         )
-        query = f"SELECT [System.Id] FROM workitems WHERE [System.TeamProject] = '{project}'{state_condition}"  # noqa: S608
+        changed_condition = (
+            f" AND [System.ChangedDate] >= '{changed_since.astimezone(UTC).strftime(WIQL_DATETIME_FORMAT)}'"
+            if changed_since is not None
+            else ""
+        )
+        query = f"SELECT [System.Id] FROM workitems WHERE [System.TeamProject] = {_wiql_string(project)}{state_condition}{changed_condition}"  # noqa: S608
 
-        response: aiohttp.ClientResponse = await self._post(
-            f"{DEFAULT_BASE_URL}/{organization}/{project}/_apis/wit/wiql?api-version={DEFAULT_API_VERSION}",
+        async with self._post(
+            # Compare ChangedDate to the time, not only the day
+            f"{self._project_url(organization, project)}/_apis/wit/wiql?{'' if changed_since is None else 'timePrecision=true&'}api-version={DEFAULT_API_VERSION}",
             {"query": query},
-        )
-        if response.status != 200:
-            return None
-        if (data := await response.json()) is None:
-            return None
+        ) as response:
+            if response.status != 200:
+                return None
+            if (data := await self._read_json(response)) is None:
+                return None
 
-        return WIQLResult(
-            query_type=data["queryType"],
-            query_result_type=data["queryResultType"],
-            as_of=data["asOf"],
-            columns=[
-                WIQLColumn(
-                    reference_name=column["referenceName"],
-                    name=column["name"],
-                    url=column["url"],
-                )
-                for column in data["columns"]
-            ],
-            work_items=[
-                WIQLWorkItem(
-                    id=work_item["id"],
-                    url=work_item["url"],
-                )
-                for work_item in data["workItems"]
-            ],
-        )
+        return self._build(WIQL_ENDPOINT, wiql_result_from_json, data)
 
     async def get_work_item_ids(
         self,
@@ -471,149 +765,253 @@ class DevOpsClient:
 
         return [wi.id for wi in wiql_result.work_items]
 
+    async def _get_work_items_data[T](
+        self,
+        organization: str,
+        project: str,
+        ids: list[int],
+        *,
+        fields: Sequence[str] | None = WORK_ITEM_FIELDS,
+        use_batch: bool = False,
+        decode: Callable[[list[dict]], T],
+    ) -> T | None:
+        """Get Azure DevOps work items, decoded from their JSON by decode."""
+        if use_batch:
+            body: dict[str, Any] = {"ids": ids, "errorPolicy": "omit"}
+            if fields is not None:
+                body["fields"] = list(fields)
+            async with self._post(
+                f"{self._project_url(organization, project)}/_apis/wit/workitemsbatch?api-version={DEFAULT_API_VERSION}",
+                body,
+            ) as response:
+                if response.status != 200:
+                    return None
+                if (data := await self._read_json(response)) is None:
+                    return None
+            return self._build(WORK_ITEMS_BATCH_ENDPOINT, decode, data["value"])
+
+        fields_parameter = "" if fields is None else f"&fields={','.join(fields)}"
+        return await self._get_decoded(
+            f"{self._project_url(organization, project)}/_apis/wit/workitems?ids={','.join(str(id) for id in ids)}{fields_parameter}&errorPolicy=omit&api-version={DEFAULT_API_VERSION}",
+            lambda data: decode(data["value"]),
+        )
+
     async def _get_work_items(
         self,
         organization: str,
         project: str,
         ids: list[int],
+        *,
+        fields: Sequence[str] | None = WORK_ITEM_FIELDS,
+        use_batch: bool = False,
+        lazy: bool = False,
     ) -> list[WorkItem] | None:
         """Get Azure DevOps work items."""
-        response: aiohttp.ClientResponse = await self._get(
-            f"{DEFAULT_BASE_URL}/{organization}/{project}/_apis/wit/workitems?ids={','.join(str(id) for id in ids)}&errorPolicy=omit&api-version={DEFAULT_API_VERSION}"
+        if lazy:
+            return await self._get_work_items_data(
+                organization,
+                project,
+                ids,
+                fields=fields,
+                use_batch=use_batch,
+                decode=lambda data: [
+                    WorkItem(
+                        id=work_item["id"],
+                        rev=work_item["rev"],
+                        fields=LazyWorkItemFields(work_item["fields"]),
+                        url=work_item["url"],
+                    )
+                    for work_item in data
+                ],
+            )
+
+        identities = self._identities()
+        return await self._get_work_items_data(
+            organization,
+            project,
+            ids,
+            fields=fields,
+            use_batch=use_batch,
+            decode=lambda data: [
+                work_item_from_json(work_item, identities) for work_item in data
+            ],
         )
-        if response.status != 200:
-            return None
-        if (data := await response.json()) is None:
-            return None
 
-        return [
-            WorkItem(
-                id=work_item["id"],
-                rev=work_item["rev"],
-                fields=WorkItemFields(
-                    area_path=work_item["fields"]["System.AreaPath"],
-                    team_project=work_item["fields"]["System.TeamProject"],
-                    iteration_path=work_item["fields"]["System.IterationPath"],
-                    work_item_type=work_item["fields"]["System.WorkItemType"],
-                    state=work_item["fields"]["System.State"],
-                    reason=work_item["fields"]["System.Reason"],
-                    assigned_to=WorkItemUser(
-                        display_name=work_item["fields"]["System.AssignedTo"][
-                            "displayName"
-                        ],
-                        url=work_item["fields"]["System.AssignedTo"].get("url", None),
-                        links=WorkItemLinks(
-                            avatar=WorkItemAvatar(
-                                href=work_item["fields"]["System.AssignedTo"]["_links"][
-                                    "avatar"
-                                ]["href"],
-                            ),
-                        )
-                        if "_links" in work_item["fields"]["System.AssignedTo"]
-                        else None,
-                        id=work_item["fields"]["System.AssignedTo"].get("id", None),
-                        unique_name=work_item["fields"]["System.AssignedTo"].get(
-                            "uniqueName", None
-                        ),
-                        image_url=work_item["fields"]["System.AssignedTo"].get(
-                            "imageUrl", None
-                        ),
-                        descriptor=work_item["fields"]["System.AssignedTo"].get(
-                            "descriptor", None
-                        ),
-                    )
-                    if "System.AssignedTo" in work_item["fields"]
-                    and work_item["fields"]["System.AssignedTo"]
-                    else None,
-                    created_date=work_item["fields"]["System.CreatedDate"],
-                    created_by=WorkItemUser(
-                        display_name=work_item["fields"]["System.CreatedBy"].get(
-                            "displayName", None
-                        ),
-                        url=work_item["fields"]["System.CreatedBy"].get("url", None),
-                        links=WorkItemLinks(
-                            avatar=WorkItemAvatar(
-                                href=work_item["fields"]["System.CreatedBy"]["_links"][
-                                    "avatar"
-                                ]["href"]
-                            ),
-                        )
-                        if "_links" in work_item["fields"]["System.CreatedBy"]
-                        else None,
-                        id=work_item["fields"]["System.CreatedBy"].get("id", None),
-                        unique_name=work_item["fields"]["System.CreatedBy"].get(
-                            "uniqueName", None
-                        ),
-                        image_url=work_item["fields"]["System.CreatedBy"].get(
-                            "imageUrl", None
-                        ),
-                        descriptor=work_item["fields"]["System.CreatedBy"].get(
-                            "descriptor", None
-                        ),
-                    )
-                    if "System.CreatedBy" in work_item["fields"]
-                    and work_item["fields"]["System.CreatedBy"]
-                    else None,
-                    changed_date=work_item["fields"]["System.ChangedDate"],
-                    changed_by=WorkItemUser(
-                        display_name=work_item["fields"]["System.ChangedBy"][
-                            "displayName"
-                        ],
-                        url=work_item["fields"]["System.ChangedBy"]["url"],
-                        links=WorkItemLinks(
-                            avatar=WorkItemAvatar(
-                                href=work_item["fields"]["System.ChangedBy"]["_links"][
-                                    "avatar"
-                                ]["href"],
-                            ),
-                        ),
-                        id=work_item["fields"]["System.ChangedBy"]["id"],
-                        unique_name=work_item["fields"]["System.ChangedBy"][
-                            "uniqueName"
-                        ],
-                        image_url=work_item["fields"]["System.ChangedBy"]["imageUrl"],
-                        descriptor=work_item["fields"]["System.ChangedBy"][
-                            "descriptor"
-                        ],
-                    )
-                    if "System.ChangedBy" in work_item["fields"]
-                    and work_item["fields"]["System.ChangedBy"]
-                    else None,
-                    comment_count=work_item["fields"]["System.CommentCount"],
-                    title=work_item["fields"]["System.Title"],
-                    microsoft_vsts_common_state_change_date=work_item["fields"].get(
-                        "Microsoft.VSTS.Common.StateChangeDate", None
-                    ),
-                    microsoft_vsts_common_priority=work_item["fields"].get(
-                        "Microsoft.VSTS.Common.Priority", None
-                    ),
-                ),
-                url=work_item["url"],
+    async def _gather_chunks[T](
+        self,
+        chunks: list[list[int]],
+        max_concurrency: int,
+        fetch: Callable[[list[int]], Awaitable[T | None]],
+        *,
+        suppress_errors: bool = False,
+    ) -> list[T | None]:
+        """Fetch each chunk up to max_concurrency at a time, in chunk order.
+
+        A chunk failing with a client or timeout error raises, cancelling
+        the other chunks, unless suppress_errors turns it into None.
+        Raises ValueError if max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
             )
-            for work_item in data["value"]
-        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _get_chunk(chunk: list[int]) -> T | None:
+            async with semaphore:
+                if not suppress_errors:
+                    return await fetch(chunk)
+                try:
+                    return await fetch(chunk)
+                except (aiohttp.ClientError, TimeoutError):
+                    return None
+
+        tasks = [asyncio.create_task(_get_chunk(chunk)) for chunk in chunks]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _get_work_item_chunks(
+        self,
+        organization: str,
+        project: str,
+        chunks: list[list[int]],
+        max_concurrency: int,
+        *,
+        fields: Sequence[str] | None,
+        use_batch: bool,
+        lazy: bool,
+        suppress_errors: bool = False,
+    ) -> list[list[WorkItem] | None]:
+        """Get Azure DevOps work items for each chunk, in chunk order."""
+        return await self._gather_chunks(
+            chunks,
+            max_concurrency,
+            lambda chunk: self._get_work_items(
+                organization,
+                project,
+                chunk,
+                fields=fields,
+                use_batch=use_batch,
+                lazy=lazy,
+            ),
+            suppress_errors=suppress_errors,
+        )
+
+    async def get_work_item(
+        self,
+        organization: str,
+        project: str,
+        id: int,
+    ) -> WorkItem | None:
+        """Get an Azure DevOps work item.
+
+        With a batcher, work items requested together are fetched with
+        one request.
+        """
+        if self._batcher is not None:
+            return await self._batcher.load(
+                f"{self._project_url(organization, project)}/workitems",
+                id,
+                lambda ids: self._get_work_items_by_id(organization, project, ids),
+                WORK_ITEMS_CHUNK_SIZE,
+            )
+        return await self._get_decoded(
+            f"{self._project_url(organization, project)}/_apis/wit/workitems/{id}?errorPolicy=omit&api-version={DEFAULT_API_VERSION}",
+            lambda data: work_item_from_json(data, self._identities()),
+        )
+
+    async def _get_work_items_by_id(
+        self,
+        organization: str,
+        project: str,
+        ids: list[int],
+    ) -> dict[int, WorkItem]:
+        """Get Azure DevOps work items with every field, keyed by id."""
+        work_items = await self._get_work_items(organization, project, ids, fields=None)
+        return (
+            {}
+            if work_items is None
+            else {work_item.id: work_item for work_item in work_items}
+        )
+
+    async def get_work_item_batch(
+        self,
+        organization: str,
+        project: str,
+        ids: list[int],
+        max_concurrency: int = 1,
+        *,
+        fields: Sequence[str] | None = WORK_ITEM_FIELDS,
+        use_batch: bool = False,
+        lazy: bool = False,
+    ) -> WorkItemBatch:
+        """Get Azure DevOps work items, reporting any chunks that failed.
+
+        Chunks failing with an error response, a client error or a
+        timeout are reported in failed_chunks instead of raising.
+        """
+        chunks = _chunk_ids(ids)
+        results = await self._get_work_item_chunks(
+            organization,
+            project,
+            chunks,
+            max_concurrency,
+            fields=fields,
+            use_batch=use_batch,
+            lazy=lazy,
+            suppress_errors=True,
+        )
+
+        batch = WorkItemBatch(work_items=[], failed_chunks=[])
+        for chunk, work_items in zip(chunks, results, strict=True):
+            if work_items is None:
+                batch.failed_chunks.append(chunk)
+            else:
+                batch.work_items.extend(work_items)
+
+        return batch
 
     async def get_work_items(
         self,
         organization: str,
         project: str,
         ids: list[int],
+        max_concurrency: int = 1,
+        *,
+        fields: Sequence[str] | None = WORK_ITEM_FIELDS,
+        use_batch: bool = False,
+        lazy: bool = False,
     ) -> list[WorkItem] | None:
-        """Get Azure DevOps work items."""
+        """Get Azure DevOps work items.
+
+        Chunks are requested up to max_concurrency at a time and the
+        result keeps the order of ids. Chunks with an error response are
+        left out, and None is returned if every chunk failed. Client
+        errors and timeouts raise, use get_work_item_batch to get the
+        work items of the chunks that succeeded instead. Only the given
+        fields are requested and the others are None, pass None to request
+        every field. With use_batch the ids are sent in the body of a
+        workitemsbatch request instead of the URL. With lazy each field is
+        only decoded when it is first read.
+        """
         work_items = None
 
-        # There is a limit of 200 work items per request
-        # Chunk the work items into groups of 200
+        # Chunk the work items into groups of WORK_ITEMS_CHUNK_SIZE
         # and get the work items for each group
-        for i in range(0, len(ids), 200):
-            chunk = ids[i : i + 200]
-            if (
-                wi := await self._get_work_items(
-                    organization,
-                    project,
-                    chunk,
-                )
-            ) is not None:
+        for wi in await self._get_work_item_chunks(
+            organization,
+            project,
+            _chunk_ids(ids),
+            max_concurrency,
+            fields=fields,
+            use_batch=use_batch,
+            lazy=lazy,
+        ):
+            if wi is not None:
                 if work_items is None:
                     work_items = wi
                 else:
@@ -621,73 +1019,255 @@ class DevOpsClient:
 
         return work_items
 
-    async def get_work_item_types(
+    async def get_work_items_table(
         self,
         organization: str,
         project: str,
-    ) -> list[WorkItemType] | None:
-        """Get Azure DevOps work item types."""
-        response: aiohttp.ClientResponse = await self._get(
-            f"{DEFAULT_BASE_URL}/{organization}/{project}/_apis/wit/workitemtypes?api-version={DEFAULT_API_VERSION}"
-        )
-        if response.status != 200:
-            return None
-        if (data := await response.json()) is None:
+        ids: list[int],
+        max_concurrency: int = 1,
+        *,
+        use_batch: bool = False,
+    ) -> WorkItemTable | None:
+        """Get Azure DevOps work items as a columnar table.
+
+        Each chunk is turned into columns as it arrives, so at most
+        max_concurrency chunks of WorkItem objects are alive at a time,
+        one with the default. Rows keep the order of ids. Returns None if
+        every chunk failed. Client errors and timeouts raise, as with
+        get_work_items.
+        """
+        table = None
+        for chunk_table in await self._gather_chunks(
+            _chunk_ids(ids),
+            max_concurrency,
+            lambda chunk: self._get_work_items_table(
+                organization,
+                project,
+                chunk,
+                use_batch=use_batch,
+            ),
+        ):
+            if chunk_table is not None:
+                if table is None:
+                    table = chunk_table
+                else:
+                    table.extend(chunk_table)
+
+        return table
+
+    async def _get_work_items_table(
+        self,
+        organization: str,
+        project: str,
+        ids: list[int],
+        *,
+        use_batch: bool,
+    ) -> WorkItemTable | None:
+        """Get a chunk of Azure DevOps work items as a columnar table."""
+        if (
+            work_items := await self._get_work_items(
+                organization,
+                project,
+                ids,
+                use_batch=use_batch,
+            )
+        ) is None:
             return None
+        return WorkItemTable(work_items)
 
-        return [
-            WorkItemType(
-                name=work_item_type["name"],
-                reference_name=work_item_type["referenceName"],
-                description=work_item_type["description"],
-                color=work_item_type["color"],
-                icon=Icon(
-                    id=work_item_type["icon"]["id"],
-                    url=work_item_type["icon"]["url"],
-                ),
-                is_disabled=work_item_type["isDisabled"],
-                xml_form=work_item_type["xmlForm"],
-                fields=[
-                    Field(
-                        always_required=field["alwaysRequired"],
-                        reference_name=field["referenceName"],
-                        name=field["name"],
-                        url=field["url"],
-                        default_value=field.get("defaultValue", None),
-                        help_text=field.get("helpText", None),
+    async def get_work_item_revisions(
+        self,
+        organization: str,
+        project: str,
+        ids: list[int],
+        max_concurrency: int = 1,
+    ) -> dict[int, int]:
+        """Get the current revision of each work item by id.
+
+        Only System.Rev is requested, so this is far cheaper than getting
+        the work items. Work items in chunks that fail are left out.
+        """
+        revisions: dict[int, int] = {}
+        for data in await self._gather_chunks(
+            _chunk_ids(ids),
+            max_concurrency,
+            lambda chunk: self._get_work_items_data(
+                organization,
+                project,
+                chunk,
+                fields=("System.Rev",),
+                decode=_json_items,
+            ),
+            suppress_errors=True,
+        ):
+            revisions.update((item["id"], item["rev"]) for item in data or [])
+        return revisions
+
+    async def get_stored_work_items(
+        self,
+        organization: str,
+        project: str,
+        store: WorkItemStore,
+        ids: list[int] | None = None,
+        max_concurrency: int = 1,
+    ) -> list[WorkItem] | None:
+        """Get Azure DevOps work items through a persistent store.
+
+        Only work items missing from the store, or changed since the
+        store's watermark, are fetched in full. The changed ids come from
+        one WIQL query, so a warm start costs a few requests whatever the
+        store size. Changed work items outside ids are deleted from the
+        store, so they are fetched when next requested. Without a
+        watermark, stored revisions are compared instead, and a watermark
+        is only set once every stored work item was compared. Without ids,
+        every work item in the project is listed with WIQL and work items
+        no longer listed are deleted from the store. The watermark only
+        moves once every stale work item was fetched.
+        """
+        stored = await asyncio.to_thread(store.revisions, organization, project)
+        watermark = await asyncio.to_thread(store.watermark, organization, project)
+
+        if ids is None or watermark is None:
+            if (
+                listing := await self.get_work_item_ids_from_wiql(organization, project)
+            ) is None:
+                return None
+            as_of = listing.as_of
+            if ids is None:
+                ids = [work_item.id for work_item in listing.work_items]
+                listed = set(ids)
+                if removed := [id for id in stored if id not in listed]:
+                    await asyncio.to_thread(
+                        store.delete, organization, project, removed
                     )
-                    for field in work_item_type["fields"]
-                ],
-                field_instances=[
-                    Field(
-                        always_required=field_instance["alwaysRequired"],
-                        reference_name=field_instance["referenceName"],
-                        name=field_instance["name"],
-                        url=field_instance["url"],
-                        default_value=field_instance.get("defaultValue", None),
-                        help_text=field_instance.get("helpText", None),
+
+        if watermark is not None:
+            if (
+                changed := await self.get_work_item_ids_from_wiql(
+                    organization, project, changed_since=watermark
+                )
+            ) is None:
+                return None
+            as_of = changed.as_of
+            changed_ids = {work_item.id for work_item in changed.work_items}
+            stale = [id for id in ids if id not in stored or id in changed_ids]
+            # The watermark covers the project, so drop changed work items
+            # outside ids from the store to fetch them when next requested
+            requested = set(ids)
+            if outdated := [
+                id for id in changed_ids if id in stored and id not in requested
+            ]:
+                await asyncio.to_thread(store.delete, organization, project, outdated)
+        else:
+            revisions = await self.get_work_item_revisions(
+                organization,
+                project,
+                [id for id in ids if id in stored],
+                max_concurrency,
+            )
+            stale = [
+                id
+                for id in ids
+                if id not in stored or revisions.get(id, stored[id]) != stored[id]
+            ]
+
+        # Without a watermark only the revisions of ids were compared
+        complete = watermark is not None or stored.keys() <= set(ids)
+        for data in await self._gather_chunks(
+            _chunk_ids(stale),
+            max_concurrency,
+            lambda chunk: self._get_work_items_data(
+                organization,
+                project,
+                chunk,
+                decode=_json_items,
+            ),
+            suppress_errors=True,
+        ):
+            if data is None:
+                complete = False
+            elif data:
+                await asyncio.to_thread(store.save, organization, project, data)
+        # Both queries ran before fetching, so later changes are queried again
+        if complete:
+            await asyncio.to_thread(
+                store.set_watermark,
+                organization,
+                project,
+                as_of,
+            )
+
+        work_items = await asyncio.to_thread(store.load, organization, project, ids)
+        identities = self._identities()
+        return [
+            work_item_from_json(work_items[id], identities)
+            for id in ids
+            if id in work_items
+        ]
+
+    async def iter_work_items(
+        self,
+        organization: str,
+        project: str,
+        ids: list[int],
+        prefetch: bool = False,
+        *,
+        fields: Sequence[str] | None = WORK_ITEM_FIELDS,
+        use_batch: bool = False,
+        lazy: bool = False,
+    ) -> AsyncGenerator[WorkItem, None]:
+        """Iterate Azure DevOps work items chunk by chunk.
+
+        The next chunk is only requested once the current one has been
+        consumed, or while it is being consumed with prefetch, so at most
+        two chunks are held in memory. Chunks that fail are skipped, use
+        get_work_item_batch to report them.
+        """
+        chunks = _chunk_ids(ids)
+        next_chunk: asyncio.Task[list[WorkItem] | None] | None = None
+        try:
+            for index, chunk in enumerate(chunks):
+                if next_chunk is not None:
+                    work_items = await next_chunk
+                    next_chunk = None
+                else:
+                    work_items = await self._get_work_items(
+                        organization,
+                        project,
+                        chunk,
+                        fields=fields,
+                        use_batch=use_batch,
+                        lazy=lazy,
                     )
-                    for field_instance in work_item_type["fieldInstances"]
-                ],
-                transitions={
-                    key: [
-                        Transition(
-                            to=transition["to"],
-                            actions=transition.get("actions", None),
+                if prefetch and index + 1 < len(chunks):
+                    next_chunk = asyncio.create_task(
+                        self._get_work_items(
+                            organization,
+                            project,
+                            chunks[index + 1],
+                            fields=fields,
+                            use_batch=use_batch,
+                            lazy=lazy,
                         )
-                        for transition in transitions
-                    ]
-                    for key, transitions in work_item_type["transitions"].items()
-                },
-                states=[
-                    State(
-                        name=state["name"],
-                        color=state["color"],
-                        category=Category(state["category"]),
                     )
-                    for state in work_item_type["states"]
-                ],
-                url=work_item_type["url"],
-            )
-            for work_item_type in data["value"]
-        ]
+
+                for work_item in work_items or []:
+                    yield work_item
+        finally:
+            if next_chunk is not None:
+                next_chunk.cancel()
+
+    async def get_work_item_types(
+        self,
+        organization: str,
+        project: str,
+    ) -> list[WorkItemType] | None:
+        """Get Azure DevOps work item types."""
+        return await self._get_decoded(
+            f"{self._project_url(organization, project)}/_apis/wit/workitemtypes?api-version={DEFAULT_API_VERSION}",
+            lambda data: [
+                work_item_type_from_json(work_item_type)
+                for work_item_type in data["value"]
+            ],
+            cache=True,
+        )
@@ -0,0 +1,63 @@
+"""Single-flight coalescing of identical in-flight requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import copy
+from enum import StrEnum
+from typing import Any
+
+
+class CoalescePolicy(StrEnum):
+    """How a coalesced result is handed to waiting callers."""
+
+    SHARE = "share"
+    COPY = "copy"
+
+
+class RequestCoalescer:
+    """Share one in-flight request between callers asking for the same key.
+
+    The first caller starts the request, later callers await its result.
+    With CoalescePolicy.COPY each later caller receives a deep copy, so
+    results can be mutated safely. Only share a coalescer between clients
+    using the same credentials.
+    """
+
+    def __init__(
+        self,
+        policy: CoalescePolicy = CoalescePolicy.SHARE,
+    ) -> None:
+        """Initialize."""
+        self._policy: CoalescePolicy = policy
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+
+    @property
+    def policy(self) -> CoalescePolicy:
+        """Get the coalesce policy."""
+        return self._policy
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of requests in flight."""
+        return len(self._in_flight)
+
+    async def run[T](
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run factory for key, or await the request already in flight."""
+        if (task := self._in_flight.get(key)) is not None:
+            result = await asyncio.shield(task)
+            if self._policy == CoalescePolicy.COPY:
+                return copy.deepcopy(result)
+            return result
+
+        async def _run() -> T:
+            return await factory()
+
+        task = asyncio.create_task(_run())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Cancelling one caller must not cancel the request for the others
+        return await asyncio.shield(task)
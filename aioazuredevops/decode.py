@@ -0,0 +1,633 @@
+"""Decoders compiled from declarative JSON to model mappings."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, fields as dataclass_fields, is_dataclass
+from datetime import datetime
+from functools import lru_cache
+from importlib import import_module
+import linecache
+import sys
+from typing import Any, Final, Protocol
+
+from .models.build import Build, BuildDefinition, BuildLinks
+from .models.core import (
+    Capabilities,
+    DefaultTeam,
+    LinkCollection,
+    Links,
+    ProcessTemplate,
+    Project,
+    VersionControl,
+)
+from .models.iteration import Iteration, IterationAttributes
+from .models.iteration_work_item import (
+    IterationWorkItemsResult,
+    WorkItemRelation,
+    WorkItemRelationTarget,
+)
+from .models.wiql import WIQLColumn, WIQLResult, WIQLWorkItem
+from .models.work_item import (
+    WorkItem,
+    WorkItemAvatar,
+    WorkItemFields,
+    WorkItemLinks,
+    WorkItemUser,
+)
+from .models.work_item_type import (
+    Category,
+    Field,
+    Icon,
+    State,
+    Transition,
+    WorkItemType,
+)
+
+type Decoder[T] = Callable[[Any], T]
+
+
+IDENTITY_MAP_SIZE: Final[int] = 4096
+
+
+class IdentityMap(OrderedDict[tuple[Any, Any], Any]):
+    """Decoded objects shared by the decoder and id they were decoded with.
+
+    Decoders compiled with an identity key return the object already in
+    the map for an id when it equals the newly decoded one. When a
+    response carries different data for an id, such as a renamed user,
+    the new object replaces the entry; objects decoded earlier keep the
+    old values. The least recently shared entries are dropped beyond
+    maxsize, or never with None.
+    """
+
+    def __init__(self, maxsize: int | None = IDENTITY_MAP_SIZE) -> None:
+        """Initialize."""
+        super().__init__()
+        self._maxsize: int | None = maxsize
+
+    @property
+    def maxsize(self) -> int | None:
+        """Get the maximum number of entries."""
+        return self._maxsize
+
+    def share[T](self, key: tuple[Any, Any], value: T) -> T:
+        """Get the entry for key if it equals value, else store value."""
+        if (shared := self.get(key)) is not None and shared == value:
+            self.move_to_end(key)
+            return shared
+        self[key] = value
+        self.move_to_end(key)
+        if self._maxsize is not None and len(self) > self._maxsize:
+            self.popitem(last=False)
+        return value
+
+
+class ModelDecoder[T](Protocol):
+    """Compiled decoder for a model."""
+
+    def __call__(self, data: Any, identities: IdentityMap | None = None) -> T:
+        """Create the model from its JSON representation."""
+
+
+DATETIME_CACHE_SIZE: Final[int] = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class JSONField:
+    """Where a model field is read from in JSON, and how it is converted.
+
+    path is a key, or a tuple of keys into nested objects. An optional
+    field is None when any key on its path is missing, and convert is
+    only called for values that are not None.
+    """
+
+    path: str | tuple[str, ...]
+    convert: Decoder[Any] | None = None
+    optional: bool = False
+
+
+# Attributes recording what compiled, list_of and dict_of decoders decode
+MODEL_ATTRIBUTE: Final[str] = "__decode_model__"
+ITEMS_ATTRIBUTE: Final[str] = "__decode_items__"
+
+
+class _Compiler:
+    """Build the source of a single expression decoding a model."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.namespace: dict[str, Any] = {}
+        self._count = 0
+
+    def variable(self, prefix: str, value: Any = None) -> str:
+        """Get a new name, bound to value in the namespace if given."""
+        self._count += 1
+        name = f"_{prefix}{self._count}"
+        if value is not None:
+            self.namespace[name] = value
+        return name
+
+    def lookup(self, data: str, path: tuple[str, ...], optional: bool) -> str:
+        """Get an expression reading path from the object named data."""
+        key = path[-1]
+        if len(path) == 1:
+            return f"{data}.get({key!r})" if optional else f"{data}[{key!r}]"
+        parent = self.lookup(data, path[:-1], optional)
+        if not optional:
+            return f"{parent}[{key!r}]"
+        variable = self.variable("p")
+        return f"({variable}.get({key!r}) if ({variable} := {parent}) is not None else None)"
+
+    def convert(self, value: str, convert: Decoder[Any]) -> str:
+        """Get an expression converting value.
+
+        Compiled decoders and collections of them are inlined, so nested
+        objects do not cost a function call each. Inlined conversions
+        leave None as is, other converters are only called on values
+        that are not None when value may be None.
+        """
+        if (spec := getattr(convert, MODEL_ATTRIBUTE, None)) is not None:
+            if value.isidentifier():
+                # Collection items are bound to a name and never None
+                return self.shared(value, *spec)
+            data = self.variable("d")
+            return f"({self.shared(data, *spec)} if ({data} := {value}) is not None else None)"
+        if (collection := getattr(convert, ITEMS_ATTRIBUTE, None)) is not None:
+            kind, decode = collection
+            items = self.variable("l")
+            item = self.variable("i")
+            if kind is list:
+                comprehension = f"[{self.convert(item, decode)} for {item} in {items}]"
+            else:
+                key = self.variable("k")
+                comprehension = (
+                    f"{{{key}: {self.convert(item, decode)} "
+                    f"for {key}, {item} in {items}.items()}}"
+                )
+            # The iterable of a comprehension cannot bind names, so bind first
+            return f"({comprehension} if ({items} := {value}) is not None else None)"
+        return f"{self.variable('c', convert)}({value})"
+
+    def model(
+        self,
+        data: str,
+        model: Callable[..., Any],
+        fields: dict[str, JSONField],
+    ) -> str:
+        """Get an expression creating model from the object named data."""
+        values: dict[str, str] = {}
+        for name, field in fields.items():
+            path = (field.path,) if isinstance(field.path, str) else field.path
+            value = self.lookup(data, path, field.optional)
+            if field.convert is None:
+                pass
+            elif not field.optional or _inlined(field.convert):
+                value = self.convert(value, field.convert)
+            else:
+                variable = self.variable("v")
+                value = (
+                    f"({self.convert(variable, field.convert)} "
+                    f"if ({variable} := {value}) is not None else None)"
+                )
+            values[name] = value
+
+        # Positional arguments are cheaper, pass dataclass fields in order
+        # until one is left to its default
+        arguments: list[str] = []
+        if is_dataclass(model):
+            for model_field in dataclass_fields(model):
+                if not model_field.init or model_field.name not in values:
+                    break
+                arguments.append(values.pop(model_field.name))
+        arguments.extend(f"{name}={value}" for name, value in values.items())
+        return f"{self.variable('m', model)}({', '.join(arguments)})"
+
+    def shared(
+        self,
+        data: str,
+        model: Callable[..., Any],
+        fields: dict[str, JSONField],
+        identity: str | None,
+        token: object,
+    ) -> str:
+        """Get an expression creating model, or sharing it by identity.
+
+        token tells objects of different decoders with the same id apart.
+        """
+        create = self.model(data, model, fields)
+        if identity is None:
+            return create
+        token_name = self.variable("t", token)
+        key = self.variable("k")
+        return (
+            f"({create} if identities is None "
+            f"or ({key} := ({token_name}, {data}.get({identity!r})))[1] is None "
+            f"else identities.share({key}, {create}))"
+        )
+
+
+def _inlined(convert: Decoder[Any]) -> bool:
+    """Get if a converter is inlined by the compiler."""
+    return hasattr(convert, MODEL_ATTRIBUTE) or hasattr(convert, ITEMS_ATTRIBUTE)
+
+
+def compile_decoder[T](
+    model: Callable[..., T],
+    fields: Mapping[str, str | JSONField],
+    *,
+    identity: str | None = None,
+) -> ModelDecoder[T]:
+    """Compile a function decoding JSON into model.
+
+    fields maps each model field to a JSONField, or a key for a required
+    field read as is. The generated function is a single expression,
+    with nested compiled decoders, list_of and dict_of inlined into it.
+    With an identity key, equal objects with the same value for that key
+    share one instance through the IdentityMap passed to the decoder, so
+    only use it for frozen models.
+    """
+    spec = {
+        name: JSONField(field) if isinstance(field, str) else field
+        for name, field in fields.items()
+    }
+    compiler = _Compiler()
+    function_name = f"decode_{getattr(model, '__name__', 'model').lower()}"
+    token = object()
+    source = (
+        f"def {function_name}(data, identities=None):\n"
+        f"    return {compiler.shared('data', model, spec, identity, token)}\n"
+    )
+    # Register the source so tracebacks show the generated code
+    filename = f"<{function_name}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, "exec"), compiler.namespace)  # noqa: S102
+    decode: ModelDecoder[T] = compiler.namespace[function_name]
+    decode.__doc__ = f"Create a {function_name[7:]} from its JSON representation."
+    setattr(decode, MODEL_ATTRIBUTE, (model, spec, identity, token))
+    return decode
+
+
+def list_of[T](decode: Decoder[T]) -> Decoder[list[T]]:
+    """Get a decoder for a JSON list of items decoded with decode."""
+
+    def _decode(items: list[Any]) -> list[T]:
+        return list(map(decode, items))
+
+    setattr(_decode, ITEMS_ATTRIBUTE, (list, decode))
+    return _decode
+
+
+def dict_of[T](decode: Decoder[T]) -> Decoder[dict[str, T]]:
+    """Get a decoder for a JSON object of values decoded with decode."""
+
+    def _decode(items: dict[str, Any]) -> dict[str, T]:
+        return {key: decode(value) for key, value in items.items()}
+
+    setattr(_decode, ITEMS_ATTRIBUTE, (dict, decode))
+    return _decode
+
+
+def _load_parse_iso8601() -> Callable[[str], datetime]:
+    """Get ciso8601 when installed, else the standard library parser."""
+    try:
+        return import_module("ciso8601").parse_datetime
+    except ImportError:
+        # Handles Z and any fraction length since Python 3.11
+        return datetime.fromisoformat
+
+
+_parse_iso8601: Final = _load_parse_iso8601()
+
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def parse_datetime(value: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp, or get None if it is not one.
+
+    Results are memoized, work items in a response share most of their
+    timestamps.
+    """
+    try:
+        return _parse_iso8601(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _href(key: str) -> JSONField:
+    """Read the href of an optional link."""
+    return JSONField((key, "href"), optional=True)
+
+
+link_collection_from_json: Final = compile_decoder(LinkCollection, {"href": "href"})
+
+project_from_json: Final = compile_decoder(
+    Project,
+    {
+        "id": "id",
+        "name": "name",
+        "description": JSONField("description", optional=True),
+        "url": "url",
+        "state": "state",
+        "capabilities": JSONField(
+            "capabilities",
+            compile_decoder(
+                Capabilities,
+                {
+                    "process_template": JSONField(
+                        "processTemplate",
+                        compile_decoder(
+                            ProcessTemplate,
+                            {
+                                "template_name": "templateName",
+                                "template_type_id": "templateTypeId",
+                            },
+                        ),
+                    ),
+                    "versioncontrol": JSONField(
+                        "versioncontrol",
+                        compile_decoder(
+                            VersionControl,
+                            {
+                                "source_control_type": "sourceControlType",
+                                "git_enabled": "gitEnabled",
+                                "tfvc_enabled": "tfvcEnabled",
+                            },
+                        ),
+                    ),
+                },
+            ),
+        ),
+        "revision": "revision",
+        "links": JSONField(
+            "_links",
+            compile_decoder(
+                Links,
+                {
+                    "links_self": JSONField("self", link_collection_from_json),
+                    "collection": JSONField("collection", link_collection_from_json),
+                    "web": JSONField("web", link_collection_from_json),
+                },
+            ),
+        ),
+        "visibility": "visibility",
+        "default_team": JSONField(
+            "defaultTeam",
+            compile_decoder(DefaultTeam, {"id": "id", "name": "name", "url": "url"}),
+        ),
+        "last_update_time": JSONField("lastUpdateTime", parse_datetime, optional=True),
+    },
+)
+
+# Builds embed a project reference, without capabilities or links
+project_reference_from_json: Final = compile_decoder(
+    Project,
+    {
+        "id": "id",
+        "name": "name",
+        "description": JSONField("description", optional=True),
+        "url": JSONField("url", optional=True),
+        "state": JSONField("state", optional=True),
+        "revision": JSONField("revision", optional=True),
+        "visibility": JSONField("visibility", optional=True),
+        "last_update_time": JSONField("lastUpdateTime", parse_datetime, optional=True),
+    },
+    identity="id",
+)
+
+build_from_json: Final = compile_decoder(
+    Build,
+    {
+        "build_id": "id",
+        "build_number": JSONField("buildNumber", optional=True),
+        "status": JSONField("status", sys.intern, optional=True),
+        "result": JSONField("result", sys.intern, optional=True),
+        "source_branch": JSONField("sourceBranch", sys.intern, optional=True),
+        "source_version": JSONField("sourceVersion", optional=True),
+        "priority": JSONField("priority", optional=True),
+        "reason": JSONField("reason", sys.intern, optional=True),
+        "queue_time": JSONField("queueTime", optional=True),
+        "start_time": JSONField("startTime", optional=True),
+        "finish_time": JSONField("finishTime", optional=True),
+        "definition": JSONField(
+            "definition",
+            compile_decoder(
+                BuildDefinition,
+                {
+                    "build_id": "id",
+                    "name": "name",
+                    "url": JSONField("url", optional=True),
+                    "path": JSONField("path", optional=True),
+                    "build_type": JSONField("type", optional=True),
+                    "queue_status": JSONField("queueStatus", optional=True),
+                    "revision": JSONField("revision", optional=True),
+                },
+                identity="id",
+            ),
+            optional=True,
+        ),
+        "project": JSONField("project", project_reference_from_json, optional=True),
+        "links": JSONField(
+            "_links",
+            compile_decoder(
+                BuildLinks,
+                {
+                    "l_self": _href("self"),
+                    "web": _href("web"),
+                    "source_version_display_uri": _href("sourceVersionDisplayUri"),
+                    "timeline": _href("timeline"),
+                    "badge": _href("badge"),
+                },
+            ),
+            optional=True,
+        ),
+    },
+)
+
+iteration_from_json: Final = compile_decoder(
+    Iteration,
+    {
+        "id": "id",
+        "name": "name",
+        "path": "path",
+        "attributes": JSONField(
+            "attributes",
+            compile_decoder(
+                IterationAttributes,
+                {
+                    "start_date": JSONField("startDate", parse_datetime),
+                    "finish_date": JSONField("finishDate", parse_datetime),
+                    "time_frame": "timeFrame",
+                },
+            ),
+        ),
+        "url": "url",
+    },
+)
+
+iteration_work_items_from_json: Final = compile_decoder(
+    IterationWorkItemsResult,
+    {
+        "work_item_relations": JSONField(
+            "workItemRelations",
+            list_of(
+                compile_decoder(
+                    WorkItemRelation,
+                    {
+                        "rel": JSONField("rel", optional=True),
+                        "source": JSONField("source", optional=True),
+                        "target": JSONField(
+                            "target",
+                            compile_decoder(
+                                WorkItemRelationTarget, {"id": "id", "url": "url"}
+                            ),
+                        ),
+                    },
+                )
+            ),
+        ),
+        "url": "url",
+    },
+)
+
+wiql_result_from_json: Final = compile_decoder(
+    WIQLResult,
+    {
+        "query_type": "queryType",
+        "query_result_type": "queryResultType",
+        "as_of": JSONField("asOf", parse_datetime),
+        "columns": JSONField(
+            "columns",
+            list_of(
+                compile_decoder(
+                    WIQLColumn,
+                    {"reference_name": "referenceName", "name": "name", "url": "url"},
+                )
+            ),
+        ),
+        "work_items": JSONField(
+            "workItems",
+            list_of(compile_decoder(WIQLWorkItem, {"id": "id", "url": "url"})),
+        ),
+    },
+)
+
+work_item_user_from_json: Final = compile_decoder(
+    WorkItemUser,
+    {
+        "display_name": JSONField("displayName", sys.intern, optional=True),
+        "url": JSONField("url", optional=True),
+        "id": JSONField("id", optional=True),
+        "unique_name": JSONField("uniqueName", optional=True),
+        "image_url": JSONField("imageUrl", optional=True),
+        "descriptor": JSONField("descriptor", optional=True),
+        "links": JSONField(
+            "_links",
+            compile_decoder(
+                WorkItemLinks,
+                {
+                    "avatar": JSONField(
+                        "avatar", compile_decoder(WorkItemAvatar, {"href": "href"})
+                    )
+                },
+            ),
+            optional=True,
+        ),
+    },
+    identity="id",
+)
+
+# Keyed by WorkItemFields attribute, read from the work item fields object.
+# Responses leave out fields that were not requested or have no value, so
+# every field is optional and decodes to None when missing, as when lazy
+WORK_ITEM_FIELDS_SPEC: Final[dict[str, JSONField]] = {
+    "area_path": JSONField("System.AreaPath", sys.intern, optional=True),
+    "team_project": JSONField("System.TeamProject", sys.intern, optional=True),
+    "iteration_path": JSONField("System.IterationPath", sys.intern, optional=True),
+    "work_item_type": JSONField("System.WorkItemType", sys.intern, optional=True),
+    "state": JSONField("System.State", sys.intern, optional=True),
+    "reason": JSONField("System.Reason", sys.intern, optional=True),
+    "assigned_to": JSONField(
+        "System.AssignedTo", work_item_user_from_json, optional=True
+    ),
+    "created_date": JSONField("System.CreatedDate", parse_datetime, optional=True),
+    "created_by": JSONField(
+        "System.CreatedBy", work_item_user_from_json, optional=True
+    ),
+    "changed_date": JSONField("System.ChangedDate", parse_datetime, optional=True),
+    "changed_by": JSONField(
+        "System.ChangedBy", work_item_user_from_json, optional=True
+    ),
+    "comment_count": JSONField("System.CommentCount", optional=True),
+    "title": JSONField("System.Title", optional=True),
+    "microsoft_vsts_common_state_change_date": JSONField(
+        "Microsoft.VSTS.Common.StateChangeDate", parse_datetime, optional=True
+    ),
+    "microsoft_vsts_common_priority": JSONField(
+        "Microsoft.VSTS.Common.Priority", optional=True
+    ),
+}
+
+work_item_fields_from_json: Final = compile_decoder(
+    WorkItemFields, WORK_ITEM_FIELDS_SPEC
+)
+
+work_item_from_json: Final = compile_decoder(
+    WorkItem,
+    {
+        "id": "id",
+        "rev": "rev",
+        "fields": JSONField("fields", work_item_fields_from_json),
+        "url": "url",
+    },
+)
+
+field_from_json: Final = compile_decoder(
+    Field,
+    {
+        "always_required": "alwaysRequired",
+        "reference_name": "referenceName",
+        "name": "name",
+        "url": "url",
+        "default_value": JSONField("defaultValue", optional=True),
+        "help_text": JSONField("helpText", optional=True),
+    },
+)
+
+work_item_type_from_json: Final = compile_decoder(
+    WorkItemType,
+    {
+        "name": "name",
+        "reference_name": "referenceName",
+        "description": "description",
+        "color": "color",
+        "icon": JSONField("icon", compile_decoder(Icon, {"id": "id", "url": "url"})),
+        "is_disabled": "isDisabled",
+        "xml_form": "xmlForm",
+        "fields": JSONField("fields", list_of(field_from_json)),
+        "field_instances": JSONField("fieldInstances", list_of(field_from_json)),
+        "transitions": JSONField(
+            "transitions",
+            dict_of(
+                list_of(
+                    compile_decoder(
+                        Transition,
+                        {"to": "to", "actions": JSONField("actions", optional=True)},
+                    )
+                )
+            ),
+        ),
+        "states": JSONField(
+            "states",
+            list_of(
+                compile_decoder(
+                    State,
+                    {
+                        "name": "name",
+                        "color": "color",
+                        "category": JSONField("category", Category),
+                    },
+                )
+            ),
+        ),
+        "url": "url",
+    },
+)
@@ -1,99 +1,311 @@
 """Helper functions for Azure DevOps."""
 
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Final
 
 from .models.iteration import Iteration, IterationTimeFrame
 from .models.work_item import WorkItem
 from .models.work_item_type import Category, State, WorkItemType
 
+ITERATION_DAY: Final[timedelta] = timedelta(days=1)
+
+
+class IterationTimeline:
+    """Iterations ordered by start date.
+
+    Azure DevOps finish dates are the last day of an iteration, so an
+    iteration runs until the day after its finish date. Iterations
+    without dates follow the dated ones in the order given, and are never
+    running at a date.
+    """
+
+    def __init__(self, iterations: Iterable[Iteration]) -> None:
+        """Initialize."""
+        dated: list[Iteration] = []
+        undated: list[Iteration] = []
+        for iteration in iterations:
+            if (
+                iteration.attributes.start_date is None
+                or iteration.attributes.finish_date is None
+            ):
+                undated.append(iteration)
+            else:
+                dated.append(iteration)
+        dated.sort(key=lambda iteration: iteration.attributes.start_date)
+        self._iterations: list[Iteration] = dated + undated
+        # Only dated iterations are searched by date, they come first
+        self._start_dates: list[datetime] = [
+            iteration.attributes.start_date for iteration in dated
+        ]
+        self._current: int | None = next(
+            (
+                index
+                for index, iteration in enumerate(self._iterations)
+                if iteration.attributes.time_frame == IterationTimeFrame.CURRENT
+            ),
+            None,
+        )
+
+    @property
+    def iterations(self) -> list[Iteration]:
+        """Get the iterations ordered by start date, undated ones last."""
+        return self._iterations
+
+    @property
+    def current(self) -> Iteration | None:
+        """Get the current iteration."""
+        if self._current is None:
+            return None
+        return self._iterations[self._current]
+
+    @property
+    def previous(self) -> Iteration | None:
+        """Get the iteration before the current iteration."""
+        if self._current is None or self._current == 0:
+            return None
+        return self._iterations[self._current - 1]
+
+    @property
+    def next(self) -> Iteration | None:
+        """Get the iteration after the current iteration."""
+        if self._current is None or self._current + 1 == len(self._iterations):
+            return None
+        return self._iterations[self._current + 1]
+
+    @property
+    def expires(self) -> datetime | None:
+        """Get when the current iteration ends, and the timeline with it."""
+        if (current := self.current) is None or (
+            finish_date := current.attributes.finish_date
+        ) is None:
+            return None
+        return finish_date + ITERATION_DAY
+
+    def at(self, date: datetime) -> Iteration | None:
+        """Get the iteration running at a date."""
+        if (index := bisect_right(self._start_dates, date) - 1) < 0:
+            return None
+        iteration = self._iterations[index]
+        if date >= iteration.attributes.finish_date + ITERATION_DAY:
+            return None
+        return iteration
+
+    def __iter__(self) -> Iterator[Iteration]:
+        """Iterate the iterations ordered by start date."""
+        return iter(self._iterations)
+
+    def __len__(self) -> int:
+        """Get the number of iterations."""
+        return len(self._iterations)
+
 
 def current_iteration(iterations: list[Iteration]) -> Iteration | None:
     """Get current iteration."""
-    for iteration in iterations:
-        if iteration.attributes.time_frame == IterationTimeFrame.CURRENT:
-            return iteration
-    return None
+    return IterationTimeline(iterations).current
 
 
 def previous_iteration(iterations: list[Iteration]) -> Iteration | None:
     """Get previous iteration."""
-    for key, iteration in enumerate(iterations):
-        if iteration.attributes.time_frame == IterationTimeFrame.CURRENT:
-            return iterations[key - 1]
-    return None
+    return IterationTimeline(iterations).previous
 
 
 def next_iteration(iterations: list[Iteration]) -> Iteration | None:
     """Get next iteration."""
-    for key, iteration in enumerate(iterations):
-        if iteration.attributes.time_frame == IterationTimeFrame.CURRENT:
-            return iterations[key + 1]
-    return None
+    return IterationTimeline(iterations).next
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkItemState(State):
     """Work item by type and state."""
 
     work_items: list[WorkItem]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkItemTypeAndState(WorkItemType):
     """Work item by type and state."""
 
     state_items: list[WorkItemState]
 
 
+def _state_included(
+    category: Category,
+    categories: list[Category] | None,
+    ignored_categories: list[Category] | None,
+) -> bool:
+    """Get if a state category passes the category filters."""
+    if categories is not None and category in categories:
+        return True
+    return ignored_categories is not None and category not in ignored_categories
+
+
+class WorkItemTypeIndex:
+    """States of work item types, indexed by type and category.
+
+    update only rebuilds the index when the work item types differ from
+    the ones it was built from. Responses revalidated through the client
+    cache are the same object, and are checked by identity alone.
+    """
+
+    def __init__(self, work_item_types: list[WorkItemType] | None = None) -> None:
+        """Initialize."""
+        self._work_item_types: list[WorkItemType] | None = None
+        self._fingerprint: tuple[tuple[str, tuple[State, ...]], ...] = ()
+        self._type_states: dict[str, tuple[State, ...]] = {}
+        self._type_categories: dict[str, dict[str, Category]] = {}
+        self._categories: dict[str, Category] = {}
+        self._category_states: dict[Category, list[str]] = {}
+        # Distinct state names and categories, in the order first seen
+        self._states: list[tuple[str, Category]] = []
+        self._filters: dict[
+            tuple[frozenset[Category] | None, frozenset[Category] | None], list[str]
+        ] = {}
+        if work_item_types is not None:
+            self.update(work_item_types)
+
+    def update(self, work_item_types: list[WorkItemType]) -> bool:
+        """Index work item types, returning whether the index changed."""
+        if work_item_types is self._work_item_types:
+            return False
+        fingerprint = tuple(
+            (work_item_type.name, tuple(work_item_type.states))
+            for work_item_type in work_item_types
+        )
+        self._work_item_types = work_item_types
+        if fingerprint == self._fingerprint:
+            return False
+
+        self._fingerprint = fingerprint
+        self._type_states = dict(fingerprint)
+        self._type_categories = {
+            name: {state.name: state.category for state in states}
+            for name, states in fingerprint
+        }
+        states = dict.fromkeys(
+            (state.name, state.category)
+            for _, type_states in fingerprint
+            for state in type_states
+        )
+        self._states = list(states)
+        self._categories = {}
+        self._category_states = {}
+        for name, category in self._states:
+            self._categories.setdefault(name, category)
+            self._category_states.setdefault(category, []).append(name)
+        self._filters = {}
+        return True
+
+    def states(
+        self,
+        categories: list[Category] | None = None,
+        ignored_categories: list[Category] | None = None,
+    ) -> list[str]:
+        """Get the distinct state names passing the category filters."""
+        if categories is None and ignored_categories is None:
+            return []
+        key = (
+            None if categories is None else frozenset(categories),
+            None if ignored_categories is None else frozenset(ignored_categories),
+        )
+        if (states := self._filters.get(key)) is None:
+            states = self._filters[key] = list(
+                dict.fromkeys(
+                    name
+                    for name, category in self._states
+                    if _state_included(category, categories, ignored_categories)
+                )
+            )
+        return list(states)
+
+    def category_states(self, category: Category) -> list[str]:
+        """Get the distinct state names in a category."""
+        return list(self._category_states.get(category, ()))
+
+    def type_states(self, work_item_type: str) -> list[State]:
+        """Get the states of a work item type."""
+        return list(self._type_states.get(work_item_type, ()))
+
+    def category(
+        self,
+        state: str,
+        work_item_type: str | None = None,
+    ) -> Category | None:
+        """Get the category of a state.
+
+        Without a work item type, the category the state was first seen
+        with is returned.
+        """
+        if work_item_type is None:
+            return self._categories.get(state)
+        return self._type_categories.get(work_item_type, {}).get(state)
+
+
 def work_item_types_states_filter(
-    work_item_types: list[WorkItemType],
+    work_item_types: list[WorkItemType] | WorkItemTypeIndex,
     categories: list[Category] | None = None,
     ignored_categories: list[Category] | None = None,
 ) -> list[str]:
-    """Get states filter by category."""
-    if categories is None and ignored_categories is None:
-        return []
-
-    states = []
-    for work_item_type in work_item_types:
-        for state in work_item_type.states:
-            if categories is not None and state.category in categories:
-                states.append(state.name)
-            elif (
-                ignored_categories is not None
-                and state.category not in ignored_categories
-            ):
-                states.append(state.name)
-    return states
+    """Get states filter by category, without duplicate states."""
+    if not isinstance(work_item_types, WorkItemTypeIndex):
+        work_item_types = WorkItemTypeIndex(work_item_types)
+    return work_item_types.states(categories, ignored_categories)
 
 
-def work_items_by_type_and_state(
-    work_item_types: list[WorkItemType],
-    work_items: list[WorkItem],
-    categories: list[Category] | None = None,
-    ignored_categories: list[Category] | None = None,
-) -> list[WorkItemTypeAndState]:
-    """Get work items by type and state."""
-
-    result: list[WorkItemTypeAndState] = []
-    for work_item_type in work_item_types:
-        states: list[WorkItemState] = []
-        for state in work_item_type.states:
-            items = [item for item in work_items if item.fields.state == state.name]
-            state = WorkItemState(
-                name=state.name,
-                color=state.color,
-                category=state.category,
-                work_items=items,
-            )
-            if categories is not None and state.category in categories:
-                states.append(state)
-            elif (
-                ignored_categories is not None
-                and state.category not in ignored_categories
-            ):
-                states.append(state)
-        result.append(
+class WorkItemIndex:
+    """Work items bucketed by type and state.
+
+    Work items are indexed by id, so adding a changed work item moves it
+    to its new bucket instead of rescanning every work item.
+    """
+
+    def __init__(self, work_items: Iterable[WorkItem] = ()) -> None:
+        """Initialize."""
+        self._buckets: dict[tuple[str, str], dict[int, WorkItem]] = {}
+        self._keys: dict[int, tuple[str, str]] = {}
+        self.update(work_items)
+
+    def add(self, work_item: WorkItem) -> None:
+        """Add a work item, or replace the work item with its id."""
+        key = (work_item.fields.work_item_type, work_item.fields.state)
+        if (previous := self._keys.get(work_item.id)) is not None and previous != key:
+            self._discard(previous, work_item.id)
+        self._buckets.setdefault(key, {})[work_item.id] = work_item
+        self._keys[work_item.id] = key
+
+    def update(self, work_items: Iterable[WorkItem]) -> None:
+        """Add or replace work items."""
+        for work_item in work_items:
+            self.add(work_item)
+
+    def remove(self, work_item_id: int) -> None:
+        """Remove the work item with an id, if indexed."""
+        if (key := self._keys.pop(work_item_id, None)) is not None:
+            self._discard(key, work_item_id)
+
+    def _discard(self, key: tuple[str, str], work_item_id: int) -> None:
+        """Remove a work item from its bucket, dropping the bucket once empty."""
+        bucket = self._buckets[key]
+        del bucket[work_item_id]
+        if not bucket:
+            del self._buckets[key]
+
+    def get(self, work_item_type: str, state: str) -> list[WorkItem]:
+        """Get the work items of a type in a state."""
+        if (bucket := self._buckets.get((work_item_type, state))) is None:
+            return []
+        return list(bucket.values())
+
+    def by_type_and_state(
+        self,
+        work_item_types: list[WorkItemType],
+        categories: list[Category] | None = None,
+        ignored_categories: list[Category] | None = None,
+    ) -> list[WorkItemTypeAndState]:
+        """Get work items by type and state."""
+        return [
             WorkItemTypeAndState(
                 name=work_item_type.name,
                 reference_name=work_item_type.reference_name,
@@ -107,8 +319,44 @@ def work_items_by_type_and_state(
                 transitions=work_item_type.transitions,
                 states=work_item_type.states,
                 url=work_item_type.url,
-                state_items=states,
+                state_items=[
+                    WorkItemState(
+                        name=state.name,
+                        color=state.color,
+                        category=state.category,
+                        work_items=self.get(work_item_type.name, state.name),
+                    )
+                    for state in work_item_type.states
+                    if _state_included(state.category, categories, ignored_categories)
+                ],
             )
-        )
+            for work_item_type in work_item_types
+        ]
+
+    def __contains__(self, work_item_id: object) -> bool:
+        """Get if a work item id is indexed."""
+        return work_item_id in self._keys
+
+    def __len__(self) -> int:
+        """Get the number of work items."""
+        return len(self._keys)
+
+
+def work_items_by_type_and_state(
+    work_item_types: list[WorkItemType],
+    work_items: list[WorkItem] | WorkItemIndex,
+    categories: list[Category] | None = None,
+    ignored_categories: list[Category] | None = None,
+) -> list[WorkItemTypeAndState]:
+    """Get work items by type and state.
 
-    return result
+    Pass a WorkItemIndex kept up to date between calls to avoid indexing
+    the work items on every call.
+    """
+    if not isinstance(work_items, WorkItemIndex):
+        work_items = WorkItemIndex(work_items)
+    return work_items.by_type_and_state(
+        work_item_types,
+        categories,
+        ignored_categories,
+    )
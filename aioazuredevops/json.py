@@ -0,0 +1,43 @@
+"""JSON decoding backends.
+
+orjson or msgspec are used when installed, falling back to the standard
+library json module.
+"""
+
+from collections.abc import Callable
+from enum import StrEnum
+from importlib import import_module
+import json
+from typing import Any
+
+type JSONLoads = Callable[[bytes], Any]
+
+
+class JSONBackend(StrEnum):
+    """JSON decoding backend."""
+
+    ORJSON = "orjson"
+    MSGSPEC = "msgspec"
+    STDLIB = "json"
+
+
+def get_json_loads(backend: JSONBackend | None = None) -> JSONLoads:
+    """Get a JSON decoder for a backend, or the fastest one installed.
+
+    Raises ImportError if a requested backend is not installed.
+    """
+    if backend is None:
+        for candidate in JSONBackend:
+            try:
+                return get_json_loads(candidate)
+            except ImportError:
+                continue
+
+    if backend == JSONBackend.ORJSON:
+        return import_module("orjson").loads
+    if backend == JSONBackend.MSGSPEC:
+        return import_module("msgspec.json").decode
+    return json.loads
+
+
+json_loads: JSONLoads = get_json_loads()
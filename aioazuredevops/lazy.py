@@ -0,0 +1,61 @@
+"""Work item fields decoded on first access."""
+
+from dataclasses import fields
+from typing import Any
+
+from .decode import WORK_ITEM_FIELDS_SPEC
+from .models.work_item import WorkItemFields
+
+
+def _lazy_field(name: str) -> property:
+    """Create a property decoding a field into its slot on first access."""
+    spec = WORK_ITEM_FIELDS_SPEC[name]
+    reference_name, decode = spec.path, spec.convert
+    # The slot WorkItemFields stores the field in, shadowed by the property
+    slot = WorkItemFields.__dict__[name]
+
+    def _get(self: "LazyWorkItemFields") -> Any:
+        try:
+            return slot.__get__(self)
+        except AttributeError:
+            value = self._raw.get(reference_name)
+            if decode is not None and value is not None:
+                value = decode(value)
+            slot.__set__(self, value)
+            return value
+
+    def _set(self: "LazyWorkItemFields", value: Any) -> None:
+        slot.__set__(self, value)
+
+    return property(_get, _set, doc=f"Get {reference_name}.")
+
+
+class LazyWorkItemFields(WorkItemFields):
+    """Azure DevOps work item fields decoded on first access.
+
+    Keeps the raw fields mapping and decodes each field, including nested
+    users, the first time it is read. Fields missing from the mapping
+    read as None. Compares equal to WorkItemFields with the same values.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: dict[str, Any]) -> None:
+        """Initialize."""
+        self._raw: dict[str, Any] = raw
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the decoded fields."""
+        if not isinstance(other, WorkItemFields):
+            return NotImplemented
+        return all(
+            getattr(self, field.name) == getattr(other, field.name)
+            for field in fields(WorkItemFields)
+        )
+
+    # Mutable like WorkItemFields, so unhashable
+    __hash__ = None  # type: ignore[assignment]
+
+
+for _field in fields(WorkItemFields):
+    setattr(LazyWorkItemFields, _field.name, _lazy_field(_field.name))
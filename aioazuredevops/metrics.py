@@ -0,0 +1,381 @@
+"""Request metrics per Azure DevOps endpoint."""
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+import re
+import time
+from types import SimpleNamespace
+from typing import Final
+from weakref import WeakKeyDictionary
+
+import aiohttp
+
+# Upper bounds in seconds, values above the last bound are counted apart
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Upper bounds in bytes, from 1 KiB to 16 MiB
+SIZE_BUCKETS: Final[tuple[float, ...]] = tuple(
+    float(2**power) for power in range(10, 25, 2)
+)
+
+PROJECTS_ENDPOINT: Final[str] = "{organization}/_apis/projects"
+PROJECT_ENDPOINT: Final[str] = "{organization}/_apis/projects/{project}"
+BUILDS_ENDPOINT: Final[str] = "{organization}/{project}/_apis/build/builds"
+BUILD_ENDPOINT: Final[str] = "{organization}/{project}/_apis/build/builds/{buildId}"
+ITERATIONS_ENDPOINT: Final[str] = (
+    "{organization}/{project}/_apis/work/teamsettings/iterations"
+)
+ITERATION_ENDPOINT: Final[str] = (
+    "{organization}/{project}/_apis/work/teamsettings/iterations/{iterationId}"
+)
+ITERATION_WORK_ITEMS_ENDPOINT: Final[str] = (
+    "{organization}/{project}/_apis/work/teamsettings/iterations/{iterationId}/workitems"
+)
+WIQL_ENDPOINT: Final[str] = "{organization}/{project}/_apis/wit/wiql"
+WORK_ITEMS_ENDPOINT: Final[str] = "{organization}/{project}/_apis/wit/workitems"
+WORK_ITEM_ENDPOINT: Final[str] = "{organization}/{project}/_apis/wit/workitems/{id}"
+WORK_ITEMS_BATCH_ENDPOINT: Final[str] = (
+    "{organization}/{project}/_apis/wit/workitemsbatch"
+)
+WORK_ITEM_TYPES_ENDPOINT: Final[str] = (
+    "{organization}/{project}/_apis/wit/workitemtypes"
+)
+
+ENDPOINTS: Final[tuple[str, ...]] = (
+    PROJECTS_ENDPOINT,
+    PROJECT_ENDPOINT,
+    BUILDS_ENDPOINT,
+    BUILD_ENDPOINT,
+    ITERATIONS_ENDPOINT,
+    ITERATION_ENDPOINT,
+    ITERATION_WORK_ITEMS_ENDPOINT,
+    WIQL_ENDPOINT,
+    WORK_ITEMS_ENDPOINT,
+    WORK_ITEM_ENDPOINT,
+    WORK_ITEMS_BATCH_ENDPOINT,
+    WORK_ITEM_TYPES_ENDPOINT,
+)
+
+# Each template matches the end of a path, after any base URL path
+_ENDPOINT_PATTERNS: Final[tuple[tuple[re.Pattern[str], str], ...]] = tuple(
+    (
+        re.compile("/" + re.sub(r"\\\{\w+\\\}", "[^/]+", re.escape(endpoint)) + "$"),
+        endpoint,
+    )
+    for endpoint in ENDPOINTS
+)
+
+
+class Metric(StrEnum):
+    """Metric recorded for a request."""
+
+    DNS = "dns"
+    CONNECT = "connect"
+    TTFB = "ttfb"
+    TOTAL = "total"
+    RESPONSE_BYTES = "response_bytes"
+    DECODE = "decode"
+    BUILD = "build"
+    STATUS = "status"
+    ERROR = "error"
+
+
+type Exporter = Callable[[str, Metric, float], None]
+
+
+def endpoint_template(url: str) -> str:
+    """Get the endpoint template of a request URL.
+
+    URLs of unknown endpoints keep their path, with numeric segments
+    replaced by {id}.
+    """
+    path = url.split("?", 1)[0]
+    for pattern, endpoint in _ENDPOINT_PATTERNS:
+        if pattern.search(path) is not None:
+            return endpoint
+    return re.sub(r"/\d+(?=/|$)", "/{id}", path)
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSnapshot:
+    """Histogram values at a point in time."""
+
+    buckets: tuple[float, ...]
+    counts: tuple[int, ...]
+    count: int
+    total: float
+    max: float
+
+    @property
+    def mean(self) -> float:
+        """Get the mean value, or 0 without values."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, quantile: float) -> float:
+        """Get the upper bound of the bucket a quantile falls in.
+
+        Values above the last bucket bound are estimated with the maximum.
+        """
+        if not self.count:
+            return 0.0
+        rank = quantile * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts, strict=False):
+            seen += count
+            if seen >= rank and seen:
+                return min(bound, self.max)
+        return self.max
+
+
+class Histogram:
+    """Counts of values by bucket upper bound."""
+
+    __slots__ = ("_buckets", "_count", "_counts", "_max", "_total")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """Initialize."""
+        self._buckets: tuple[float, ...] = buckets
+        self._counts: list[int] = [0] * (len(buckets) + 1)
+        self._count: int = 0
+        self._total: float = 0.0
+        self._max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._total += value
+        self._max = max(self._max, value)
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Get the histogram values."""
+        return HistogramSnapshot(
+            buckets=self._buckets,
+            counts=tuple(self._counts),
+            count=self._count,
+            total=self._total,
+            max=self._max,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointSnapshot:
+    """Metrics of an endpoint at a point in time."""
+
+    requests: int
+    statuses: dict[int, int]
+    errors: int
+    histograms: dict[Metric, HistogramSnapshot]
+
+
+class _EndpointMetrics:
+    """Metrics of an endpoint."""
+
+    __slots__ = ("errors", "histograms", "statuses")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.statuses: Counter[int] = Counter()
+        self.errors: int = 0
+        self.histograms: dict[Metric, Histogram] = {}
+
+
+class DevOpsMetrics:
+    """Per endpoint request counters and histograms.
+
+    The client records status codes, total latency, response bytes, JSON
+    decode time and model build time. Total latency is recorded once the
+    body is read, or when an unread response is released, so it covers
+    error and throttled responses too. Add trace_config() to the client
+    session to also record DNS, connect and time to first byte; connect
+    includes DNS resolution. Exporters are called with each value as it
+    is recorded.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        size_buckets: tuple[float, ...] = SIZE_BUCKETS,
+    ) -> None:
+        """Initialize."""
+        self._latency_buckets: tuple[float, ...] = latency_buckets
+        self._size_buckets: tuple[float, ...] = size_buckets
+        self._endpoints: dict[str, _EndpointMetrics] = {}
+        self._exporters: list[Exporter] = []
+        self._started: WeakKeyDictionary[aiohttp.ClientResponse, tuple[str, float]] = (
+            WeakKeyDictionary()
+        )
+
+    def _endpoint(self, endpoint: str) -> _EndpointMetrics:
+        """Get the metrics of an endpoint."""
+        if (metrics := self._endpoints.get(endpoint)) is None:
+            metrics = self._endpoints[endpoint] = _EndpointMetrics()
+        return metrics
+
+    def _export(self, endpoint: str, metric: Metric, value: float) -> None:
+        """Pass a value to the exporters."""
+        for exporter in self._exporters:
+            exporter(endpoint, metric, value)
+
+    def add_exporter(self, exporter: Exporter) -> Callable[[], None]:
+        """Add an exporter, returning a function removing it."""
+        self._exporters.append(exporter)
+        return lambda: self._exporters.remove(exporter)
+
+    def observe(self, endpoint: str, metric: Metric, value: float) -> None:
+        """Record a latency in seconds or a size in bytes."""
+        histograms = self._endpoint(endpoint).histograms
+        if (histogram := histograms.get(metric)) is None:
+            histogram = histograms[metric] = Histogram(
+                self._size_buckets
+                if metric == Metric.RESPONSE_BYTES
+                else self._latency_buckets
+            )
+        histogram.observe(value)
+        if self._exporters:
+            self._export(endpoint, metric, value)
+
+    def count_status(self, endpoint: str, status: int) -> None:
+        """Count a response status."""
+        self._endpoint(endpoint).statuses[status] += 1
+        if self._exporters:
+            self._export(endpoint, Metric.STATUS, status)
+
+    def count_error(self, endpoint: str) -> None:
+        """Count a request failing without a response."""
+        self._endpoint(endpoint).errors += 1
+        if self._exporters:
+            self._export(endpoint, Metric.ERROR, 1)
+
+    def response_received(
+        self,
+        response: aiohttp.ClientResponse,
+        endpoint: str,
+        start: float,
+    ) -> None:
+        """Count a response, to record its total latency once read or released."""
+        self.count_status(endpoint, response.status)
+        self._started[response] = (endpoint, start)
+
+    def response_read(self, response: aiohttp.ClientResponse, size: int) -> str:
+        """Record the total latency and size of a read response.
+
+        Returns the endpoint of the response.
+        """
+        if (started := self._started.pop(response, None)) is None:
+            endpoint = endpoint_template(str(response.url))
+        else:
+            endpoint, start = started
+            self.observe(endpoint, Metric.TOTAL, time.perf_counter() - start)
+        self.observe(endpoint, Metric.RESPONSE_BYTES, size)
+        return endpoint
+
+    def response_released(self, response: aiohttp.ClientResponse) -> None:
+        """Record the total latency of a response released before being read.
+
+        Covers error responses and throttled responses drained before a
+        retry, so their time is not mistaken for network time.
+        """
+        if (started := self._started.pop(response, None)) is not None:
+            endpoint, start = started
+            self.observe(endpoint, Metric.TOTAL, time.perf_counter() - start)
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Get a trace config recording DNS, connect and time to first byte."""
+
+        async def _request_start(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceRequestStartParams,
+        ) -> None:
+            context.endpoint = endpoint_template(params.url.path)
+            context.start = time.perf_counter()
+
+        async def _dns_start(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceDnsResolveHostStartParams,
+        ) -> None:
+            context.dns_start = time.perf_counter()
+
+        async def _dns_end(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceDnsResolveHostEndParams,
+        ) -> None:
+            self.observe(
+                context.endpoint, Metric.DNS, time.perf_counter() - context.dns_start
+            )
+
+        async def _connect_start(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceConnectionCreateStartParams,
+        ) -> None:
+            context.connect_start = time.perf_counter()
+
+        async def _connect_end(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceConnectionCreateEndParams,
+        ) -> None:
+            self.observe(
+                context.endpoint,
+                Metric.CONNECT,
+                time.perf_counter() - context.connect_start,
+            )
+
+        async def _request_end(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceRequestEndParams,
+        ) -> None:
+            self.observe(
+                context.endpoint, Metric.TTFB, time.perf_counter() - context.start
+            )
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(_request_start)
+        trace_config.on_dns_resolvehost_start.append(_dns_start)
+        trace_config.on_dns_resolvehost_end.append(_dns_end)
+        trace_config.on_connection_create_start.append(_connect_start)
+        trace_config.on_connection_create_end.append(_connect_end)
+        trace_config.on_request_end.append(_request_end)
+        return trace_config
+
+    def snapshot(self) -> dict[str, EndpointSnapshot]:
+        """Get the metrics of every endpoint."""
+        return {
+            endpoint: EndpointSnapshot(
+                requests=metrics.statuses.total() + metrics.errors,
+                statuses=dict(metrics.statuses),
+                errors=metrics.errors,
+                histograms={
+                    metric: histogram.snapshot()
+                    for metric, histogram in metrics.histograms.items()
+                },
+            )
+            for endpoint, metrics in self._endpoints.items()
+        }
+
+    def reset(self) -> None:
+        """Clear every metric."""
+        self._endpoints.clear()
+        self._started.clear()
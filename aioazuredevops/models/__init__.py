@@ -6,7 +6,7 @@ from typing import TypeVar
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class ListResult[T]:
     """List result."""
 
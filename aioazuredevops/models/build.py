@@ -9,7 +9,7 @@ from . import ListResult
 from .core import Project
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BuildLinks:
     """DevOps build links."""
 
@@ -20,7 +20,7 @@ class BuildLinks:
     badge: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BuildDefinition:
     """DevOps build definition."""
 
@@ -33,7 +33,7 @@ class BuildDefinition:
     revision: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Build:
     """DevOps build."""
 
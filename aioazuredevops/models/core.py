@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProcessTemplate:
     """Azure DevOps project process template."""
 
@@ -15,7 +15,7 @@ class ProcessTemplate:
     template_type_id: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VersionControl:
     """Azure DevOps project version control."""
 
@@ -24,7 +24,7 @@ class VersionControl:
     tfvc_enabled: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Capabilities:
     """Azure DevOps project capabilities."""
 
@@ -32,7 +32,7 @@ class Capabilities:
     versioncontrol: VersionControl
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DefaultTeam:
     """Azure DevOps project default team."""
 
@@ -41,14 +41,14 @@ class DefaultTeam:
     url: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LinkCollection:
     """Azure DevOps project collection."""
 
     href: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Links:
     """Azure DevOps project links."""
 
@@ -57,7 +57,7 @@ class Links:
     web: LinkCollection
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Project:
     """Azure DevOps project."""
 
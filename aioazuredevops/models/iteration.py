@@ -16,7 +16,7 @@ class IterationTimeFrame(StrEnum):
     PAST = "past"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IterationAttributes:
     """Azure DevOps iteration attributes."""
 
@@ -25,7 +25,7 @@ class IterationAttributes:
     time_frame: IterationTimeFrame
 
 
-@dataclass
+@dataclass(slots=True)
 class Iteration:
     """Azure DevOps iteration."""
 
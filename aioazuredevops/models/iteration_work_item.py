@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkItemRelationTarget:
     """Work item relation target."""
 
@@ -12,7 +12,7 @@ class WorkItemRelationTarget:
     url: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkItemRelation:
     """Work item relation."""
 
@@ -21,7 +21,7 @@ class WorkItemRelation:
     target: WorkItemRelationTarget
 
 
-@dataclass
+@dataclass(slots=True)
 class IterationWorkItemsResult:
     """Iteration work items result."""
 
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WIQLColumn:
     """Azure DevOps WIQL Column."""
 
@@ -16,7 +16,7 @@ class WIQLColumn:
     url: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WIQLWorkItem:
     """Azure DevOps WIQL Work Item."""
 
@@ -24,7 +24,7 @@ class WIQLWorkItem:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WIQLResult:
     """Azure DevOps WIQL Result."""
 
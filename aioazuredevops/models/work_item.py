@@ -11,21 +11,21 @@ from uuid import UUID
 from . import ListResult
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkItemAvatar:
     """Work item avatar."""
 
     href: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkItemLinks:
     """Work item links."""
 
     avatar: WorkItemAvatar
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkItemUser:
     """Work item user."""
 
@@ -38,7 +38,7 @@ class WorkItemUser:
     links: WorkItemLinks | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkItemFields:
     """Azure DevOps work item fields."""
 
@@ -59,7 +59,7 @@ class WorkItemFields:
     microsoft_vsts_common_priority: int
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkItem:
     """Azure DevOps work item."""
 
@@ -69,4 +69,12 @@ class WorkItem:
     url: str
 
 
+@dataclass(slots=True)
+class WorkItemBatch:
+    """Azure DevOps work items fetched in chunks."""
+
+    work_items: list[WorkItem]
+    failed_chunks: list[list[int]]
+
+
 type WorkItemsResult = ListResult[WorkItem]
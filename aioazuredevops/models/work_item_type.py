@@ -6,7 +6,7 @@ from enum import StrEnum
 from . import ListResult
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Field:
     """Field."""
 
@@ -28,7 +28,7 @@ class Category(StrEnum):
     RESOLVED = "Resolved"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class State:
     """State."""
 
@@ -37,7 +37,7 @@ class State:
     category: Category
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Transition:
     """Transition."""
 
@@ -45,7 +45,7 @@ class Transition:
     actions: list[str] | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Icon:
     """Icon."""
 
@@ -53,7 +53,7 @@ class Icon:
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkItemType:
     """Work item type."""
 
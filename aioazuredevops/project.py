@@ -0,0 +1,230 @@
+"""Client bound to an Azure DevOps organization and project."""
+
+from collections.abc import AsyncGenerator, Sequence
+from datetime import datetime
+
+from .client import WORK_ITEM_FIELDS, DevOpsClient
+from .models.build import Build
+from .models.core import Project
+from .models.iteration import Iteration
+from .models.iteration_work_item import IterationWorkItemsResult
+from .models.wiql import WIQLResult
+from .models.work_item import WorkItem, WorkItemBatch
+from .models.work_item_type import WorkItemType
+from .query import BuildQuery
+from .store import WorkItemStore
+from .table import WorkItemTable
+
+
+class ProjectContext:
+    """Client methods bound to an organization and project.
+
+    Get one with DevOpsClient.project(). The quoted URL prefixes of the
+    project are cached on the client, so requests made through the
+    context only format their endpoint paths.
+    """
+
+    def __init__(
+        self,
+        client: DevOpsClient,
+        organization: str,
+        project: str,
+    ) -> None:
+        """Initialize."""
+        self._client: DevOpsClient = client
+        self._organization: str = organization
+        self._project: str = project
+        self._url: str = client._project_url(organization, project)
+
+    @property
+    def client(self) -> DevOpsClient:
+        """Get the client."""
+        return self._client
+
+    @property
+    def organization(self) -> str:
+        """Get the organization."""
+        return self._organization
+
+    @property
+    def project(self) -> str:
+        """Get the project."""
+        return self._project
+
+    @property
+    def url(self) -> str:
+        """Get the quoted URL of the project."""
+        return self._url
+
+    async def get_project(self) -> Project | None:
+        """Get Azure DevOps project."""
+        return await self._client.get_project(self._organization, self._project)
+
+    async def get_builds(self, parameters: str | BuildQuery) -> list[Build] | None:
+        """Get Azure DevOps builds."""
+        return await self._client.get_builds(
+            self._organization, self._project, parameters
+        )
+
+    def iter_builds(
+        self,
+        parameters: str | BuildQuery = "",
+        prefetch: bool = False,
+    ) -> AsyncGenerator[Build, None]:
+        """Iterate Azure DevOps builds page by page."""
+        return self._client.iter_builds(
+            self._organization, self._project, parameters, prefetch
+        )
+
+    async def get_build(self, build_id: int) -> Build | None:
+        """Get Azure DevOps build."""
+        return await self._client.get_build(self._organization, self._project, build_id)
+
+    async def get_builds_by_id(self, build_ids: list[int]) -> list[Build] | None:
+        """Get Azure DevOps builds by id, omitting missing builds."""
+        return await self._client.get_builds_by_id(
+            self._organization, self._project, build_ids
+        )
+
+    async def get_iterations(self) -> list[Iteration] | None:
+        """Get Azure DevOps iterations."""
+        return await self._client.get_iterations(self._organization, self._project)
+
+    async def get_iteration(self, iteration_id: str) -> Iteration | None:
+        """Get Azure DevOps iteration."""
+        return await self._client.get_iteration(
+            self._organization, self._project, iteration_id
+        )
+
+    async def get_iteration_work_items(
+        self, iteration_id: str
+    ) -> IterationWorkItemsResult | None:
+        """Get Azure DevOps iteration work items."""
+        return await self._client.get_iteration_work_items(
+            self._organization, self._project, iteration_id
+        )
+
+    async def get_work_item_ids_from_wiql(
+        self,
+        states: list[str] | None = None,
+        changed_since: datetime | None = None,
+    ) -> WIQLResult | None:
+        """Get Azure DevOps work item ids from wiql."""
+        return await self._client.get_work_item_ids_from_wiql(
+            self._organization, self._project, states, changed_since
+        )
+
+    async def get_work_item_ids(
+        self,
+        max_results: int | None = None,
+        states: list[str] | None = None,
+    ) -> list[int] | None:
+        """Get Azure DevOps work item ids."""
+        return await self._client.get_work_item_ids(
+            self._organization, self._project, max_results, states
+        )
+
+    async def get_work_item(self, id: int) -> WorkItem | None:
+        """Get an Azure DevOps work item."""
+        return await self._client.get_work_item(self._organization, self._project, id)
+
+    async def get_work_item_batch(
+        self,
+        ids: list[int],
+        max_concurrency: int = 1,
+        *,
+        fields: Sequence[str] | None = WORK_ITEM_FIELDS,
+        use_batch: bool = False,
+        lazy: bool = False,
+    ) -> WorkItemBatch:
+        """Get Azure DevOps work items, reporting any chunks that failed."""
+        return await self._client.get_work_item_batch(
+            self._organization,
+            self._project,
+            ids,
+            max_concurrency,
+            fields=fields,
+            use_batch=use_batch,
+            lazy=lazy,
+        )
+
+    async def get_work_items(
+        self,
+        ids: list[int],
+        max_concurrency: int = 1,
+        *,
+        fields: Sequence[str] | None = WORK_ITEM_FIELDS,
+        use_batch: bool = False,
+        lazy: bool = False,
+    ) -> list[WorkItem] | None:
+        """Get Azure DevOps work items."""
+        return await self._client.get_work_items(
+            self._organization,
+            self._project,
+            ids,
+            max_concurrency,
+            fields=fields,
+            use_batch=use_batch,
+            lazy=lazy,
+        )
+
+    async def get_work_items_table(
+        self,
+        ids: list[int],
+        max_concurrency: int = 1,
+        *,
+        use_batch: bool = False,
+    ) -> WorkItemTable | None:
+        """Get Azure DevOps work items as a columnar table."""
+        return await self._client.get_work_items_table(
+            self._organization,
+            self._project,
+            ids,
+            max_concurrency,
+            use_batch=use_batch,
+        )
+
+    async def get_work_item_revisions(
+        self,
+        ids: list[int],
+        max_concurrency: int = 1,
+    ) -> dict[int, int]:
+        """Get the current revision of each work item by id."""
+        return await self._client.get_work_item_revisions(
+            self._organization, self._project, ids, max_concurrency
+        )
+
+    async def get_stored_work_items(
+        self,
+        store: WorkItemStore,
+        ids: list[int] | None = None,
+        max_concurrency: int = 1,
+    ) -> list[WorkItem] | None:
+        """Get Azure DevOps work items through a persistent store."""
+        return await self._client.get_stored_work_items(
+            self._organization, self._project, store, ids, max_concurrency
+        )
+
+    def iter_work_items(
+        self,
+        ids: list[int],
+        prefetch: bool = False,
+        *,
+        fields: Sequence[str] | None = WORK_ITEM_FIELDS,
+        use_batch: bool = False,
+        lazy: bool = False,
+    ) -> AsyncGenerator[WorkItem, None]:
+        """Iterate Azure DevOps work items chunk by chunk."""
+        return self._client.iter_work_items(
+            self._organization,
+            self._project,
+            ids,
+            prefetch,
+            fields=fields,
+            use_batch=use_batch,
+            lazy=lazy,
+        )
+
+    async def get_work_item_types(self) -> list[WorkItemType] | None:
+        """Get Azure DevOps work item types."""
+        return await self._client.get_work_item_types(self._organization, self._project)
@@ -0,0 +1,111 @@
+"""Typed build queries filtered by Azure DevOps.
+
+https://learn.microsoft.com/en-us/rest/api/azure/devops/build/builds/list?view=azure-devops-rest-7.2
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Final
+from urllib.parse import quote
+
+QUERY_DATETIME_FORMAT: Final[str] = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+class BuildStatus(StrEnum):
+    """Build status."""
+
+    ALL = "all"
+    CANCELLING = "cancelling"
+    COMPLETED = "completed"
+    IN_PROGRESS = "inProgress"
+    NONE = "none"
+    NOT_STARTED = "notStarted"
+    POSTPONED = "postponed"
+
+
+class BuildResult(StrEnum):
+    """Build result."""
+
+    CANCELED = "canceled"
+    FAILED = "failed"
+    NONE = "none"
+    PARTIALLY_SUCCEEDED = "partiallySucceeded"
+    SUCCEEDED = "succeeded"
+
+
+class BuildQueryOrder(StrEnum):
+    """Build query order."""
+
+    FINISH_TIME_ASCENDING = "finishTimeAscending"
+    FINISH_TIME_DESCENDING = "finishTimeDescending"
+    QUEUE_TIME_ASCENDING = "queueTimeAscending"
+    QUEUE_TIME_DESCENDING = "queueTimeDescending"
+    START_TIME_ASCENDING = "startTimeAscending"
+    START_TIME_DESCENDING = "startTimeDescending"
+
+
+def _join(values: Iterable[object]) -> str:
+    """Join quoted values with commas."""
+    return ",".join(quote(str(value), safe="") for value in values)
+
+
+@dataclass(frozen=True, slots=True)
+class BuildQuery:
+    """Filters applied by Azure DevOps when listing builds.
+
+    Queries are hashable, so they can be used as cache keys. Lists passed
+    for the multi-valued filters are stored as tuples. Filters combine
+    as the API does: several statuses or results match any of them, and
+    min_time and max_time apply to the finish time unless query_order
+    sorts by queue or start time.
+    """
+
+    definitions: tuple[int, ...] = ()
+    branch_name: str | None = None
+    status_filter: tuple[BuildStatus, ...] = ()
+    result_filter: tuple[BuildResult, ...] = ()
+    min_time: datetime | None = None
+    max_time: datetime | None = None
+    top: int | None = None
+    query_order: BuildQueryOrder | None = None
+    max_builds_per_definition: int | None = None
+    properties: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Store multi-valued filters as tuples."""
+        for name in ("definitions", "status_filter", "result_filter", "properties"):
+            if not isinstance(value := getattr(self, name), tuple):
+                object.__setattr__(self, name, tuple(value))
+
+    def parameters(self) -> str:
+        """Get the query string, starting with ?, or empty without filters."""
+        parameters: list[str] = []
+        if self.definitions:
+            parameters.append(f"definitions={_join(self.definitions)}")
+        if self.branch_name is not None:
+            parameters.append(f"branchName={quote(self.branch_name, safe='')}")
+        if self.status_filter:
+            parameters.append(f"statusFilter={_join(self.status_filter)}")
+        if self.result_filter:
+            parameters.append(f"resultFilter={_join(self.result_filter)}")
+        if self.min_time is not None:
+            parameters.append(
+                f"minTime={self.min_time.astimezone(UTC).strftime(QUERY_DATETIME_FORMAT)}"
+            )
+        if self.max_time is not None:
+            parameters.append(
+                f"maxTime={self.max_time.astimezone(UTC).strftime(QUERY_DATETIME_FORMAT)}"
+            )
+        if self.top is not None:
+            parameters.append(f"$top={self.top}")
+        if self.query_order is not None:
+            parameters.append(f"queryOrder={self.query_order}")
+        if self.max_builds_per_definition is not None:
+            parameters.append(
+                f"maxBuildsPerDefinition={self.max_builds_per_definition}"
+            )
+        if self.properties:
+            parameters.append(f"properties={_join(self.properties)}")
+        return f"?{'&'.join(parameters)}" if parameters else ""
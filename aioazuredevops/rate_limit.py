@@ -0,0 +1,163 @@
+"""Adaptive request concurrency for Azure DevOps rate limits.
+
+https://learn.microsoft.com/en-us/azure/devops/integrate/concepts/rate-limits
+"""
+
+import asyncio
+from collections.abc import Mapping
+import random
+from typing import Final
+
+RETRY_AFTER_HEADER: Final[str] = "Retry-After"
+RATE_LIMIT_LIMIT_HEADER: Final[str] = "X-RateLimit-Limit"
+RATE_LIMIT_REMAINING_HEADER: Final[str] = "X-RateLimit-Remaining"
+RATE_LIMIT_DELAY_HEADER: Final[str] = "X-RateLimit-Delay"
+
+RETRY_STATUSES: Final[frozenset[int]] = frozenset({429, 503})
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    """Get a numeric header value."""
+    if (value := headers.get(name)) is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RateLimitController:
+    """Adjust in-flight request concurrency from rate limit headers.
+
+    The limit grows additively while responses are healthy and shrinks
+    multiplicatively when Azure DevOps throttles or delays requests.
+    A controller can be shared between clients to pace them together.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        decrease_factor: float = 0.5,
+        remaining_threshold: float = 0.1,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        jitter: float = 0.1,
+    ) -> None:
+        """Initialize."""
+        self._limit: float = float(initial_limit)
+        self._min_limit: int = min_limit
+        self._max_limit: int = max_limit
+        self._decrease_factor: float = decrease_factor
+        self._remaining_threshold: float = remaining_threshold
+        self._max_retries: int = max_retries
+        self._backoff: float = backoff
+        self._max_backoff: float = max_backoff
+        self._jitter: float = jitter
+        self._in_flight: int = 0
+        self._resume_at: float = 0.0
+        self._condition: asyncio.Condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Get the current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def min_limit(self) -> int:
+        """Get the lowest concurrency limit."""
+        return self._min_limit
+
+    @property
+    def max_limit(self) -> int:
+        """Get the highest concurrency limit."""
+        return self._max_limit
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of requests in flight."""
+        return self._in_flight
+
+    @property
+    def max_retries(self) -> int:
+        """Get the number of retries for throttled requests."""
+        return self._max_retries
+
+    async def __aenter__(self) -> "RateLimitController":
+        """Wait for a request slot."""
+        loop = asyncio.get_running_loop()
+        while (delay := self._resume_at - loop.time()) > 0:
+            await asyncio.sleep(delay)
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Release a request slot."""
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _decrease(self) -> None:
+        """Decrease the concurrency limit."""
+        self._limit = max(
+            float(self._min_limit),
+            self._limit * self._decrease_factor,
+        )
+
+    def _increase(self) -> None:
+        """Increase the concurrency limit."""
+        self._limit = min(
+            float(self._max_limit),
+            self._limit + 1 / self._limit,
+        )
+
+    def retry_delay(self, attempt: int, retry_after: float | None) -> float:
+        """Get the jittered delay before retrying a throttled request."""
+        if retry_after is not None:
+            return retry_after * (1 + random.uniform(0, self._jitter))
+        return random.uniform(
+            0,
+            min(self._max_backoff, self._backoff * 2**attempt),
+        )
+
+    def record(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        attempt: int = 0,
+    ) -> float | None:
+        """Record a response, returning the delay before retrying it.
+
+        Returns None when the response should not be retried.
+        """
+        retry_after = _header_float(headers, RETRY_AFTER_HEADER)
+
+        if status in RETRY_STATUSES:
+            self._decrease()
+            delay = self.retry_delay(attempt, retry_after)
+            if retry_after is not None:
+                # Pause every request sharing this controller
+                self._resume_at = max(
+                    self._resume_at,
+                    asyncio.get_running_loop().time() + delay,
+                )
+            return delay if attempt < self._max_retries else None
+
+        remaining = _header_float(headers, RATE_LIMIT_REMAINING_HEADER)
+        limit = _header_float(headers, RATE_LIMIT_LIMIT_HEADER)
+        if (_header_float(headers, RATE_LIMIT_DELAY_HEADER) or 0) > 0 or (
+            remaining is not None
+            and limit
+            and remaining / limit < self._remaining_threshold
+        ):
+            self._decrease()
+        elif status < 400:
+            self._increase()
+
+        return None
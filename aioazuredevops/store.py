@@ -0,0 +1,163 @@
+"""Persistent work item store keyed by id and revision."""
+
+from collections.abc import Iterable
+from datetime import datetime
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Final
+
+SCHEMA_VERSION: Final[int] = 2
+# Ids bound per query, under SQLite's variable limit
+LOAD_CHUNK_SIZE: Final[int] = 500
+
+
+class WorkItemStore:
+    """Persist work item JSON by organization, project, id and rev in SQLite.
+
+    Methods block on disk access, DevOpsClient.get_stored_work_items runs
+    them in a worker thread. A lock serializes access to the connection,
+    so methods can run in several threads at once. The store also keeps
+    the time work items were last queried per project, to only query
+    work items changed since.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = ":memory:",
+    ) -> None:
+        """Initialize."""
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            path,
+            check_same_thread=False,
+        )
+        self._lock: threading.Lock = threading.Lock()
+        if (
+            self._connection.execute("PRAGMA user_version").fetchone()[0]
+            != SCHEMA_VERSION
+        ):
+            with self._connection:
+                self._connection.execute("DROP TABLE IF EXISTS work_items")
+                self._connection.execute("DROP TABLE IF EXISTS watermarks")
+                self._connection.execute(
+                    "CREATE TABLE work_items ("
+                    "organization TEXT NOT NULL, "
+                    "project TEXT NOT NULL, "
+                    "id INTEGER NOT NULL, "
+                    "rev INTEGER NOT NULL, "
+                    "data TEXT NOT NULL, "
+                    "PRIMARY KEY (organization, project, id))"
+                )
+                self._connection.execute(
+                    "CREATE TABLE watermarks ("
+                    "organization TEXT NOT NULL, "
+                    "project TEXT NOT NULL, "
+                    "as_of TEXT NOT NULL, "
+                    "PRIMARY KEY (organization, project))"
+                )
+                self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def revisions(
+        self,
+        organization: str,
+        project: str,
+    ) -> dict[int, int]:
+        """Get the stored revision of each work item by id."""
+        with self._lock:
+            return dict(
+                self._connection.execute(
+                    "SELECT id, rev FROM work_items WHERE organization = ? AND project = ?",
+                    (organization, project),
+                )
+            )
+
+    def load(
+        self,
+        organization: str,
+        project: str,
+        ids: Iterable[int],
+    ) -> dict[int, dict[str, Any]]:
+        """Get the stored work item JSON by id."""
+        ids = list(ids)
+        work_items: dict[int, dict[str, Any]] = {}
+        with self._lock:
+            for i in range(0, len(ids), LOAD_CHUNK_SIZE):
+                chunk = ids[i : i + LOAD_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                work_items.update(
+                    (id, json.loads(data))
+                    for id, data in self._connection.execute(
+                        "SELECT id, data FROM work_items "  # noqa: S608
+                        "WHERE organization = ? AND project = ? "
+                        f"AND id IN ({placeholders})",
+                        (organization, project, *chunk),
+                    )
+                )
+        return work_items
+
+    def save(
+        self,
+        organization: str,
+        project: str,
+        work_items: Iterable[dict[str, Any]],
+    ) -> None:
+        """Store work item JSON, replacing older revisions."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO work_items VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        organization,
+                        project,
+                        work_item["id"],
+                        work_item["rev"],
+                        json.dumps(work_item),
+                    )
+                    for work_item in work_items
+                ),
+            )
+
+    def delete(
+        self,
+        organization: str,
+        project: str,
+        ids: Iterable[int],
+    ) -> None:
+        """Delete stored work items."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM work_items WHERE organization = ? AND project = ? AND id = ?",
+                ((organization, project, id) for id in ids),
+            )
+
+    def watermark(
+        self,
+        organization: str,
+        project: str,
+    ) -> datetime | None:
+        """Get the time work items were last queried, if any."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT as_of FROM watermarks WHERE organization = ? AND project = ?",
+                (organization, project),
+            ).fetchone()
+        return None if row is None else datetime.fromisoformat(row[0])
+
+    def set_watermark(
+        self,
+        organization: str,
+        project: str,
+        as_of: datetime,
+    ) -> None:
+        """Store the time work items were last queried."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)",
+                (organization, project, as_of.isoformat()),
+            )
+
+    def close(self) -> None:
+        """Close the store."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,117 @@
+"""Incremental work item sync driven by ChangedDate watermarks."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+
+from .client import DevOpsClient
+from .models.work_item import WorkItem
+
+
+@dataclass
+class WorkItemChanges:
+    """Work items added, changed or removed by a sync."""
+
+    added: list[WorkItem] = field(default_factory=list)
+    changed: list[WorkItem] = field(default_factory=list)
+    removed: list[WorkItem] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return if anything changed."""
+        return bool(self.added or self.changed or self.removed)
+
+
+class WorkItemSync:
+    """Keep a local map of a project's work items in sync.
+
+    The first refresh loads every work item. Later refreshes only query
+    and fetch work items changed since the previous query ran, using the
+    WIQL asOf time as the watermark. Deleted work items never show up as
+    changed, so refresh(full=True) periodically to reconcile the full id
+    list.
+    """
+
+    def __init__(
+        self,
+        client: DevOpsClient,
+        organization: str,
+        project: str,
+        states: list[str] | None = None,
+        max_concurrency: int = 1,
+    ) -> None:
+        """Initialize."""
+        self._client: DevOpsClient = client
+        self._organization: str = organization
+        self._project: str = project
+        self._states: list[str] | None = states
+        self._max_concurrency: int = max_concurrency
+        self._work_items: dict[int, WorkItem] = {}
+        self._watermark: datetime | None = None
+
+    @property
+    def work_items(self) -> Mapping[int, WorkItem]:
+        """Get the synced work items by id."""
+        return MappingProxyType(self._work_items)
+
+    @property
+    def watermark(self) -> datetime | None:
+        """Get the time work items were last queried."""
+        return self._watermark
+
+    async def refresh(
+        self,
+        full: bool = False,
+    ) -> WorkItemChanges | None:
+        """Fetch work items changed since the last refresh.
+
+        Returns None if the query failed, the local state is then
+        unchanged.
+        """
+        full = full or self._watermark is None
+        if (
+            wiql_result := await self._client.get_work_item_ids_from_wiql(
+                self._organization,
+                self._project,
+                # Changed work items are queried in every state, so work
+                # items moving out of the filtered states are removed
+                self._states if full else None,
+                None if full else self._watermark,
+            )
+        ) is None:
+            return None
+
+        changes = WorkItemChanges()
+        ids = [work_item.id for work_item in wiql_result.work_items]
+        if full:
+            listed = set(ids)
+            changes.removed.extend(
+                self._work_items.pop(id)
+                for id in list(self._work_items)
+                if id not in listed
+            )
+
+        batch = await self._client.get_work_item_batch(
+            self._organization,
+            self._project,
+            ids,
+            self._max_concurrency,
+        )
+        for work_item in batch.work_items:
+            previous = self._work_items.get(work_item.id)
+            if self._states is not None and work_item.fields.state not in self._states:
+                if previous is not None:
+                    changes.removed.append(self._work_items.pop(work_item.id))
+                continue
+
+            self._work_items[work_item.id] = work_item
+            if previous is None:
+                changes.added.append(work_item)
+            elif previous.rev != work_item.rev:
+                changes.changed.append(work_item)
+
+        # Query the failed chunks again on the next refresh
+        if not batch.failed_chunks:
+            self._watermark = wiql_result.as_of
+
+        return changes
@@ -0,0 +1,281 @@
+"""Columnar work item tables for large result sets."""
+
+from array import array
+from collections import Counter
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import fields
+from itertools import compress
+from typing import Any, Final
+
+from .models.work_item import WorkItem, WorkItemFields
+
+NO_PRIORITY: Final[int] = 0
+"""Stored in the priority column for work items without a priority."""
+
+DICTIONARY_COLUMNS: Final[tuple[str, ...]] = (
+    "area_path",
+    "team_project",
+    "iteration_path",
+    "work_item_type",
+    "state",
+    "reason",
+    "assigned_to",
+    "created_by",
+    "changed_by",
+)
+INTEGER_COLUMNS: Final[tuple[str, ...]] = (
+    "id",
+    "rev",
+    "comment_count",
+    "microsoft_vsts_common_priority",
+)
+# The next wider array typecode for dictionary codes
+CODE_TYPECODES: Final[dict[str, str]] = {"B": "H", "H": "L", "L": "Q"}
+COLUMNS: Final[tuple[str, ...]] = (
+    "id",
+    "rev",
+    "url",
+    *(field.name for field in fields(WorkItemFields)),
+)
+
+
+class DictionaryColumn[T]:
+    """Column storing each distinct value once and a code per row.
+
+    Codes are stored in the narrowest array that fits the largest code,
+    one byte per row while there are at most 256 distinct values.
+    """
+
+    __slots__ = ("_codes", "_dictionary", "_index")
+
+    def __init__(self, values: Iterable[T] = ()) -> None:
+        """Initialize."""
+        self._codes: array[int] = array("B")
+        self._dictionary: list[T] = []
+        self._index: dict[T, int] = {}
+        for value in values:
+            self.append(value)
+
+    @property
+    def codes(self) -> array[int]:
+        """Get the dictionary code of each row."""
+        return self._codes
+
+    @property
+    def dictionary(self) -> list[T]:
+        """Get the distinct values, indexed by code."""
+        return self._dictionary
+
+    def _encode(self, value: T) -> int:
+        """Get the code of a value, adding it to the dictionary if new."""
+        if (code := self._index.get(value)) is None:
+            code = self._index[value] = len(self._dictionary)
+            self._dictionary.append(value)
+        return code
+
+    def _widen(self, code: int) -> None:
+        """Widen the codes array until it can store code."""
+        while code >= 1 << (8 * self._codes.itemsize):
+            self._codes = array(CODE_TYPECODES[self._codes.typecode], self._codes)
+
+    def append(self, value: T) -> None:
+        """Append a row."""
+        code = self._encode(value)
+        self._widen(code)
+        self._codes.append(code)
+
+    def extend(self, column: "DictionaryColumn[T]") -> None:
+        """Append the rows of another column."""
+        codes = [self._encode(value) for value in column._dictionary]
+        if codes:
+            self._widen(max(codes))
+        self._codes.extend(map(codes.__getitem__, column._codes))
+
+    def take(self, indices: Iterable[int]) -> "DictionaryColumn[T]":
+        """Get a column of the given rows, sharing this dictionary."""
+        column: DictionaryColumn[T] = DictionaryColumn()
+        # Codes are never reassigned, so the dictionary is safe to share
+        column._dictionary = self._dictionary
+        column._index = self._index
+        column._codes = array(
+            self._codes.typecode, map(self._codes.__getitem__, indices)
+        )
+        return column
+
+    def codes_of(self, values: Iterable[T]) -> set[int]:
+        """Get the codes of the values present in the dictionary."""
+        return {
+            code for value in values if (code := self._index.get(value)) is not None
+        }
+
+    def mask(self, values: Iterable[T]) -> bytes:
+        """Get a byte per row, 1 if the row is one of the values, else 0."""
+        codes = self.codes_of(values)
+        if self._codes.typecode == "B":
+            # Translate every code to 0 or 1 in a single C level pass
+            return self._codes.tobytes().translate(
+                bytes(code in codes for code in range(256))
+            )
+        return bytes(map(codes.__contains__, self._codes))
+
+    def counts(self) -> dict[T, int]:
+        """Count the rows of each value."""
+        if self._codes.typecode == "B":
+            data = self._codes.tobytes()
+            return {
+                self._dictionary[code]: count
+                for code in range(min(len(self._dictionary), 256))
+                if (count := data.count(code))
+            }
+        return {
+            self._dictionary[code]: count
+            for code, count in Counter(self._codes).items()
+        }
+
+    def __getitem__(self, index: int) -> T:
+        """Get the value of a row."""
+        return self._dictionary[self._codes[index]]
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the value of each row."""
+        return map(self._dictionary.__getitem__, self._codes)
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+        return len(self._codes)
+
+
+type Column = DictionaryColumn[Any] | array[int] | list[Any]
+
+
+def _empty_column(name: str) -> Column:
+    """Create an empty column of the storage kind for a column name."""
+    if name in DICTIONARY_COLUMNS:
+        return DictionaryColumn()
+    if name in INTEGER_COLUMNS:
+        return array("q")
+    return []
+
+
+class WorkItemTable:
+    """Work items stored as one column per field.
+
+    Low cardinality strings and users are dictionary encoded, ids,
+    revisions, comment counts and priorities are stored in integer arrays.
+    Filters and group-bys on encoded columns compare integer codes rather
+    than strings, and never create a WorkItem until a row is asked for.
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, work_items: Iterable[WorkItem] = ()) -> None:
+        """Initialize."""
+        self._columns: dict[str, Column] = {
+            name: _empty_column(name) for name in COLUMNS
+        }
+        for work_item in work_items:
+            self.append(work_item)
+
+    @property
+    def columns(self) -> dict[str, Column]:
+        """Get the columns by name."""
+        return self._columns
+
+    def append(self, work_item: WorkItem) -> None:
+        """Append a work item."""
+        columns = self._columns
+        columns["id"].append(work_item.id)
+        columns["rev"].append(work_item.rev)
+        columns["url"].append(work_item.url)
+        for name in COLUMNS[3:]:
+            value = getattr(work_item.fields, name)
+            if name == "microsoft_vsts_common_priority" and value is None:
+                value = NO_PRIORITY
+            columns[name].append(value)
+
+    def extend(self, table: "WorkItemTable") -> None:
+        """Append the rows of another table."""
+        for name, column in self._columns.items():
+            column.extend(table._columns[name])
+
+    def take(self, indices: Collection[int]) -> "WorkItemTable":
+        """Get a table of the given rows, in the given order."""
+        table = WorkItemTable()
+        for name, column in self._columns.items():
+            if isinstance(column, DictionaryColumn):
+                table._columns[name] = column.take(indices)
+            elif isinstance(column, array):
+                table._columns[name] = array(
+                    column.typecode, map(column.__getitem__, indices)
+                )
+            else:
+                table._columns[name] = list(map(column.__getitem__, indices))
+        return table
+
+    def where(self, **conditions: Any) -> list[int]:
+        """Get the indices of rows whose columns equal, or are in, the values.
+
+        For example table.where(state=["Active", "New"], work_item_type="Bug").
+        """
+        selected = int.from_bytes(b"\x01" * len(self))
+        for name, values in conditions.items():
+            if isinstance(values, str) or not isinstance(values, Collection):
+                values = (values,)
+            column = self._columns[name]
+            if isinstance(column, DictionaryColumn):
+                mask = column.mask(values)
+            else:
+                mask = bytes(map(set(values).__contains__, column))
+            # AND the 0 or 1 byte masks as big integers, in C
+            selected &= int.from_bytes(mask)
+        return list(compress(range(len(self)), selected.to_bytes(len(self))))
+
+    def filter(self, **conditions: Any) -> "WorkItemTable":
+        """Get a table of the rows whose columns equal, or are in, the values."""
+        return self.take(self.where(**conditions))
+
+    def count_by(self, name: str) -> dict[Any, int]:
+        """Count the rows for each value of a column."""
+        column = self._columns[name]
+        if isinstance(column, DictionaryColumn):
+            return column.counts()
+        return dict(Counter(column))
+
+    def group_by(self, name: str) -> dict[Any, "WorkItemTable"]:
+        """Split the rows into a table for each value of a column."""
+        column = self._columns[name]
+        groups: dict[Any, list[int]] = {}
+        if isinstance(column, DictionaryColumn):
+            dictionary = column.dictionary
+            for index, code in enumerate(column.codes):
+                groups.setdefault(code, []).append(index)
+            return {
+                dictionary[code]: self.take(indices) for code, indices in groups.items()
+            }
+        for index, value in enumerate(column):
+            groups.setdefault(value, []).append(index)
+        return {value: self.take(indices) for value, indices in groups.items()}
+
+    def row(self, index: int) -> WorkItem:
+        """Get a row as a work item."""
+        values = {name: column[index] for name, column in self._columns.items()}
+        if values["microsoft_vsts_common_priority"] == NO_PRIORITY:
+            values["microsoft_vsts_common_priority"] = None
+        return WorkItem(
+            id=values.pop("id"),
+            rev=values.pop("rev"),
+            url=values.pop("url"),
+            fields=WorkItemFields(**values),
+        )
+
+    def __getitem__(self, name: str) -> Column:
+        """Get a column by name."""
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[WorkItem]:
+        """Iterate over the rows as work items."""
+        return (self.row(index) for index in range(len(self)))
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+        return len(self._columns["id"])
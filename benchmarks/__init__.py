@@ -0,0 +1,4 @@
+"""Benchmarks.
+
+Run a benchmark as a module, e.g. python -m benchmarks.json_decode
+"""
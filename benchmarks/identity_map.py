@@ -0,0 +1,37 @@
+"""Benchmark memory of decoded builds, with and without an identity map."""
+
+import json
+import tracemalloc
+
+from aioazuredevops.decode import IdentityMap, build_from_json
+from tests import RESPONSE_JSON_DEVOPS_BUILD
+
+NUMBER = 10_000
+
+
+def _measure(identities: IdentityMap | None) -> float:
+    """Get the traced memory in bytes per build decoded from a fresh response."""
+    # Decode from parsed JSON, so no strings are shared with the fixture
+    response = json.loads(json.dumps([RESPONSE_JSON_DEVOPS_BUILD] * NUMBER))
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    builds = [build_from_json(build, identities) for build in response]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del builds
+    return (after - before) / NUMBER
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"Bytes per build over {NUMBER} builds of one definition and project")
+    unshared = _measure(None)
+    shared = _measure(IdentityMap())
+    print(
+        f"{unshared:8.0f} without identity map, {shared:8.0f} with "
+        f"({1 - shared / unshared:.0%} smaller)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Benchmark JSON decoding backends on a 200 item work items payload."""
+
+import functools
+import json
+import timeit
+
+from aioazuredevops.client import WORK_ITEMS_CHUNK_SIZE
+from aioazuredevops.json import JSONBackend, get_json_loads
+
+from .payloads import work_items
+
+NUMBER = 200
+
+
+def main() -> None:
+    """Run the benchmark."""
+    body = json.dumps(work_items(WORK_ITEMS_CHUNK_SIZE)).encode()
+    print(f"Payload: {WORK_ITEMS_CHUNK_SIZE} work items, {len(body) / 1024:.0f} KiB")
+
+    baseline: float | None = None
+    for backend in reversed(JSONBackend):
+        try:
+            loads = get_json_loads(backend)
+        except ImportError:
+            print(f"{backend:>8}: not installed")
+            continue
+
+        elapsed = min(
+            timeit.repeat(functools.partial(loads, body), number=NUMBER, repeat=5)
+        )
+        per_call = elapsed / NUMBER * 1000
+        if baseline is None:
+            baseline = per_call
+        print(
+            f"{backend:>8}: {per_call:.3f} ms per decode ({baseline / per_call:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
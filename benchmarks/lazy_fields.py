@@ -0,0 +1,47 @@
+"""Benchmark eager against lazy work item decoding for an id and state poll."""
+
+import timeit
+
+from aioazuredevops.client import WORK_ITEMS_CHUNK_SIZE
+from aioazuredevops.decode import work_item_from_json
+from aioazuredevops.lazy import LazyWorkItemFields
+from aioazuredevops.models.work_item import WorkItem
+
+from .payloads import work_items
+
+NUMBER = 200
+
+
+def main() -> None:
+    """Run the benchmark."""
+    data = work_items(WORK_ITEMS_CHUNK_SIZE)["value"]
+
+    def _eager() -> dict[int, str]:
+        return {
+            work_item.id: work_item.fields.state
+            for work_item in map(work_item_from_json, data)
+        }
+
+    def _lazy() -> dict[int, str]:
+        return {
+            work_item.id: work_item.fields.state
+            for work_item in (
+                WorkItem(
+                    id=item["id"],
+                    rev=item["rev"],
+                    fields=LazyWorkItemFields(item["fields"]),
+                    url=item["url"],
+                )
+                for item in data
+            )
+        }
+
+    print(f"Reading id and state of {WORK_ITEMS_CHUNK_SIZE} work items")
+    eager = min(timeit.repeat(_eager, number=NUMBER, repeat=5)) / NUMBER
+    lazy = min(timeit.repeat(_lazy, number=NUMBER, repeat=5)) / NUMBER
+    print(f"   eager: {eager * 1000:.3f} ms")
+    print(f"    lazy: {lazy * 1000:.3f} ms ({eager / lazy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
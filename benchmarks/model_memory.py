@@ -0,0 +1,85 @@
+"""Benchmark model memory per object, slotted against plain dataclasses."""
+
+from collections.abc import Callable
+import dataclasses
+import tracemalloc
+from typing import Any
+
+from aioazuredevops.decode import (
+    build_from_json,
+    iteration_from_json,
+    project_from_json,
+    work_item_from_json,
+    work_item_type_from_json,
+)
+from tests import (
+    RESPONSE_JSON_DEVOPS_BUILD,
+    RESPONSE_JSON_DEVOPS_ITERATION,
+    RESPONSE_JSON_DEVOPS_PROJECT,
+    RESPONSE_JSON_DEVOPS_WORK_ITEM,
+    RESPONSE_JSON_DEVOPS_WORK_ITEM_TYPES,
+)
+
+NUMBER = 10_000
+
+FIXTURES: dict[str, tuple[Callable[[dict], Any], dict]] = {
+    "Build": (build_from_json, RESPONSE_JSON_DEVOPS_BUILD),
+    "Iteration": (iteration_from_json, RESPONSE_JSON_DEVOPS_ITERATION),
+    "Project": (project_from_json, RESPONSE_JSON_DEVOPS_PROJECT),
+    "WorkItem": (work_item_from_json, RESPONSE_JSON_DEVOPS_WORK_ITEM),
+    "WorkItemType": (
+        work_item_type_from_json,
+        RESPONSE_JSON_DEVOPS_WORK_ITEM_TYPES["value"][0],
+    ),
+}
+
+_plain_classes: dict[type, type] = {}
+
+
+def _plain(value: Any) -> Any:
+    """Copy a model graph into equivalent dataclasses without slots."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        cls = type(value)
+        if cls not in _plain_classes:
+            _plain_classes[cls] = dataclasses.make_dataclass(
+                cls.__name__,
+                [(field.name, field.type) for field in dataclasses.fields(cls)],
+            )
+        return _plain_classes[cls](
+            **{
+                field.name: _plain(getattr(value, field.name))
+                for field in dataclasses.fields(value)
+            }
+        )
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+
+def _measure(factory: Callable[[], Any]) -> float:
+    """Get the traced memory in bytes per object created by factory."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(NUMBER)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / NUMBER
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"Bytes per object over {NUMBER} objects decoded from the test fixtures")
+    for name, (decode, data) in FIXTURES.items():
+        plain = _measure(lambda decode=decode, data=data: _plain(decode(data)))
+        slotted = _measure(lambda decode=decode, data=data: decode(data))
+        print(
+            f"{name:>12}: {plain:8.0f} plain, {slotted:8.0f} slotted "
+            f"({1 - slotted / plain:.0%} smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Generated Azure DevOps payloads for benchmarks."""
+
+from datetime import date, timedelta
+from typing import Any
+
+STATES: tuple[str, ...] = ("New", "Active", "Resolved", "Closed")
+STATE_CATEGORIES: tuple[str, ...] = ("Proposed", "InProgress", "Resolved", "Completed")
+BUILD_RESULTS: tuple[str, ...] = ("succeeded", "succeeded", "failed", "canceled")
+WORK_ITEM_TYPES: tuple[str, ...] = ("Bug", "Task", "User Story", "Feature")
+
+
+def user(index: int) -> dict[str, Any]:
+    """Get a generated identity."""
+    return {
+        "displayName": f"User {index}",
+        "url": f"https://spsprodweu5.vssps.visualstudio.com/A00000000/_apis/Identities/{index:08d}",
+        "_links": {
+            "avatar": {
+                "href": f"https://dev.azure.com/org/_apis/GraphProfile/MemberAvatars/aad.{index:08d}"
+            }
+        },
+        "id": f"{index:08d}-0000-0000-0000-000000000000",
+        "uniqueName": f"user{index}@example.com",
+        "imageUrl": f"https://dev.azure.com/org/_api/_common/identityImage?id={index:08d}",
+        "descriptor": f"aad.{index:08d}",
+    }
+
+
+def work_item(index: int, project: str = "project") -> dict[str, Any]:
+    """Get a generated work item."""
+    return {
+        "id": index,
+        "rev": index % 17 + 1,
+        "fields": {
+            "System.AreaPath": f"{project}\\Area {index % 5}",
+            "System.TeamProject": project,
+            "System.IterationPath": f"{project}\\Sprint {index % 12}",
+            "System.WorkItemType": WORK_ITEM_TYPES[index % len(WORK_ITEM_TYPES)],
+            "System.State": STATES[index % len(STATES)],
+            "System.Reason": "New",
+            "System.AssignedTo": user(index % 7),
+            "System.CreatedDate": "2024-01-02T03:04:05.123Z",
+            "System.CreatedBy": user(index % 3),
+            "System.ChangedDate": f"2024-03-{index % 28 + 1:02d}T10:11:12.45Z",
+            "System.ChangedBy": user(index % 5),
+            "System.CommentCount": index % 4,
+            "System.Title": f"Work item {index}",
+            "System.Description": "<div>"
+            + "Lorem ipsum dolor sit amet. " * 20
+            + "</div>",
+            "Microsoft.VSTS.Common.StateChangeDate": "2024-02-01T00:00:00Z",
+            "Microsoft.VSTS.Common.Priority": index % 4 + 1,
+        },
+        "url": f"https://dev.azure.com/org/{project}/_apis/wit/workItems/{index}",
+    }
+
+
+def work_items(count: int, start: int = 1) -> dict[str, Any]:
+    """Get a generated work items response."""
+    return {
+        "count": count,
+        "value": [work_item(index) for index in range(start, start + count)],
+    }
+
+
+def project(name: str = "project") -> dict[str, Any]:
+    """Get a generated project."""
+    return {
+        "id": f"{name}-0000-0000-0000-000000000000",
+        "name": name,
+        "description": f"{name} description",
+        "url": f"https://dev.azure.com/org/_apis/projects/{name}",
+        "state": "wellFormed",
+        "capabilities": {
+            "processTemplate": {
+                "templateName": "Agile",
+                "templateTypeId": "adcc42ab-9882-485e-a3ed-7678f01f66bc",
+            },
+            "versioncontrol": {
+                "sourceControlType": "Git",
+                "gitEnabled": "True",
+                "tfvcEnabled": "False",
+            },
+        },
+        "revision": 1,
+        "visibility": "private",
+        "lastUpdateTime": "2024-01-02T03:04:05.123Z",
+        "defaultTeam": {
+            "id": f"{name}-team",
+            "name": f"{name} Team",
+            "url": f"https://dev.azure.com/org/_apis/projects/{name}/teams/{name}-team",
+        },
+        "_links": {
+            "self": {"href": f"https://dev.azure.com/org/_apis/projects/{name}"},
+            "collection": {
+                "href": "https://dev.azure.com/org/_apis/projectCollections"
+            },
+            "web": {"href": f"https://dev.azure.com/org/{name}"},
+        },
+    }
+
+
+def build_definition(index: int) -> int:
+    """Get the definition id of a generated build, one of 20."""
+    return index % 20 + 1
+
+
+def build_result(index: int) -> str:
+    """Get the result of a generated build."""
+    return BUILD_RESULTS[index % len(BUILD_RESULTS)]
+
+
+def build_branch(index: int) -> str:
+    """Get the source branch of a generated build."""
+    return f"refs/heads/{'main' if index % 3 else f'feature/{index}'}"
+
+
+def build(index: int, project: str = "project") -> dict[str, Any]:
+    """Get a generated build, of one of 20 definitions."""
+    definition = build_definition(index)
+    return {
+        "id": index,
+        "buildNumber": f"2024{index:06d}.1",
+        "status": "completed",
+        "result": build_result(index),
+        "sourceBranch": build_branch(index),
+        "sourceVersion": f"{index:040x}",
+        "priority": "normal",
+        "reason": "individualCI",
+        "queueTime": "2024-03-01T10:00:00.1234567Z",
+        "startTime": "2024-03-01T10:00:05.1234567Z",
+        "finishTime": "2024-03-01T10:05:00.1234567Z",
+        "definition": {
+            "id": definition,
+            "name": f"Pipeline {definition}",
+            "url": f"https://dev.azure.com/org/{project}/_apis/build/Definitions/{definition}",
+            "path": "\\",
+            "type": "build",
+            "queueStatus": "enabled",
+            "revision": 3,
+        },
+        "project": {
+            "id": f"{project}-0000-0000-0000-000000000000",
+            "name": project,
+            "url": f"https://dev.azure.com/org/_apis/projects/{project}",
+            "state": "wellFormed",
+            "revision": 1,
+            "visibility": "private",
+            "lastUpdateTime": "2024-01-02T03:04:05.123Z",
+        },
+        "_links": {
+            name: {
+                "href": f"https://dev.azure.com/org/{project}/_apis/build/Builds/{index}/{name}"
+            }
+            for name in ("self", "web", "sourceVersionDisplayUri", "timeline", "badge")
+        },
+    }
+
+
+def iteration(index: int, project: str = "project", current: int = 0) -> dict[str, Any]:
+    """Get a generated two week iteration, relative to the current iteration."""
+    start = date(2024, 1, 1) + timedelta(weeks=2 * index)
+    return {
+        "id": f"{index:08d}-0000-0000-0000-000000000000",
+        "name": f"Sprint {index}",
+        "path": f"{project}\\Sprint {index}",
+        "attributes": {
+            "startDate": f"{start.isoformat()}T00:00:00Z",
+            "finishDate": f"{(start + timedelta(days=11)).isoformat()}T00:00:00Z",
+            "timeFrame": (
+                "current"
+                if index == current
+                else "past"
+                if index < current
+                else "future"
+            ),
+        },
+        "url": f"https://dev.azure.com/org/{project}/_apis/work/teamsettings/iterations/{index}",
+    }
+
+
+def work_item_type(name: str) -> dict[str, Any]:
+    """Get a generated work item type."""
+    return {
+        "name": name,
+        "referenceName": f"Microsoft.VSTS.WorkItemTypes.{name.replace(' ', '')}",
+        "description": f"{name} work item type",
+        "color": "CC293D",
+        "icon": {
+            "id": "icon_insect",
+            "url": "https://tfsprodweu5.visualstudio.com/_apis/wit/workItemIcons/icon_insect",
+        },
+        "isDisabled": False,
+        "xmlForm": "<FORM></FORM>",
+        "fields": [],
+        "fieldInstances": [],
+        "transitions": {},
+        "states": [
+            {"name": state, "color": "b2b2b2", "category": category}
+            for state, category in zip(STATES, STATE_CATEGORIES, strict=True)
+        ],
+        "url": f"https://dev.azure.com/org/_apis/wit/workItemTypes/{name}",
+    }
@@ -0,0 +1,381 @@
+"""Local Azure DevOps stand-in serving generated data at scale.
+
+Run it on its own with python -m benchmarks.server, or start it in a
+separate process with run_server so it does not share the client's CPU.
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+import json
+import multiprocessing
+import random
+import socket
+import time
+from typing import Any, Final
+
+from aiohttp import web
+
+from aioazuredevops.client import CONTINUATION_TOKEN_HEADER
+from aioazuredevops.rate_limit import (
+    RATE_LIMIT_DELAY_HEADER,
+    RATE_LIMIT_LIMIT_HEADER,
+    RATE_LIMIT_REMAINING_HEADER,
+    RETRY_AFTER_HEADER,
+)
+
+from . import payloads
+
+# Azure DevOps caps WIQL results and build pages
+WIQL_MAX_RESULTS: Final[int] = 20_000
+BUILDS_PAGE_SIZE: Final[int] = 1_000
+ITERATIONS: Final[int] = 26
+ENCODED_CACHE_SIZE: Final[int] = 65_536
+# Seconds between checks for the server accepting connections
+SERVER_POLL_INTERVAL: Final[float] = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class ServerConfig:
+    """Fake server scale and failure injection."""
+
+    organization: str = "org"
+    project: str = "project"
+    work_items: int = 10_000
+    builds: int = 2_000
+    latency: float = 0.0
+    throttle_every: int = 0
+    error_rate: float = 0.0
+    seed: int = 0
+
+
+@lru_cache(maxsize=ENCODED_CACHE_SIZE)
+def _encoded_work_item(
+    index: int, project: str, fields: tuple[str, ...] | None
+) -> bytes:
+    """Get a generated work item as JSON, with only the requested fields."""
+    work_item = payloads.work_item(index, project)
+    if fields is not None:
+        work_item["fields"] = {
+            name: value for name, value in work_item["fields"].items() if name in fields
+        }
+    return json.dumps(work_item).encode()
+
+
+@lru_cache(maxsize=ENCODED_CACHE_SIZE)
+def _encoded_build(index: int, project: str) -> bytes:
+    """Get a generated build as JSON."""
+    return json.dumps(payloads.build(index, project)).encode()
+
+
+def _build_filter(query: Mapping[str, str]) -> Callable[[int], bool]:
+    """Get a predicate matching generated builds by the supported filters."""
+    definitions = (
+        {int(id) for id in query["definitions"].split(",")}
+        if "definitions" in query
+        else None
+    )
+    results = set(query["resultFilter"].split(",")) if "resultFilter" in query else None
+    branch = query.get("branchName")
+
+    def _matches(index: int) -> bool:
+        return (
+            (definitions is None or payloads.build_definition(index) in definitions)
+            and (results is None or payloads.build_result(index) in results)
+            and (branch is None or payloads.build_branch(index) == branch)
+        )
+
+    return _matches
+
+
+def _list_body(items: list[bytes]) -> bytes:
+    """Get an Azure DevOps list response from encoded items."""
+    return b'{"count":%d,"value":[%b]}' % (len(items), b",".join(items))
+
+
+class FakeDevOpsServer:
+    """aiohttp application standing in for the endpoints DevOpsClient uses."""
+
+    def __init__(self, config: ServerConfig) -> None:
+        """Initialize."""
+        self._config: ServerConfig = config
+        self._random: random.Random = random.Random(config.seed)
+        self._requests: int = 0
+
+    def application(self) -> web.Application:
+        """Get the aiohttp application."""
+        app = web.Application(middlewares=[self._inject])
+        organization = f"/{self._config.organization}"
+        project = f"{organization}/{{project}}"
+        app.add_routes(
+            [
+                web.get(f"{organization}/_apis/projects", self._projects),
+                web.get(f"{organization}/_apis/projects/{{project}}", self._project),
+                web.get(f"{project}/_apis/build/builds", self._builds),
+                web.get(f"{project}/_apis/build/builds/{{build_id}}", self._build),
+                web.get(
+                    f"{project}/_apis/work/teamsettings/iterations", self._iterations
+                ),
+                web.get(
+                    f"{project}/_apis/work/teamsettings/iterations/{{iteration_id}}",
+                    self._iteration,
+                ),
+                web.get(
+                    f"{project}/_apis/work/teamsettings/iterations/{{iteration_id}}/workitems",
+                    self._iteration_work_items,
+                ),
+                web.post(f"{project}/_apis/wit/wiql", self._wiql),
+                web.get(f"{project}/_apis/wit/workitems", self._work_items),
+                web.get(f"{project}/_apis/wit/workitems/{{id}}", self._work_item),
+                web.post(f"{project}/_apis/wit/workitemsbatch", self._work_items_batch),
+                web.get(f"{project}/_apis/wit/workitemtypes", self._work_item_types),
+            ]
+        )
+        return app
+
+    @web.middleware
+    async def _inject(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """Add latency, throttling and errors to responses."""
+        self._requests += 1
+        if self._config.latency:
+            await asyncio.sleep(self._config.latency)
+        if self._config.error_rate and self._random.random() < self._config.error_rate:
+            return web.Response(status=503, headers={RETRY_AFTER_HEADER: "0"})
+        response = await handler(request)
+        if self._config.throttle_every:
+            remaining = -self._requests % self._config.throttle_every
+            response.headers[RATE_LIMIT_LIMIT_HEADER] = str(self._config.throttle_every)
+            response.headers[RATE_LIMIT_REMAINING_HEADER] = str(remaining)
+            if remaining == 0:
+                response.headers[RATE_LIMIT_DELAY_HEADER] = "0.01"
+        return response
+
+    def _json(self, data: Any) -> web.Response:
+        """Get a JSON response."""
+        return web.json_response(data)
+
+    def _body(self, body: bytes, headers: dict[str, str] | None = None) -> web.Response:
+        """Get a response with an encoded JSON body."""
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    async def _projects(self, request: web.Request) -> web.Response:
+        """Get projects."""
+        return self._json(
+            {"count": 1, "value": [payloads.project(self._config.project)]}
+        )
+
+    async def _project(self, request: web.Request) -> web.Response:
+        """Get a project."""
+        return self._json(payloads.project(request.match_info["project"]))
+
+    async def _builds(self, request: web.Request) -> web.Response:
+        """Get a page of builds, newest first, following continuation tokens."""
+        project = request.match_info["project"]
+        if "buildIds" in request.query:
+            ids = [
+                int(build_id)
+                for build_id in request.query["buildIds"].split(",")
+                if 0 < int(build_id) <= self._config.builds
+            ]
+            return self._body(_list_body([_encoded_build(id, project) for id in ids]))
+
+        top = min(int(request.query.get("$top", BUILDS_PAGE_SIZE)), BUILDS_PAGE_SIZE)
+        start = int(request.query.get("continuationToken", self._config.builds))
+        matches = _build_filter(request.query)
+        ids: list[int] = []
+        id = start
+        while id > 0 and len(ids) < top:
+            if matches(id):
+                ids.append(id)
+            id -= 1
+        headers = {}
+        if id > 0 and "$top" not in request.query:
+            headers[CONTINUATION_TOKEN_HEADER] = str(id)
+        return self._body(
+            _list_body([_encoded_build(id, project) for id in ids]), headers
+        )
+
+    async def _build(self, request: web.Request) -> web.Response:
+        """Get a build."""
+        build_id = int(request.match_info["build_id"])
+        if not 0 < build_id <= self._config.builds:
+            return web.Response(status=404)
+        return self._body(_encoded_build(build_id, request.match_info["project"]))
+
+    async def _iterations(self, request: web.Request) -> web.Response:
+        """Get iterations."""
+        project = request.match_info["project"]
+        return self._json(
+            {
+                "count": ITERATIONS,
+                "value": [
+                    payloads.iteration(index, project, ITERATIONS // 2)
+                    for index in range(ITERATIONS)
+                ],
+            }
+        )
+
+    async def _iteration(self, request: web.Request) -> web.Response:
+        """Get an iteration."""
+        index = int(request.match_info["iteration_id"].split("-")[0])
+        return self._json(
+            payloads.iteration(index, request.match_info["project"], ITERATIONS // 2)
+        )
+
+    async def _iteration_work_items(self, request: web.Request) -> web.Response:
+        """Get the work items of an iteration."""
+        index = int(request.match_info["iteration_id"].split("-")[0])
+        return self._json(
+            {
+                "workItemRelations": [
+                    {"rel": None, "source": None, "target": {"id": id, "url": ""}}
+                    for id in range(index + 1, self._config.work_items + 1, ITERATIONS)
+                ],
+                "url": str(request.url),
+            }
+        )
+
+    async def _wiql(self, request: web.Request) -> web.Response:
+        """Run a WIQL query, listing every work item id up to the result cap."""
+        await request.read()
+        return self._json(
+            {
+                "queryType": "flat",
+                "queryResultType": "workItem",
+                "asOf": "2024-03-01T10:00:00.123Z",
+                "columns": [
+                    {"referenceName": "System.Id", "name": "ID", "url": ""},
+                ],
+                "workItems": [
+                    {"id": id, "url": ""}
+                    for id in range(
+                        1, min(self._config.work_items, WIQL_MAX_RESULTS) + 1
+                    )
+                ],
+            }
+        )
+
+    def _work_items_body(
+        self, project: str, ids: list[int], fields: tuple[str, ...] | None
+    ) -> bytes:
+        """Get the existing work items out of ids, omitting the others."""
+        return _list_body(
+            [
+                _encoded_work_item(id, project, fields)
+                for id in ids
+                if 0 < id <= self._config.work_items
+            ]
+        )
+
+    async def _work_items(self, request: web.Request) -> web.Response:
+        """Get work items by id."""
+        fields = request.query.get("fields")
+        return self._body(
+            self._work_items_body(
+                request.match_info["project"],
+                [int(id) for id in request.query["ids"].split(",")],
+                None if fields is None else tuple(fields.split(",")),
+            )
+        )
+
+    async def _work_item(self, request: web.Request) -> web.Response:
+        """Get a work item."""
+        id = int(request.match_info["id"])
+        if not 0 < id <= self._config.work_items:
+            return web.Response(status=404)
+        return self._body(_encoded_work_item(id, request.match_info["project"], None))
+
+    async def _work_items_batch(self, request: web.Request) -> web.Response:
+        """Get work items by id from a batch request."""
+        body = await request.json()
+        fields = body.get("fields")
+        return self._body(
+            self._work_items_body(
+                request.match_info["project"],
+                body["ids"],
+                None if fields is None else tuple(fields),
+            )
+        )
+
+    async def _work_item_types(self, request: web.Request) -> web.Response:
+        """Get work item types."""
+        return self._json(
+            {
+                "count": len(payloads.WORK_ITEM_TYPES),
+                "value": [
+                    payloads.work_item_type(name) for name in payloads.WORK_ITEM_TYPES
+                ],
+            }
+        )
+
+
+def _free_port() -> int:
+    """Get a free local port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def serve(config: ServerConfig, port: int) -> None:
+    """Serve the fake server until interrupted."""
+    web.run_app(
+        FakeDevOpsServer(config).application(),
+        host="127.0.0.1",
+        port=port,
+        print=None,
+        access_log=None,
+    )
+
+
+@contextmanager
+def run_server(config: ServerConfig) -> Iterator[str]:
+    """Run the fake server in another process, yielding its base URL."""
+    port = _free_port()
+    process = multiprocessing.get_context("spawn").Process(
+        target=serve, args=(config, port), daemon=True
+    )
+    process.start()
+    try:
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                if not process.is_alive():
+                    raise RuntimeError("Fake server exited on start") from None
+                time.sleep(SERVER_POLL_INTERVAL)
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.join()
+
+
+def main() -> None:
+    """Serve the fake server from the command line."""
+    defaults = ServerConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--work-items", type=int, default=defaults.work_items)
+    parser.add_argument("--builds", type=int, default=defaults.builds)
+    parser.add_argument("--latency", type=float, default=defaults.latency)
+    parser.add_argument("--throttle-every", type=int, default=defaults.throttle_every)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    arguments = parser.parse_args()
+    print(f"Serving on http://127.0.0.1:{arguments.port}")
+    serve(
+        ServerConfig(
+            work_items=arguments.work_items,
+            builds=arguments.builds,
+            latency=arguments.latency,
+            throttle_every=arguments.throttle_every,
+            error_rate=arguments.error_rate,
+        ),
+        arguments.port,
+    )
+
+
+if __name__ == "__main__":
+    main()
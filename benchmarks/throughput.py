@@ -0,0 +1,238 @@
+"""Benchmark client throughput against the local stand-in server.
+
+Reports requests and items per second, request latency percentiles and
+the client's peak traced memory for each scenario.
+"""
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import statistics
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+from aioazuredevops.batch import RequestBatcher
+from aioazuredevops.client import DevOpsClient
+from aioazuredevops.helper import (
+    WorkItemIndex,
+    work_item_types_states_filter,
+    work_items_by_type_and_state,
+)
+from aioazuredevops.models.work_item_type import Category
+from aioazuredevops.query import BuildQuery, BuildResult
+
+from .server import ServerConfig, run_server
+
+
+@dataclass(slots=True)
+class _Latencies:
+    """Request latencies recorded through an aiohttp trace config."""
+
+    values: list[float] = field(default_factory=list)
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Get a trace config recording each request's latency."""
+
+        async def _start(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceRequestStartParams,
+        ) -> None:
+            context.start = time.perf_counter()
+
+        async def _end(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceRequestEndParams,
+        ) -> None:
+            self.values.append(time.perf_counter() - context.start)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(_start)
+        trace_config.on_request_end.append(_end)
+        return trace_config
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    """Get a percentile of values, or 0 without values."""
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+async def _run(
+    name: str,
+    latencies: _Latencies,
+    scenario: Callable[[], Awaitable[int]],
+) -> None:
+    """Run a scenario, printing its throughput, latency and peak memory.
+
+    Tracing allocations slows the client down, so peak memory is measured
+    in a second, untimed run.
+    """
+    latencies.values.clear()
+    start = time.perf_counter()
+    items = await scenario()
+    elapsed = time.perf_counter() - start
+    requests = len(latencies.values)
+    latency_values = list(latencies.values)
+
+    tracemalloc.start()
+    await scenario()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(
+        f"{name:>28}: {requests / elapsed:8.1f} req/s {items / elapsed:10.0f} items/s "
+        f"p50 {_percentile(latency_values, 50) * 1000:7.2f} ms "
+        f"p99 {_percentile(latency_values, 99) * 1000:7.2f} ms "
+        f"peak {peak / 2**20:7.1f} MiB"
+    )
+
+
+async def _benchmark(base_url: str, config: ServerConfig, concurrency: int) -> None:
+    """Run every scenario against the server at base_url."""
+    organization, project = config.organization, config.project
+    latencies = _Latencies()
+    async with aiohttp.ClientSession(
+        trace_configs=[latencies.trace_config()]
+    ) as session:
+        client = DevOpsClient(session, base_url=base_url)
+        batched = DevOpsClient(session, base_url=base_url, batcher=RequestBatcher())
+
+        # WIQL caps its results, so list every id instead
+        ids = list(range(1, config.work_items + 1))
+        work_item_types = await client.get_work_item_types(organization, project)
+        assert work_item_types is not None
+        work_items: list[Any] = []
+        # Warm up the server, which encodes each work item once
+        await client.get_work_items(organization, project, ids, concurrency)
+
+        async def _get_work_item_ids() -> int:
+            return len(await client.get_work_item_ids(organization, project) or [])
+
+        async def _get_work_items() -> int:
+            work_items[:] = (
+                await client.get_work_items(organization, project, ids, concurrency)
+                or []
+            )
+            return len(work_items)
+
+        async def _get_work_items_batch() -> int:
+            result = await client.get_work_items(
+                organization, project, ids, concurrency, use_batch=True
+            )
+            return len(result or [])
+
+        async def _get_work_items_lazy() -> int:
+            result = await client.get_work_items(
+                organization, project, ids, concurrency, lazy=True
+            )
+            return sum(1 for work_item in result or [] if work_item.fields.state)
+
+        async def _iter_builds() -> int:
+            return sum([1 async for _ in client.iter_builds(organization, project)])
+
+        async def _get_builds() -> int:
+            return len(await client.get_builds(organization, project, "") or [])
+
+        async def _get_builds_filtered_client() -> int:
+            builds: list[Any] = [
+                build
+                async for build in client.iter_builds(organization, project)
+                if build.definition is not None
+                and build.definition.build_id == 3
+                and build.result == BuildResult.FAILED
+            ]
+            return len(builds)
+
+        query = BuildQuery(definitions=(3,), result_filter=(BuildResult.FAILED,))
+
+        async def _get_builds_filtered_server() -> int:
+            builds: list[Any] = [
+                build
+                async for build in client.iter_builds(organization, project, query)
+            ]
+            return len(builds)
+
+        async def _get_build(devops_client: DevOpsClient) -> int:
+            builds = await asyncio.gather(
+                *(
+                    devops_client.get_build(organization, project, build_id)
+                    for build_id in range(1, min(config.builds, 100) + 1)
+                )
+            )
+            return sum(build is not None for build in builds)
+
+        async def _get_work_item(devops_client: DevOpsClient) -> int:
+            work_items = await asyncio.gather(
+                *(
+                    devops_client.get_work_item(organization, project, id)
+                    for id in ids[:100]
+                )
+            )
+            return sum(work_item is not None for work_item in work_items)
+
+        async def _helpers() -> int:
+            states = work_item_types_states_filter(
+                work_item_types, ignored_categories=[Category.COMPLETED]
+            )
+            index = WorkItemIndex(work_items)
+            grouped = work_items_by_type_and_state(
+                work_item_types, index, ignored_categories=[Category.COMPLETED]
+            )
+            return len(states) + sum(
+                len(state.work_items)
+                for work_item_type in grouped
+                for state in work_item_type.state_items
+            )
+
+        print(
+            f"{len(ids)} work items, {config.builds} builds, "
+            f"concurrency {concurrency}, latency {config.latency * 1000:.0f} ms"
+        )
+        await _run("get_work_item_ids", latencies, _get_work_item_ids)
+        await _run("get_work_items", latencies, _get_work_items)
+        await _run("get_work_items(batch)", latencies, _get_work_items_batch)
+        await _run("get_work_items(lazy)", latencies, _get_work_items_lazy)
+        await _run("get_builds", latencies, _get_builds)
+        await _run("iter_builds", latencies, _iter_builds)
+        await _run("filter builds(client)", latencies, _get_builds_filtered_client)
+        await _run("filter builds(server)", latencies, _get_builds_filtered_server)
+        await _run("get_build x100", latencies, lambda: _get_build(client))
+        await _run("get_build x100(batched)", latencies, lambda: _get_build(batched))
+        await _run("get_work_item x100", latencies, lambda: _get_work_item(client))
+        await _run(
+            "get_work_item x100(batched)", latencies, lambda: _get_work_item(batched)
+        )
+        await _run("helpers", latencies, _helpers)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    defaults = ServerConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--work-items", type=int, default=defaults.work_items)
+    parser.add_argument("--builds", type=int, default=defaults.builds)
+    parser.add_argument("--latency", type=float, default=defaults.latency)
+    parser.add_argument("--throttle-every", type=int, default=defaults.throttle_every)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--concurrency", type=int, default=4)
+    arguments = parser.parse_args()
+    config = ServerConfig(
+        work_items=arguments.work_items,
+        builds=arguments.builds,
+        latency=arguments.latency,
+        throttle_every=arguments.throttle_every,
+        error_rate=arguments.error_rate,
+    )
+    with run_server(config) as base_url:
+        asyncio.run(_benchmark(base_url, config, arguments.concurrency))
+
+
+if __name__ == "__main__":
+    main()
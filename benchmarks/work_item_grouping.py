@@ -0,0 +1,119 @@
+"""Benchmark grouping work items by type and state."""
+
+from datetime import UTC, datetime
+import timeit
+
+from aioazuredevops.helper import WorkItemIndex, work_items_by_type_and_state
+from aioazuredevops.models.work_item import WorkItem, WorkItemFields
+from aioazuredevops.models.work_item_type import Category, Icon, State, WorkItemType
+
+TYPES = 30
+STATES = 8
+COUNT = 50_000
+NUMBER = 3
+DATE = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _scan(
+    work_item_types: list[WorkItemType], work_items: list[WorkItem]
+) -> list[list[list[WorkItem]]]:
+    """Group by rescanning every work item for every state of every type."""
+    return [
+        [
+            [
+                item
+                for item in work_items
+                if item.fields.work_item_type == work_item_type.name
+                and item.fields.state == state.name
+            ]
+            for state in work_item_type.states
+        ]
+        for work_item_type in work_item_types
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    states = [
+        State(name=f"State {index}", color="ffffff", category=Category.IN_PROGRESS)
+        for index in range(STATES)
+    ]
+    work_item_types = [
+        WorkItemType(
+            name=f"Type {index}",
+            reference_name=f"Custom.Type{index}",
+            description="",
+            color="ffffff",
+            icon=Icon(id="", url=""),
+            is_disabled=False,
+            xml_form="",
+            fields=[],
+            field_instances=[],
+            transitions={},
+            states=states,
+            url="",
+        )
+        for index in range(TYPES)
+    ]
+    work_items = [
+        WorkItem(
+            id=index,
+            rev=1,
+            fields=WorkItemFields(
+                area_path="",
+                team_project="",
+                iteration_path="",
+                work_item_type=f"Type {index % TYPES}",
+                state=f"State {index % STATES}",
+                reason="",
+                assigned_to=None,
+                created_date=DATE,
+                created_by=None,
+                changed_date=DATE,
+                changed_by=None,
+                comment_count=0,
+                title="",
+                microsoft_vsts_common_state_change_date=DATE,
+                microsoft_vsts_common_priority=None,
+            ),
+            url="",
+        )
+        for index in range(COUNT)
+    ]
+    index = WorkItemIndex(work_items)
+
+    print(f"Grouping {COUNT} work items over {TYPES} types x {STATES} states")
+    scan = min(
+        timeit.repeat(lambda: _scan(work_item_types, work_items), number=1, repeat=1)
+    )
+    grouped = (
+        min(
+            timeit.repeat(
+                lambda: work_items_by_type_and_state(
+                    work_item_types, work_items, [Category.IN_PROGRESS]
+                ),
+                number=NUMBER,
+                repeat=3,
+            )
+        )
+        / NUMBER
+    )
+    indexed = (
+        min(
+            timeit.repeat(
+                lambda: index.by_type_and_state(
+                    work_item_types, [Category.IN_PROGRESS]
+                ),
+                number=NUMBER,
+                repeat=3,
+            )
+        )
+        / NUMBER
+    )
+    print(f"       scan: {scan * 1000:9.3f} ms")
+    print(f"    grouped: {grouped * 1000:9.3f} ms ({scan / grouped:.0f}x)")
+    print(f"    indexed: {indexed * 1000:9.3f} ms ({scan / indexed:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark a WorkItemTable against a list of work items."""
+
+from collections import Counter
+import timeit
+import tracemalloc
+from typing import Any
+
+from aioazuredevops.decode import work_item_from_json
+from aioazuredevops.table import WorkItemTable
+
+from .payloads import work_items
+
+COUNT = 100_000
+NUMBER = 10
+
+
+def _traced[T](factory: Any) -> tuple[T, int]:
+    """Get the result of factory and the bytes it still holds."""
+    tracemalloc.start()
+    result = factory()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main() -> None:
+    """Run the benchmark."""
+    data = work_items(COUNT)["value"]
+    rows, rows_size = _traced(
+        lambda: [work_item_from_json(work_item) for work_item in data]
+    )
+    table, table_size = _traced(lambda: WorkItemTable(rows))
+    print(f"{COUNT} work items")
+    print(
+        f"   Memory: {rows_size / 2**20:.1f} MiB list, {table_size / 2**20:.1f} MiB table"
+    )
+
+    def _filter_rows() -> list:
+        return [
+            row
+            for row in rows
+            if row.fields.state in {"New", "Active"}
+            and row.fields.work_item_type == "Bug"
+        ]
+
+    def _filter_table() -> list[int]:
+        return table.where(state=["New", "Active"], work_item_type="Bug")
+
+    def _count_rows() -> Counter:
+        return Counter(row.fields.area_path for row in rows)
+
+    def _count_table() -> dict:
+        return table.count_by("area_path")
+
+    for name, list_scan, table_scan in (
+        ("Filter", _filter_rows, _filter_table),
+        ("Count by", _count_rows, _count_table),
+    ):
+        list_time = min(timeit.repeat(list_scan, number=NUMBER, repeat=3)) / NUMBER
+        table_time = min(timeit.repeat(table_scan, number=NUMBER, repeat=3)) / NUMBER
+        print(
+            f"{name:>9}: {list_time * 1000:.1f} ms list, "
+            f"{table_time * 1000:.1f} ms table"
+        )
+
+
+if __name__ == "__main__":
+    main()
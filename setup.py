@@ -20,6 +20,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/timmo001/aioazuredevops",
     install_requires=requirements,
-    packages=find_packages(exclude=["tests", "generator"]),
+    extras_require={"speedups": ["ciso8601>=2.3.0", "orjson>=3.9.0"]},
+    packages=find_packages(exclude=["benchmarks", "tests", "generator"]),
     python_requires=">=3.11",
 )
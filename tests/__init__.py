@@ -2,10 +2,15 @@
 
 from typing import Final
 
+from aioazuredevops.client import WORK_ITEM_FIELDS
+
 ORGANIZATION: Final[str] = "testorg"
 PROJECT: Final[str] = "testproject"
 PAT: Final[str] = "testpat"
 
+# Commas in mocked query strings are matched double encoded
+WORK_ITEM_FIELDS_PARAMETER: Final[str] = "%252C".join(WORK_ITEM_FIELDS)
+
 
 RESPONSE_JSON_BASIC: Final[dict] = {"test": "test"}
 
@@ -134,7 +139,7 @@ RESPONSE_JSON_DEVOPS_ITERATION_WORK_ITEMS: Final[dict] = {
 RESPONSE_JSON_DEVOPS_WIQL_RESULT: Final[dict] = {
     "queryType": "testqueryType",
     "queryResultType": "testqueryResultType",
-    "asOf": "testasOf",
+    "asOf": "2021-01-15T12:00:00.123Z",
     "columns": [
         {
             "referenceName": "testreferenceName",
@@ -157,8 +162,8 @@ RESPONSE_JSON_DEVOPS_WORK_ITEM: Final[dict] = {
         "System.WorkItemType": "testWorkItemType",
         "System.State": "testState",
         "System.Reason": "testReason",
-        "System.CreatedDate": "testCreatedDate",
-        "System.ChangedDate": "testChangedDate",
+        "System.CreatedDate": "2021-01-02T03:04:05.67Z",
+        "System.ChangedDate": "2021-01-10T11:12:13.1234567Z",
         "System.CommentCount": 1,
         "Microsoft.VSTS.Common.Priority": 1,
     },
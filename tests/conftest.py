@@ -1,6 +1,7 @@
 """Fixtures for testing."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
+from functools import partial
 
 from aiohttp import ClientSession
 from aioresponses import aioresponses
@@ -22,6 +23,7 @@ from . import (
     RESPONSE_JSON_DEVOPS_WORK_ITEM,
     RESPONSE_JSON_DEVOPS_WORK_ITEM_TYPES,
     RESPONSE_JSON_DEVOPS_WORK_ITEMS,
+    WORK_ITEM_FIELDS_PARAMETER,
 )
 
 
@@ -102,19 +104,19 @@ def mock_aioresponse():
             repeat=True,
         )
         mocker.get(
-            f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&ids=1",
+            f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={WORK_ITEM_FIELDS_PARAMETER}&ids=1",
             payload=RESPONSE_JSON_DEVOPS_WORK_ITEMS,
             status=200,
             repeat=True,
         )
         mocker.get(
-            f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&ids={'%252C'.join(str(i) for i in [1]*200)}",
+            f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={WORK_ITEM_FIELDS_PARAMETER}&ids={'%252C'.join(str(i) for i in [1]*200)}",
             payload=RESPONSE_JSON_DEVOPS_WORK_ITEMS,
             status=200,
             repeat=True,
         )
         mocker.get(
-            f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&ids={'%252C'.join(str(i) for i in [1]*100)}",
+            f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={WORK_ITEM_FIELDS_PARAMETER}&ids={'%252C'.join(str(i) for i in [1]*100)}",
             payload=RESPONSE_JSON_DEVOPS_WORK_ITEMS,
             status=200,
             repeat=True,
@@ -140,3 +142,10 @@ async def devops_client() -> AsyncGenerator[DevOpsClient, None]:
     """Return a DevOpsClient."""
     async with ClientSession() as session:
         yield DevOpsClient(session=session)
+
+
+@pytest.fixture
+async def make_devops_client() -> AsyncGenerator[Callable[..., DevOpsClient], None]:
+    """Return a factory of DevOpsClients sharing a client session."""
+    async with ClientSession() as session:
+        yield partial(DevOpsClient, session=session)
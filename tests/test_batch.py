@@ -0,0 +1,157 @@
+"""Test the batch module."""
+
+import asyncio
+from collections.abc import Callable
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aioresponses import aioresponses
+import pytest
+
+from aioazuredevops.batch import RequestBatcher
+from aioazuredevops.client import DevOpsClient
+
+from . import (
+    ORGANIZATION,
+    PROJECT,
+    RESPONSE_JSON_DEVOPS_BUILD,
+    RESPONSE_JSON_DEVOPS_WORK_ITEM,
+)
+
+MISSING_ID = 404
+
+
+@pytest.mark.asyncio
+async def test_batcher() -> None:
+    """Test lookups made together are fetched together."""
+    batcher = RequestBatcher()
+    fetched: list[list[int]] = []
+
+    async def _fetch(items: list[int]) -> dict[int, str]:
+        fetched.append(items)
+        return {item: str(item) for item in items if item != MISSING_ID}
+
+    assert await asyncio.gather(
+        batcher.load("a", 1, _fetch, 10),
+        batcher.load("a", 2, _fetch, 10),
+        batcher.load("a", 1, _fetch, 10),
+        batcher.load("a", MISSING_ID, _fetch, 10),
+        batcher.load("b", 1, _fetch, 10),
+    ) == ["1", "2", "1", None, "1"]
+    assert fetched == [[1, 2, MISSING_ID], [1]]
+    assert batcher.pending == 0
+
+    # Full batches are fetched at once
+    fetched.clear()
+    assert await asyncio.gather(
+        *(batcher.load("a", item, _fetch, 2) for item in range(5))
+    ) == ["0", "1", "2", "3", "4"]
+    assert fetched == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_delay() -> None:
+    """Test lookups are collected for the delay."""
+    batcher = RequestBatcher(delay=0.01)
+    assert batcher.delay == 0.01
+    fetched: list[list[int]] = []
+
+    async def _fetch(items: list[int]) -> dict[int, int]:
+        fetched.append(items)
+        return {item: item for item in items}
+
+    async def _load_later(item: int) -> int | None:
+        await asyncio.sleep(0)
+        return await batcher.load("a", item, _fetch, 10)
+
+    first = asyncio.create_task(batcher.load("a", 1, _fetch, 10))
+    await asyncio.sleep(0)
+    assert batcher.pending == 1
+    assert await asyncio.gather(first, _load_later(2)) == [1, 2]
+    assert fetched == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_error() -> None:
+    """Test a failed fetch raises in every caller."""
+    batcher = RequestBatcher()
+
+    async def _fetch(items: list[int]) -> dict[int, int]:
+        raise TimeoutError
+
+    results = await asyncio.gather(
+        batcher.load("a", 1, _fetch, 10),
+        batcher.load("a", 2, _fetch, 10),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, TimeoutError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_client_batcher(
+    make_devops_client: Callable[..., DevOpsClient],
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the client batches builds and work items requested together."""
+    mock_aioresponse.passthrough_unmatched = True
+    requests: list[str] = []
+
+    async def _builds(request: web.Request) -> web.Response:
+        requests.append(request.path_qs)
+        return web.json_response(
+            {
+                "value": [
+                    {**RESPONSE_JSON_DEVOPS_BUILD, "id": int(build_id)}
+                    for build_id in request.query["buildIds"].split(",")
+                    if int(build_id) != MISSING_ID
+                ]
+            }
+        )
+
+    async def _work_items(request: web.Request) -> web.Response:
+        requests.append(request.path_qs)
+        assert "fields" not in request.query
+        return web.json_response(
+            {
+                "value": [
+                    {**RESPONSE_JSON_DEVOPS_WORK_ITEM, "id": int(id)}
+                    for id in request.query["ids"].split(",")
+                ]
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get(f"/{ORGANIZATION}/{PROJECT}/_apis/build/builds", _builds)
+    app.router.add_get(f"/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems", _work_items)
+
+    async with TestServer(app) as server:
+        devops_client = make_devops_client(
+            base_url=str(server.make_url("")), batcher=RequestBatcher()
+        )
+        assert devops_client.batcher is not None
+        context = devops_client.project(ORGANIZATION, PROJECT)
+
+        builds = await asyncio.gather(
+            *(context.get_build(build_id) for build_id in (1, 2, 3, MISSING_ID))
+        )
+        assert [build.build_id if build else None for build in builds] == [
+            1,
+            2,
+            3,
+            None,
+        ]
+        work_items = await asyncio.gather(*(context.get_work_item(id) for id in (1, 2)))
+        assert [work_item.id for work_item in work_items if work_item] == [1, 2]
+
+    assert len(requests) == 2
+    assert "buildIds=1,2,3,404" in requests[0]
+    assert "ids=1,2" in requests[1]
+
+
+@pytest.mark.asyncio
+async def test_get_work_item(devops_client: DevOpsClient) -> None:
+    """Test getting a work item without a batcher."""
+    work_item = await devops_client.get_work_item(ORGANIZATION, PROJECT, 1)
+    assert work_item is not None
+    assert work_item.id == 1
+    assert work_item.rev == 234
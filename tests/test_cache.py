@@ -0,0 +1,83 @@
+"""Test the cache module."""
+
+from collections.abc import Callable
+
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from aioazuredevops.cache import (
+    ETAG_HEADER,
+    IF_MODIFIED_SINCE_HEADER,
+    IF_NONE_MATCH_HEADER,
+    LAST_MODIFIED_HEADER,
+    ResponseCache,
+)
+from aioazuredevops.client import DEFAULT_API_VERSION, DEFAULT_BASE_URL, DevOpsClient
+
+from . import ORGANIZATION, RESPONSE_JSON_DEVOPS_WORK_ITEM_TYPES
+
+CACHED_PROJECT_NAME = "cachedproject"
+
+
+def test_response_cache() -> None:
+    """Test the response cache stores entries with validators."""
+    cache = ResponseCache(max_entries=2)
+
+    cache.store("a", {}, "value")
+    assert cache.get("a") is None
+
+    cache.store("a", {ETAG_HEADER: '"1"'}, "a")
+    cache.store("b", {LAST_MODIFIED_HEADER: "yesterday"}, "b")
+    assert (entry := cache.get("a")) is not None
+    assert entry.validators == {IF_NONE_MATCH_HEADER: '"1"'}
+    assert (entry := cache.get("b")) is not None
+    assert entry.validators == {IF_MODIFIED_SINCE_HEADER: "yesterday"}
+
+    # The least recently used entry is evicted
+    cache.store("c", {ETAG_HEADER: '"3"'}, "c")
+    assert len(cache) == 2
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_response_cache_client(
+    make_devops_client: Callable[..., DevOpsClient],
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the client revalidates cached responses."""
+    url = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{CACHED_PROJECT_NAME}/_apis/wit/workitemtypes?api-version={DEFAULT_API_VERSION}"
+    mock_aioresponse.get(
+        url,
+        payload=RESPONSE_JSON_DEVOPS_WORK_ITEM_TYPES,
+        status=200,
+        headers={ETAG_HEADER: '"abc"'},
+    )
+    mock_aioresponse.get(
+        url,
+        status=304,
+    )
+
+    cache = ResponseCache()
+    devops_client = make_devops_client(cache=cache)
+
+    assert devops_client.cache is cache
+
+    work_item_types = await devops_client.get_work_item_types(
+        organization=ORGANIZATION,
+        project=CACHED_PROJECT_NAME,
+    )
+    cached_work_item_types = await devops_client.get_work_item_types(
+        organization=ORGANIZATION,
+        project=CACHED_PROJECT_NAME,
+    )
+
+    assert work_item_types is not None
+    assert cached_work_item_types is work_item_types
+
+    requests = mock_aioresponse.requests[("GET", URL(url))]
+    assert "headers" not in requests[0].kwargs
+    assert requests[1].kwargs["headers"] == {IF_NONE_MATCH_HEADER: '"abc"'}
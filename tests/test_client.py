@@ -1,15 +1,39 @@
 """Test the http client module."""
 
+import asyncio
+from collections.abc import Callable
+from types import SimpleNamespace
+
+from aiohttp import ClientError, ClientSession, TCPConnector, TraceConfig, web
+from aiohttp.test_utils import TestServer
 from aioresponses import aioresponses
 import pytest
 from syrupy.assertion import SnapshotAssertion
-
-from aioazuredevops.client import DEFAULT_API_VERSION, DEFAULT_BASE_URL, DevOpsClient
-
-from . import ORGANIZATION, PAT, PROJECT
+from yarl import URL
+
+from aioazuredevops.client import (
+    CONTINUATION_TOKEN_HEADER,
+    DEFAULT_API_VERSION,
+    DEFAULT_BASE_URL,
+    WORK_ITEM_FIELDS,
+    DevOpsClient,
+)
+
+from . import (
+    ORGANIZATION,
+    PAT,
+    PROJECT,
+    RESPONSE_JSON_DEVOPS_BUILD,
+    RESPONSE_JSON_DEVOPS_BUILDS,
+    RESPONSE_JSON_DEVOPS_PROJECT,
+    RESPONSE_JSON_DEVOPS_WORK_ITEMS,
+    WORK_ITEM_FIELDS_PARAMETER,
+)
 
 BAD_PROJECT_NAME = "badproject"
 EMPTY_PROJECT_NAME = "emptyproject"
+PAGED_PROJECT_NAME = "pagedproject"
+TIMEOUT_PROJECT_NAME = "timeoutproject"
 
 
 @pytest.mark.asyncio
@@ -148,6 +172,90 @@ async def test_get_builds(
     assert empty_builds is None
 
 
+@pytest.mark.asyncio
+async def test_iter_builds(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the iter_builds method."""
+    builds = [
+        build
+        async for build in devops_client.iter_builds(
+            organization=ORGANIZATION,
+            project=PROJECT,
+        )
+    ]
+
+    assert builds == await devops_client.get_builds(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        parameters="",
+    )
+
+    # Test following continuation tokens
+    for prefetch in (False, True):
+        mock_aioresponse.get(
+            f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PAGED_PROJECT_NAME}/_apis/build/builds?api-version={DEFAULT_API_VERSION}",
+            payload=RESPONSE_JSON_DEVOPS_BUILDS,
+            status=200,
+            headers={CONTINUATION_TOKEN_HEADER: "page2"},
+        )
+        mock_aioresponse.get(
+            f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PAGED_PROJECT_NAME}/_apis/build/builds?api-version={DEFAULT_API_VERSION}&continuationToken=page2",
+            payload=RESPONSE_JSON_DEVOPS_BUILDS,
+            status=200,
+        )
+
+        paged_builds = [
+            build
+            async for build in devops_client.iter_builds(
+                organization=ORGANIZATION,
+                project=PAGED_PROJECT_NAME,
+                prefetch=prefetch,
+            )
+        ]
+
+        assert paged_builds == builds * 2
+
+    # Test a failed continuation page raises instead of truncating
+    for prefetch in (False, True):
+        mock_aioresponse.get(
+            f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PAGED_PROJECT_NAME}/_apis/build/builds?api-version={DEFAULT_API_VERSION}",
+            payload=RESPONSE_JSON_DEVOPS_BUILDS,
+            status=200,
+            headers={CONTINUATION_TOKEN_HEADER: "page2"},
+        )
+        mock_aioresponse.get(
+            f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PAGED_PROJECT_NAME}/_apis/build/builds?api-version={DEFAULT_API_VERSION}&continuationToken=page2",
+            status=500,
+        )
+
+        partial_builds = []
+        with pytest.raises(ClientError):
+            async for build in devops_client.iter_builds(
+                organization=ORGANIZATION,
+                project=PAGED_PROJECT_NAME,
+                prefetch=prefetch,
+            ):
+                partial_builds.append(build)
+
+        assert partial_builds == builds
+
+    # Test with bad request
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{BAD_PROJECT_NAME}/_apis/build/builds?api-version={DEFAULT_API_VERSION}",
+        status=400,
+    )
+
+    assert [
+        build
+        async for build in devops_client.iter_builds(
+            organization=ORGANIZATION,
+            project=BAD_PROJECT_NAME,
+        )
+    ] == []
+
+
 @pytest.mark.asyncio
 async def test_get_build(
     devops_client: DevOpsClient,
@@ -348,6 +456,46 @@ async def test_get_iteration_work_items(
     assert empty_iteration_work_items is None
 
 
+@pytest.mark.asyncio
+async def test_base_url(
+    make_devops_client: Callable[..., DevOpsClient],
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test requests are sent to the base URL."""
+    base_url = "https://devops.example.com/tfs"
+    mock_aioresponse.get(
+        f"{base_url}/{ORGANIZATION}/{PROJECT}/_apis/build/builds/1?api-version={DEFAULT_API_VERSION}",
+        payload=RESPONSE_JSON_DEVOPS_BUILD,
+    )
+    devops_client = make_devops_client(base_url=f"{base_url}/")
+    assert devops_client.base_url == base_url
+
+    build = await devops_client.get_build(ORGANIZATION, PROJECT, 1)
+
+    assert build is not None
+    assert build.build_id == 1
+
+
+@pytest.mark.asyncio
+async def test_get_work_item_ids_from_wiql_states(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test duplicate states are only sent once."""
+    assert await devops_client.get_work_item_ids_from_wiql(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        states=["New", "Active", "New"],
+    )
+
+    url = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/wiql?api-version={DEFAULT_API_VERSION}"
+    assert (
+        mock_aioresponse.requests[("POST", URL(url))][0]
+        .kwargs["json"]["query"]
+        .endswith(" AND [System.State] IN('New','Active')")
+    )
+
+
 @pytest.mark.asyncio
 async def test_get_work_items_ids(
     devops_client: DevOpsClient,
@@ -427,7 +575,7 @@ async def test_get_work_items(
 
     # Test bad request
     mock_aioresponse.get(
-        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{BAD_PROJECT_NAME}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&ids=1",
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{BAD_PROJECT_NAME}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={WORK_ITEM_FIELDS_PARAMETER}&ids=1",
         status=400,
     )
 
@@ -441,7 +589,7 @@ async def test_get_work_items(
 
     # Test with empty response
     mock_aioresponse.get(
-        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{EMPTY_PROJECT_NAME}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&ids=1",
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{EMPTY_PROJECT_NAME}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={WORK_ITEM_FIELDS_PARAMETER}&ids=1",
         payload=None,
         status=200,
     )
@@ -455,6 +603,233 @@ async def test_get_work_items(
     assert empty_work_items is None
 
 
+@pytest.mark.asyncio
+async def test_get_work_items_projection(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the get_work_items method fields and use_batch options."""
+    work_items = await devops_client.get_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        ids=[1],
+    )
+
+    # Test requesting every field
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&ids=1",
+        payload=RESPONSE_JSON_DEVOPS_WORK_ITEMS,
+        status=200,
+    )
+
+    assert (
+        await devops_client.get_work_items(
+            organization=ORGANIZATION,
+            project=PROJECT,
+            ids=[1],
+            fields=None,
+        )
+        == work_items
+    )
+
+    # Test requesting a subset of the fields, the others are None
+    projection = ("System.State", "System.Title")
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={'%252C'.join(projection)}&ids=1",
+        payload={
+            **RESPONSE_JSON_DEVOPS_WORK_ITEMS,
+            "value": [
+                {
+                    **work_item,
+                    "fields": {
+                        name: value
+                        for name, value in work_item["fields"].items()
+                        if name in projection
+                    },
+                }
+                for work_item in RESPONSE_JSON_DEVOPS_WORK_ITEMS["value"]
+            ],
+        },
+        status=200,
+        repeat=True,
+    )
+
+    assert work_items is not None
+    for lazy in (False, True):
+        projected_work_items = await devops_client.get_work_items(
+            organization=ORGANIZATION,
+            project=PROJECT,
+            ids=[1],
+            fields=projection,
+            lazy=lazy,
+        )
+        assert projected_work_items is not None
+        projected_fields = projected_work_items[0].fields
+        assert projected_fields.state == work_items[0].fields.state
+        assert projected_fields.title == work_items[0].fields.title
+        assert projected_fields.area_path is None
+        assert projected_fields.changed_date is None
+
+    # Test the workitemsbatch endpoint
+    batch_url = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitemsbatch?api-version={DEFAULT_API_VERSION}"
+    mock_aioresponse.post(
+        batch_url,
+        payload=RESPONSE_JSON_DEVOPS_WORK_ITEMS,
+        status=200,
+        repeat=True,
+    )
+
+    assert (
+        await devops_client.get_work_items(
+            organization=ORGANIZATION,
+            project=PROJECT,
+            ids=[1],
+            use_batch=True,
+        )
+        == work_items
+    )
+    assert mock_aioresponse.requests[("POST", URL(batch_url))][0].kwargs["json"] == {
+        "ids": [1],
+        "errorPolicy": "omit",
+        "fields": list(WORK_ITEM_FIELDS),
+    }
+
+    # Test the workitemsbatch endpoint with bad request
+    mock_aioresponse.post(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{BAD_PROJECT_NAME}/_apis/wit/workitemsbatch?api-version={DEFAULT_API_VERSION}",
+        status=400,
+    )
+
+    bad_work_items = await devops_client.get_work_items(
+        organization=ORGANIZATION,
+        project=BAD_PROJECT_NAME,
+        ids=[1],
+        use_batch=True,
+    )
+
+    assert bad_work_items is None
+
+
+@pytest.mark.asyncio
+async def test_get_work_item_batch(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the get_work_item_batch method."""
+    work_item_batch = await devops_client.get_work_item_batch(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        ids=[1] * 300,
+        max_concurrency=2,
+    )
+
+    assert work_item_batch.work_items == await devops_client.get_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        ids=[1] * 300,
+    )
+    assert work_item_batch.failed_chunks == []
+
+    # Test with bad request
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{BAD_PROJECT_NAME}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={WORK_ITEM_FIELDS_PARAMETER}&ids=1",
+        status=400,
+    )
+
+    bad_work_item_batch = await devops_client.get_work_item_batch(
+        organization=ORGANIZATION,
+        project=BAD_PROJECT_NAME,
+        ids=[1],
+        max_concurrency=2,
+    )
+
+    assert bad_work_item_batch.work_items == []
+    assert bad_work_item_batch.failed_chunks == [[1]]
+
+    # Test client errors are reported, while get_work_items raises them
+    timeout_url = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{TIMEOUT_PROJECT_NAME}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={WORK_ITEM_FIELDS_PARAMETER}&ids=1"
+    mock_aioresponse.get(timeout_url, exception=TimeoutError(), repeat=True)
+
+    timeout_work_item_batch = await devops_client.get_work_item_batch(
+        organization=ORGANIZATION,
+        project=TIMEOUT_PROJECT_NAME,
+        ids=[1],
+    )
+    assert timeout_work_item_batch.failed_chunks == [[1]]
+
+    with pytest.raises(TimeoutError):
+        await devops_client.get_work_items(
+            organization=ORGANIZATION,
+            project=TIMEOUT_PROJECT_NAME,
+            ids=[1],
+        )
+
+    # Test a concurrency below one is rejected instead of blocking
+    with pytest.raises(ValueError, match="max_concurrency"):
+        await devops_client.get_work_item_batch(
+            organization=ORGANIZATION,
+            project=PROJECT,
+            ids=[1],
+            max_concurrency=0,
+        )
+    with pytest.raises(ValueError, match="max_concurrency"):
+        await devops_client.get_work_items(
+            organization=ORGANIZATION,
+            project=PROJECT,
+            ids=[1],
+            max_concurrency=0,
+        )
+
+
+@pytest.mark.asyncio
+async def test_iter_work_items(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the iter_work_items method."""
+    work_items = await devops_client.get_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        ids=[1] * 300,
+    )
+
+    for prefetch in (False, True):
+        assert [
+            work_item
+            async for work_item in devops_client.iter_work_items(
+                organization=ORGANIZATION,
+                project=PROJECT,
+                ids=[1] * 300,
+                prefetch=prefetch,
+            )
+        ] == work_items
+
+    # Test closing the iterator early
+    iterator = devops_client.iter_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        ids=[1] * 300,
+        prefetch=True,
+    )
+    assert await anext(iterator) == work_items[0]
+    await iterator.aclose()
+
+    # Test with bad request
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{BAD_PROJECT_NAME}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={WORK_ITEM_FIELDS_PARAMETER}&ids=1",
+        status=400,
+    )
+
+    assert [
+        work_item
+        async for work_item in devops_client.iter_work_items(
+            organization=ORGANIZATION,
+            project=BAD_PROJECT_NAME,
+            ids=[1],
+        )
+    ] == []
+
+
 @pytest.mark.asyncio
 async def test_get_work_item_types(
     devops_client: DevOpsClient,
@@ -512,3 +887,64 @@ async def test_get_work_item_types(
     )
 
     assert empty_work_item_types is None
+
+
+@pytest.mark.asyncio
+async def test_create() -> None:
+    """Test created clients own and close their session."""
+    async with DevOpsClient.create(limit_per_host=4) as devops_client:
+        session = devops_client.session
+        assert isinstance(session.connector, TCPConnector)
+        assert session.connector.limit_per_host == 4
+        assert not session.closed
+    assert session.closed
+
+    # Clients given a session leave it open
+    async with ClientSession() as session:
+        async with DevOpsClient(session) as devops_client:
+            pass
+        assert not session.closed
+
+
+@pytest.mark.asyncio
+async def test_connection_released(mock_aioresponse: aioresponses) -> None:
+    """Test connections are reused after responses that are not read."""
+    mock_aioresponse.passthrough_unmatched = True
+
+    async def _project(request: web.Request) -> web.Response:
+        if request.match_info["project"] != BAD_PROJECT_NAME:
+            return web.json_response(RESPONSE_JSON_DEVOPS_PROJECT)
+        # Send the body after the headers, so it is still unread on return
+        body = b'{"message": "Not found"}'
+        response = web.StreamResponse(status=404)
+        response.content_length = len(body)
+        await response.prepare(request)
+        await asyncio.sleep(0.01)
+        await response.write(body)
+        return response
+
+    connections = 0
+
+    async def _connection_created(
+        session: ClientSession, context: SimpleNamespace, params: object
+    ) -> None:
+        nonlocal connections
+        connections += 1
+
+    trace_config = TraceConfig()
+    trace_config.on_connection_create_end.append(_connection_created)
+    app = web.Application()
+    app.router.add_get(f"/{ORGANIZATION}/_apis/projects/{{project}}", _project)
+
+    async with (
+        TestServer(app) as server,
+        ClientSession(trace_configs=[trace_config]) as session,
+    ):
+        devops_client = DevOpsClient(session, base_url=str(server.make_url("")))
+        for _ in range(3):
+            assert (
+                await devops_client.get_project(ORGANIZATION, BAD_PROJECT_NAME) is None
+            )
+        assert await devops_client.get_project(ORGANIZATION, PROJECT) is not None
+
+    assert connections == 1
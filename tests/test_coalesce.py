@@ -0,0 +1,120 @@
+"""Test the coalesce module."""
+
+import asyncio
+from collections.abc import Callable
+
+from aioresponses import aioresponses
+import pytest
+
+from aioazuredevops.client import DEFAULT_API_VERSION, DEFAULT_BASE_URL, DevOpsClient
+from aioazuredevops.coalesce import CoalescePolicy, RequestCoalescer
+from aioazuredevops.lazy import LazyWorkItemFields
+from aioazuredevops.models.work_item import WorkItemFields
+
+from . import (
+    ORGANIZATION,
+    RESPONSE_JSON_DEVOPS_ITERATIONS,
+    RESPONSE_JSON_DEVOPS_WORK_ITEMS,
+    WORK_ITEM_FIELDS_PARAMETER,
+)
+
+COALESCED_PROJECT_NAME = "coalescedproject"
+
+
+@pytest.mark.asyncio
+async def test_request_coalescer() -> None:
+    """Test the request coalescer runs one factory per key in flight."""
+    coalescer = RequestCoalescer()
+    calls = 0
+    release = asyncio.Event()
+
+    async def _factory() -> list[int]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return [calls]
+
+    tasks = [
+        asyncio.create_task(coalescer.run("key", _factory)),
+        asyncio.create_task(coalescer.run("key", _factory)),
+    ]
+    await asyncio.sleep(0)
+    assert coalescer.in_flight == 1
+
+    release.set()
+    first, second = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert first is second
+    assert coalescer.in_flight == 0
+
+    # A later request runs the factory again
+    assert await coalescer.run("key", _factory) == [2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy",
+    [CoalescePolicy.SHARE, CoalescePolicy.COPY],
+)
+async def test_request_coalescer_client(
+    make_devops_client: Callable[..., DevOpsClient],
+    mock_aioresponse: aioresponses,
+    policy: CoalescePolicy,
+) -> None:
+    """Test the client shares identical requests in flight."""
+    # Only one response is mocked, a second request would fail
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{COALESCED_PROJECT_NAME}/_apis/work/teamsettings/iterations?api-version={DEFAULT_API_VERSION}",
+        payload=RESPONSE_JSON_DEVOPS_ITERATIONS,
+        status=200,
+    )
+
+    devops_client = make_devops_client(coalescer=RequestCoalescer(policy))
+
+    assert devops_client.coalescer is not None
+    assert devops_client.coalescer.policy == policy
+
+    first, second = await asyncio.gather(
+        devops_client.get_iterations(
+            organization=ORGANIZATION,
+            project=COALESCED_PROJECT_NAME,
+        ),
+        devops_client.get_iterations(
+            organization=ORGANIZATION,
+            project=COALESCED_PROJECT_NAME,
+        ),
+    )
+
+    assert first is not None
+    assert first == second
+    assert (first is second) == (policy == CoalescePolicy.SHARE)
+
+
+@pytest.mark.asyncio
+async def test_request_coalescer_decode(
+    make_devops_client: Callable[..., DevOpsClient],
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test callers sharing a request each decode it their own way."""
+    # Only one response is mocked, a second request would fail
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{COALESCED_PROJECT_NAME}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={WORK_ITEM_FIELDS_PARAMETER}&ids=1",
+        payload=RESPONSE_JSON_DEVOPS_WORK_ITEMS,
+        status=200,
+    )
+
+    devops_client = make_devops_client(coalescer=RequestCoalescer())
+
+    eager, lazy = await asyncio.gather(
+        devops_client.get_work_items(ORGANIZATION, COALESCED_PROJECT_NAME, [1]),
+        devops_client.get_work_items(
+            ORGANIZATION, COALESCED_PROJECT_NAME, [1], lazy=True
+        ),
+    )
+
+    assert eager is not None
+    assert lazy is not None
+    assert isinstance(eager[0].fields, WorkItemFields)
+    assert isinstance(lazy[0].fields, LazyWorkItemFields)
+    assert lazy[0].fields.state == eager[0].fields.state
@@ -0,0 +1,198 @@
+"""Test the decode module."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import sys
+
+import pytest
+
+from aioazuredevops.client import DevOpsClient
+from aioazuredevops.decode import (
+    IdentityMap,
+    JSONField,
+    build_from_json,
+    compile_decoder,
+    dict_of,
+    list_of,
+    parse_datetime,
+    work_item_from_json,
+    work_item_user_from_json,
+)
+
+from . import (
+    ORGANIZATION,
+    PROJECT,
+    RESPONSE_JSON_DEVOPS_BUILD,
+    RESPONSE_JSON_DEVOPS_WORK_ITEM,
+)
+
+USER_JSON = {"id": "testId", "displayName": "testDisplayName"}
+
+
+@dataclass
+class _Model:
+    """Model to decode."""
+
+    id: int
+    name: str | None
+    href: str | None
+    size: int
+    tags: list[str]
+    totals: dict[str, int] | None
+
+
+def test_compile_decoder() -> None:
+    """Test compiled decoders read paths, optional fields and converters."""
+    decode = compile_decoder(
+        _Model,
+        {
+            "id": "id",
+            "name": JSONField("name", str.upper, optional=True),
+            "href": JSONField(("_links", "self", "href"), optional=True),
+            "size": JSONField(("details", "size"), int),
+            "tags": JSONField(("details", "tags"), list_of(str.lower)),
+            "totals": JSONField("totals", dict_of(int), optional=True),
+        },
+    )
+
+    assert decode(
+        {
+            "id": 1,
+            "name": "test",
+            "_links": {"self": {"href": "testhref"}},
+            "details": {"size": "2", "tags": ["A", "B"]},
+            "totals": {"a": "3"},
+        }
+    ) == _Model(
+        id=1,
+        name="TEST",
+        href="testhref",
+        size=2,
+        tags=["a", "b"],
+        totals={"a": 3},
+    )
+    assert decode({"id": 1, "_links": {}, "details": {"size": 2, "tags": []}}) == (
+        _Model(id=1, name=None, href=None, size=2, tags=[], totals=None)
+    )
+    assert decode.__doc__ == "Create a _model from its JSON representation."
+
+    # Required fields still raise when missing
+    with pytest.raises(KeyError):
+        decode({"id": 1})
+
+
+def test_work_item_from_json() -> None:
+    """Test work items decode with optional fields missing."""
+    work_item = work_item_from_json(RESPONSE_JSON_DEVOPS_WORK_ITEM)
+
+    assert work_item.id == 1
+    assert work_item.fields.state == "testState"
+    assert work_item.fields.assigned_to is None
+    assert work_item.fields.microsoft_vsts_common_priority == 1
+
+
+def test_identity_map() -> None:
+    """Test objects with the same id share one instance within a map."""
+    identities = IdentityMap()
+    first = build_from_json(RESPONSE_JSON_DEVOPS_BUILD, identities)
+    second = build_from_json(dict(RESPONSE_JSON_DEVOPS_BUILD), identities)
+
+    assert first is not second
+    assert first.definition is second.definition
+    assert first.project is second.project
+
+    # Without a map, or with another one, equal objects are not shared
+    assert build_from_json(RESPONSE_JSON_DEVOPS_BUILD).project is not first.project
+    assert (
+        build_from_json(RESPONSE_JSON_DEVOPS_BUILD, IdentityMap()).project
+        is not first.project
+    )
+
+    # Objects are shared per decoder, even with the same id
+    user = work_item_user_from_json({**USER_JSON, "id": first.project.id}, identities)
+    assert user is not first.project
+    assert user is work_item_user_from_json(
+        {**USER_JSON, "id": first.project.id}, identities
+    )
+
+    # Objects without an id are never shared
+    assert work_item_user_from_json({}, identities) is not (
+        work_item_user_from_json({}, identities)
+    )
+
+
+def test_identity_map_refresh() -> None:
+    """Test changed objects replace their entry and entries are bounded."""
+    identities = IdentityMap(maxsize=2)
+    assert identities.maxsize == 2
+    user = work_item_user_from_json(USER_JSON, identities)
+
+    renamed = work_item_user_from_json(
+        {**USER_JSON, "displayName": "renamedName"}, identities
+    )
+    assert renamed is not user
+    assert renamed.display_name == "renamedName"
+    assert user.display_name == "testDisplayName"
+    assert (
+        work_item_user_from_json(
+            {**USER_JSON, "displayName": "renamedName"}, identities
+        )
+        is renamed
+    )
+
+    # The least recently shared entry is dropped
+    other = work_item_user_from_json({**USER_JSON, "id": "other"}, identities)
+    work_item_user_from_json({**USER_JSON, "displayName": "renamedName"}, identities)
+    work_item_user_from_json({**USER_JSON, "id": "third"}, identities)
+    assert len(identities) == 2
+    assert (
+        work_item_user_from_json({**USER_JSON, "id": "other"}, identities) is not other
+    )
+
+
+def test_interned_strings() -> None:
+    """Test repeated strings are interned."""
+    work_item = work_item_from_json(RESPONSE_JSON_DEVOPS_WORK_ITEM)
+    state = "".join(["test", "State"])
+
+    assert work_item.fields.state is sys.intern(state)
+    assert work_item_user_from_json(USER_JSON).display_name is sys.intern(
+        "".join(["testDisplay", "Name"])
+    )
+
+
+@pytest.mark.asyncio
+async def test_client_identity_map(
+    make_devops_client: Callable[..., DevOpsClient],
+) -> None:
+    """Test a client identity map shares objects across responses."""
+    identities = IdentityMap()
+    devops_client = make_devops_client(identity_map=identities)
+    assert devops_client.identity_map is identities
+
+    builds = await devops_client.get_builds(ORGANIZATION, PROJECT, "")
+    build = await devops_client.get_build(ORGANIZATION, PROJECT, 1)
+
+    assert builds is not None
+    assert build is not None
+    assert build.project is builds[0].project
+    assert build.definition is builds[0].definition
+    assert identities
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2021-01-02T03:04:05Z", datetime(2021, 1, 2, 3, 4, 5, tzinfo=UTC)),
+        ("2021-01-02T03:04:05.67Z", datetime(2021, 1, 2, 3, 4, 5, 670000, tzinfo=UTC)),
+        (
+            "2021-01-02T03:04:05.1234567Z",
+            datetime(2021, 1, 2, 3, 4, 5, 123456, tzinfo=UTC),
+        ),
+        ("testCreatedDate", None),
+    ],
+)
+def test_parse_datetime(value: str, expected: datetime | None) -> None:
+    """Test timestamps parse with any fraction length."""
+    assert parse_datetime(value) == expected
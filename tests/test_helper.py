@@ -1,20 +1,70 @@
 """Test helpers."""
 
+from datetime import UTC, datetime
+
 from aioresponses import aioresponses
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
 from aioazuredevops.client import DevOpsClient
+from aioazuredevops.decode import (
+    iteration_from_json,
+    work_item_from_json,
+    work_item_type_from_json,
+)
 from aioazuredevops.helper import (
+    IterationTimeline,
+    WorkItemIndex,
+    WorkItemTypeIndex,
     current_iteration,
     next_iteration,
     previous_iteration,
     work_item_types_states_filter,
     work_items_by_type_and_state,
 )
+from aioazuredevops.models.iteration import Iteration
+from aioazuredevops.models.work_item import WorkItem
 from aioazuredevops.models.work_item_type import Category
 
-from . import ORGANIZATION, PROJECT
+from . import (
+    ORGANIZATION,
+    PROJECT,
+    RESPONSE_JSON_DEVOPS_ITERATION,
+    RESPONSE_JSON_DEVOPS_WORK_ITEM,
+    RESPONSE_JSON_DEVOPS_WORK_ITEM_TYPES,
+)
+
+
+def _iteration(
+    name: str, start: str | None, finish: str | None, time_frame: str
+) -> Iteration:
+    """Get an iteration."""
+    return iteration_from_json(
+        {
+            **RESPONSE_JSON_DEVOPS_ITERATION,
+            "name": name,
+            "attributes": {
+                "startDate": start,
+                "finishDate": finish,
+                "timeFrame": time_frame,
+            },
+        }
+    )
+
+
+def _work_item(id: int, work_item_type: str, state: str) -> WorkItem:
+    """Get a work item of a type in a state."""
+    return work_item_from_json(
+        {
+            **RESPONSE_JSON_DEVOPS_WORK_ITEM,
+            "id": id,
+            "fields": {
+                **RESPONSE_JSON_DEVOPS_WORK_ITEM["fields"],
+                "System.WorkItemType": work_item_type,
+                "System.State": state,
+            },
+        }
+    )
 
 
 @pytest.mark.asyncio
@@ -74,6 +124,89 @@ async def test_next_iteration(
     assert next_iteration([]) is None
 
 
+def test_iteration_timeline() -> None:
+    """Test the IterationTimeline orders and looks up iterations by date."""
+    sprint_1 = _iteration(
+        "Sprint 1", "2021-01-04T00:00:00Z", "2021-01-15T00:00:00Z", "past"
+    )
+    sprint_2 = _iteration(
+        "Sprint 2", "2021-01-18T00:00:00Z", "2021-01-29T00:00:00Z", "current"
+    )
+    sprint_3 = _iteration(
+        "Sprint 3", "2021-02-01T00:00:00Z", "2021-02-12T00:00:00Z", "future"
+    )
+    timeline = IterationTimeline([sprint_3, sprint_1, sprint_2])
+
+    assert list(timeline) == [sprint_1, sprint_2, sprint_3]
+    assert len(timeline) == 3
+    assert timeline.current == sprint_2
+    assert timeline.previous == sprint_1
+    assert timeline.next == sprint_3
+    assert timeline.expires == datetime(2021, 1, 30, tzinfo=UTC)
+
+    assert timeline.at(datetime(2021, 1, 1, tzinfo=UTC)) is None
+    assert timeline.at(datetime(2021, 1, 4, tzinfo=UTC)) == sprint_1
+    # Iterations run through their finish date
+    assert timeline.at(datetime(2021, 1, 15, 12, tzinfo=UTC)) == sprint_1
+    assert timeline.at(datetime(2021, 1, 16, tzinfo=UTC)) is None
+    assert timeline.at(datetime(2021, 2, 12, 23, tzinfo=UTC)) == sprint_3
+    assert timeline.at(datetime(2021, 2, 13, tzinfo=UTC)) is None
+
+
+def test_iteration_timeline_edges() -> None:
+    """Test there is no previous or next iteration at the ends of the timeline."""
+    first = _iteration(
+        "Sprint 1", "2021-01-04T00:00:00Z", "2021-01-15T00:00:00Z", "current"
+    )
+    last = _iteration(
+        "Sprint 2", "2021-01-18T00:00:00Z", "2021-01-29T00:00:00Z", "future"
+    )
+
+    assert previous_iteration([first, last]) is None
+    assert next_iteration([first, last]) == last
+
+    last = _iteration(
+        "Sprint 2", "2021-01-18T00:00:00Z", "2021-01-29T00:00:00Z", "current"
+    )
+    first = _iteration(
+        "Sprint 1", "2021-01-04T00:00:00Z", "2021-01-15T00:00:00Z", "past"
+    )
+    assert previous_iteration([first, last]) == first
+    assert next_iteration([first, last]) is None
+
+    timeline = IterationTimeline([first])
+    assert timeline.current is None
+    assert timeline.expires is None
+
+
+def test_iteration_timeline_undated() -> None:
+    """Test iterations without dates follow the dated ones."""
+    sprint_1 = _iteration(
+        "Sprint 1", "2021-01-04T00:00:00Z", "2021-01-15T00:00:00Z", "past"
+    )
+    sprint_2 = _iteration(
+        "Sprint 2", "2021-01-18T00:00:00Z", "2021-01-29T00:00:00Z", "current"
+    )
+    sprint_3 = _iteration("Sprint 3", None, None, "future")
+    sprint_4 = _iteration("Sprint 4", None, None, "future")
+    iterations = [sprint_1, sprint_2, sprint_3, sprint_4]
+
+    assert current_iteration(iterations) == sprint_2
+    assert previous_iteration(iterations) == sprint_1
+    assert next_iteration(iterations) == sprint_3
+
+    timeline = IterationTimeline([sprint_4, sprint_2, sprint_3, sprint_1])
+    assert list(timeline) == [sprint_1, sprint_2, sprint_4, sprint_3]
+    assert timeline.expires == datetime(2021, 1, 30, tzinfo=UTC)
+    assert timeline.at(datetime(2021, 1, 20, tzinfo=UTC)) == sprint_2
+    assert timeline.at(datetime(2021, 3, 1, tzinfo=UTC)) is None
+
+    # An undated current iteration never expires
+    timeline = IterationTimeline([_iteration("Sprint 5", None, None, "current")])
+    assert timeline.current is not None
+    assert timeline.expires is None
+
+
 @pytest.mark.asyncio
 async def test_work_item_types_states_filter(
     devops_client: DevOpsClient,
@@ -100,6 +233,51 @@ async def test_work_item_types_states_filter(
     )
 
 
+def test_work_item_type_index() -> None:
+    """Test the WorkItemTypeIndex maps types, states and categories."""
+    work_item_type = RESPONSE_JSON_DEVOPS_WORK_ITEM_TYPES["value"][0]
+    bug = work_item_type_from_json({**work_item_type, "name": "Bug"})
+    task = work_item_type_from_json(
+        {
+            **work_item_type,
+            "name": "Task",
+            "states": [
+                {"name": "New", "color": "b2b2b2", "category": "Proposed"},
+                {"name": "Active", "color": "007acc", "category": "InProgress"},
+                {"name": "Released", "color": "c3d84c", "category": "Completed"},
+            ],
+        }
+    )
+    work_item_types = [bug, task]
+    index = WorkItemTypeIndex(work_item_types)
+
+    # States shared by both types are only listed once
+    assert index.states([Category.PROPOSED]) == ["New"]
+    assert index.states(ignored_categories=[Category.IN_PROGRESS]) == [
+        "New",
+        "Released",
+        "Closed",
+    ]
+    assert index.states() == []
+    assert work_item_types_states_filter(work_item_types, [Category.PROPOSED]) == [
+        "New"
+    ]
+    assert work_item_types_states_filter(index, [Category.PROPOSED]) == ["New"]
+    assert index.category_states(Category.COMPLETED) == ["Closed", "Released"]
+    assert index.category_states(Category.REMOVED) == []
+    assert index.type_states("Task") == task.states
+    assert index.type_states("Epic") == []
+    assert index.category("Released") == Category.RESOLVED
+    assert index.category("Released", "Task") == Category.COMPLETED
+    assert index.category("Active", "Bug") is None
+
+    # The same types, or equal types, do not rebuild the index
+    assert not index.update(work_item_types)
+    assert not index.update(list(work_item_types))
+    assert index.update([task])
+    assert index.states([Category.IN_PROGRESS]) == ["Active"]
+
+
 @pytest.mark.asyncio
 async def test_work_items_by_type_and_state(
     devops_client: DevOpsClient,
@@ -139,3 +317,49 @@ async def test_work_items_by_type_and_state(
         )
         == snapshot()
     )
+
+
+@pytest.mark.asyncio
+async def test_work_item_index(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the WorkItemIndex buckets by type and state as work items change."""
+    work_item_types = await devops_client.get_work_item_types(
+        organization=ORGANIZATION,
+        project=PROJECT,
+    )
+    assert work_item_types is not None
+    name = RESPONSE_JSON_DEVOPS_WORK_ITEM_TYPES["value"][0]["name"]
+
+    first = _work_item(1, name, "New")
+    other_type = _work_item(2, "otherType", "New")
+    index = WorkItemIndex([first, other_type])
+
+    assert len(index) == 2
+    assert index.get(name, "New") == [first]
+    assert index.get(name, "Ready") == []
+
+    # Work items of other types are not grouped under the state
+    result = work_items_by_type_and_state(work_item_types, index, [Category.PROPOSED])
+    assert [state.name for state in result[0].state_items] == ["New"]
+    assert result[0].state_items[0].work_items == [first]
+    assert (
+        work_items_by_type_and_state(
+            work_item_types, [first, other_type], [Category.PROPOSED]
+        )
+        == result
+    )
+
+    # A changed work item moves bucket
+    moved = _work_item(1, name, "Ready")
+    index.add(moved)
+    assert len(index) == 2
+    assert index.get(name, "New") == []
+    assert index.get(name, "Ready") == [moved]
+
+    index.remove(1)
+    index.remove(3)
+    assert 1 not in index
+    assert 2 in index
+    assert index.get(name, "Ready") == []
@@ -0,0 +1,47 @@
+"""Test the json module."""
+
+from collections.abc import Callable
+import json
+
+import pytest
+
+from aioazuredevops.client import DevOpsClient
+from aioazuredevops.json import JSONBackend, get_json_loads, json_loads
+
+from . import ORGANIZATION, PROJECT, RESPONSE_JSON_DEVOPS_WORK_ITEMS
+
+
+@pytest.mark.parametrize("backend", list(JSONBackend))
+def test_get_json_loads(backend: JSONBackend) -> None:
+    """Test each installed backend decodes bytes."""
+    if backend != JSONBackend.STDLIB:
+        pytest.importorskip(backend)
+
+    body = json.dumps(RESPONSE_JSON_DEVOPS_WORK_ITEMS).encode()
+
+    assert get_json_loads(backend)(body) == RESPONSE_JSON_DEVOPS_WORK_ITEMS
+    assert json_loads(body) == RESPONSE_JSON_DEVOPS_WORK_ITEMS
+
+
+@pytest.mark.asyncio
+async def test_json_loads_client(
+    make_devops_client: Callable[..., DevOpsClient],
+) -> None:
+    """Test the client decodes responses with the configured decoder."""
+    bodies: list[bytes] = []
+
+    def _loads(body: bytes):
+        bodies.append(body)
+        return json.loads(body)
+
+    devops_client = make_devops_client(json_loads=_loads)
+
+    work_items = await devops_client.get_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        ids=[1],
+    )
+
+    assert work_items is not None
+    assert len(bodies) == 1
+    assert json.loads(bodies[0]) == RESPONSE_JSON_DEVOPS_WORK_ITEMS
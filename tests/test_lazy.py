@@ -0,0 +1,60 @@
+"""Test the lazy module."""
+
+from aioresponses import aioresponses
+import pytest
+
+from aioazuredevops.client import DevOpsClient
+from aioazuredevops.decode import work_item_user_from_json
+from aioazuredevops.lazy import LazyWorkItemFields
+from aioazuredevops.models.work_item import WorkItemFields
+
+from . import ORGANIZATION, PROJECT, RESPONSE_JSON_DEVOPS_WORK_ITEM
+
+USER_JSON = {
+    "displayName": "testDisplayName",
+    "url": "testUrl",
+    "_links": {"avatar": {"href": "testAvatar"}},
+    "id": "testId",
+    "uniqueName": "testUniqueName",
+    "imageUrl": "testImageUrl",
+    "descriptor": "testDescriptor",
+}
+
+
+def test_lazy_work_item_fields() -> None:
+    """Test lazy fields are decoded once, on first access."""
+    fields = LazyWorkItemFields(
+        {**RESPONSE_JSON_DEVOPS_WORK_ITEM["fields"], "System.AssignedTo": USER_JSON}
+    )
+
+    assert isinstance(fields, WorkItemFields)
+    assert fields.state == "testState"
+    assert fields.assigned_to == work_item_user_from_json(USER_JSON)
+    assert fields.assigned_to is fields.assigned_to
+    assert fields.created_by is None
+
+    fields.state = "otherState"
+    assert fields.state == "otherState"
+
+
+@pytest.mark.asyncio
+async def test_get_work_items_lazy(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test lazy work items equal eagerly decoded work items."""
+    work_items = await devops_client.get_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        ids=[1],
+    )
+    lazy_work_items = await devops_client.get_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        ids=[1],
+        lazy=True,
+    )
+
+    assert lazy_work_items is not None
+    assert isinstance(lazy_work_items[0].fields, LazyWorkItemFields)
+    assert lazy_work_items == work_items
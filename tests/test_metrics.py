@@ -0,0 +1,184 @@
+"""Test the metrics module."""
+
+from collections.abc import Callable
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+from aioresponses import aioresponses
+import pytest
+
+from aioazuredevops.client import DEFAULT_API_VERSION, DEFAULT_BASE_URL, DevOpsClient
+from aioazuredevops.metrics import (
+    BUILD_ENDPOINT,
+    PROJECT_ENDPOINT,
+    WORK_ITEMS_ENDPOINT,
+    DevOpsMetrics,
+    Histogram,
+    Metric,
+    endpoint_template,
+)
+from aioazuredevops.rate_limit import RETRY_AFTER_HEADER, RateLimitController
+
+from . import ORGANIZATION, PROJECT, RESPONSE_JSON_DEVOPS_PROJECT
+
+ERROR_PROJECT_NAME = "errorproject"
+THROTTLED_PROJECT_NAME = "throttledproject"
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (
+            f"{DEFAULT_BASE_URL}/org/_apis/projects/project?api-version=7.2",
+            PROJECT_ENDPOINT,
+        ),
+        (
+            "https://devops.example.com/tfs/org/project/_apis/build/builds/12",
+            BUILD_ENDPOINT,
+        ),
+        ("/org/project/_apis/wit/workitems?ids=1,2", WORK_ITEMS_ENDPOINT),
+        (
+            "/org/project/_apis/unknown/12/items",
+            "/org/project/_apis/unknown/{id}/items",
+        ),
+    ],
+)
+def test_endpoint_template(url: str, expected: str) -> None:
+    """Test URLs map to their endpoint template."""
+    assert endpoint_template(url) == expected
+
+
+def test_histogram() -> None:
+    """Test histograms count values by bucket."""
+    histogram = Histogram((1.0, 2.0, 4.0))
+    assert histogram.snapshot().quantile(0.5) == 0.0
+    assert histogram.snapshot().mean == 0.0
+
+    for value in (0.5, 1.0, 1.5, 3.0, 10.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot.counts == (2, 1, 1, 1)
+    assert snapshot.count == 5
+    assert snapshot.total == 16.0
+    assert snapshot.max == 10.0
+    assert snapshot.mean == 3.2
+    assert snapshot.quantile(0.4) == 1.0
+    assert snapshot.quantile(0.5) == 2.0
+    assert snapshot.quantile(0.99) == 10.0
+
+
+@pytest.mark.asyncio
+async def test_client_metrics(
+    make_devops_client: Callable[..., DevOpsClient],
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the client records metrics per endpoint."""
+    metrics = DevOpsMetrics()
+    exported: list[tuple[str, Metric, float]] = []
+    remove_exporter = metrics.add_exporter(
+        lambda endpoint, metric, value: exported.append((endpoint, metric, value))
+    )
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/_apis/projects/{ERROR_PROJECT_NAME}?includeCapabilities=true&includeHistory=true&api-version={DEFAULT_API_VERSION}",
+        exception=TimeoutError(),
+    )
+
+    devops_client = make_devops_client(metrics=metrics)
+    assert devops_client.metrics is metrics
+
+    assert await devops_client.get_project(ORGANIZATION, PROJECT) is not None
+    assert await devops_client.get_work_items(ORGANIZATION, PROJECT, [1])
+    with pytest.raises(TimeoutError):
+        await devops_client.get_project(ORGANIZATION, ERROR_PROJECT_NAME)
+
+    remove_exporter()
+    assert await devops_client.get_project(ORGANIZATION, PROJECT) is not None
+
+    snapshot = metrics.snapshot()
+    project = snapshot[PROJECT_ENDPOINT]
+    assert project.requests == 3
+    assert project.statuses == {200: 2}
+    assert project.errors == 1
+    assert set(project.histograms) == {
+        Metric.TOTAL,
+        Metric.RESPONSE_BYTES,
+        Metric.DECODE,
+        Metric.BUILD,
+    }
+    assert project.histograms[Metric.BUILD].count == 2
+    assert project.histograms[Metric.RESPONSE_BYTES].max > 0
+    assert snapshot[WORK_ITEMS_ENDPOINT].histograms[Metric.BUILD].count == 1
+
+    assert [(endpoint, metric) for endpoint, metric, _ in exported] == [
+        (PROJECT_ENDPOINT, Metric.STATUS),
+        (PROJECT_ENDPOINT, Metric.TOTAL),
+        (PROJECT_ENDPOINT, Metric.RESPONSE_BYTES),
+        (PROJECT_ENDPOINT, Metric.DECODE),
+        (PROJECT_ENDPOINT, Metric.BUILD),
+        (WORK_ITEMS_ENDPOINT, Metric.STATUS),
+        (WORK_ITEMS_ENDPOINT, Metric.TOTAL),
+        (WORK_ITEMS_ENDPOINT, Metric.RESPONSE_BYTES),
+        (WORK_ITEMS_ENDPOINT, Metric.DECODE),
+        (WORK_ITEMS_ENDPOINT, Metric.BUILD),
+        (PROJECT_ENDPOINT, Metric.ERROR),
+    ]
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+@pytest.mark.asyncio
+async def test_trace_config(mock_aioresponse: aioresponses) -> None:
+    """Test the trace config records connection phases."""
+    mock_aioresponse.passthrough_unmatched = True
+
+    async def _project(request: web.Request) -> web.Response:
+        return web.json_response(RESPONSE_JSON_DEVOPS_PROJECT)
+
+    app = web.Application()
+    app.router.add_get(f"/{ORGANIZATION}/_apis/projects/{PROJECT}", _project)
+    metrics = DevOpsMetrics()
+
+    async with (
+        TestServer(app) as server,
+        ClientSession(trace_configs=[metrics.trace_config()]) as session,
+    ):
+        devops_client = DevOpsClient(
+            session, base_url=str(server.make_url("")), metrics=metrics
+        )
+        assert await devops_client.get_project(ORGANIZATION, PROJECT) is not None
+        assert await devops_client.get_project(ORGANIZATION, PROJECT) is not None
+
+    histograms = metrics.snapshot()[PROJECT_ENDPOINT].histograms
+    assert histograms[Metric.TTFB].count == 2
+    # The connection is reused for the second request
+    assert histograms[Metric.CONNECT].count == 1
+
+
+@pytest.mark.asyncio
+async def test_throttled_metrics(
+    make_devops_client: Callable[..., DevOpsClient],
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test throttled and error responses record their total latency."""
+    project_url = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/_apis/projects/{THROTTLED_PROJECT_NAME}?includeCapabilities=true&includeHistory=true&api-version={DEFAULT_API_VERSION}"
+    mock_aioresponse.get(project_url, status=503, headers={RETRY_AFTER_HEADER: "0"})
+    mock_aioresponse.get(project_url, payload=RESPONSE_JSON_DEVOPS_PROJECT)
+    mock_aioresponse.get(project_url, status=404)
+    metrics = DevOpsMetrics()
+
+    devops_client = make_devops_client(
+        rate_limiter=RateLimitController(), metrics=metrics
+    )
+    assert await devops_client.get_project(ORGANIZATION, THROTTLED_PROJECT_NAME)
+    assert await devops_client.get_project(ORGANIZATION, THROTTLED_PROJECT_NAME) is None
+
+    project = metrics.snapshot()[PROJECT_ENDPOINT]
+    assert project.statuses == {503: 1, 200: 1, 404: 1}
+    assert project.histograms[Metric.TOTAL].count == 3
+    assert project.histograms[Metric.RESPONSE_BYTES].count == 1
+
+    # Reset also forgets responses still being read
+    metrics.reset()
+    assert not metrics._started
@@ -0,0 +1,130 @@
+"""Test the project module."""
+
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from aioazuredevops.client import DEFAULT_API_VERSION, DEFAULT_BASE_URL, DevOpsClient
+from aioazuredevops.project import ProjectContext
+
+from . import (
+    ORGANIZATION,
+    PAT,
+    PROJECT,
+    RESPONSE_JSON_DEVOPS_ITERATION,
+    RESPONSE_JSON_DEVOPS_ITERATION_WORK_ITEMS,
+    RESPONSE_JSON_DEVOPS_PROJECT,
+    RESPONSE_JSON_DEVOPS_WIQL_RESULT,
+)
+
+QUOTED_PROJECT_NAME = "Team's Project"
+QUOTED_PROJECT_URL = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/Team%27s%20Project"
+
+
+@pytest.mark.asyncio
+async def test_project_context(devops_client: DevOpsClient) -> None:
+    """Test the bound methods match the client methods."""
+    context = devops_client.project(ORGANIZATION, PROJECT)
+    assert isinstance(context, ProjectContext)
+    assert context.client is devops_client
+    assert context.organization == ORGANIZATION
+    assert context.project == PROJECT
+    assert context.url == f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}"
+
+    assert await context.get_project() == await devops_client.get_project(
+        ORGANIZATION, PROJECT
+    )
+    assert await context.get_builds("") == await devops_client.get_builds(
+        ORGANIZATION, PROJECT, ""
+    )
+    assert [build async for build in context.iter_builds()] == [
+        build async for build in devops_client.iter_builds(ORGANIZATION, PROJECT)
+    ]
+    assert await context.get_build(1) == await devops_client.get_build(
+        ORGANIZATION, PROJECT, 1
+    )
+    assert await context.get_iterations() == await devops_client.get_iterations(
+        ORGANIZATION, PROJECT
+    )
+    assert await context.get_iteration("abc123") == await devops_client.get_iteration(
+        ORGANIZATION, PROJECT, "abc123"
+    )
+    assert await context.get_iteration_work_items(
+        "abc123"
+    ) == await devops_client.get_iteration_work_items(ORGANIZATION, PROJECT, "abc123")
+    assert await context.get_work_item_ids() == await devops_client.get_work_item_ids(
+        ORGANIZATION, PROJECT
+    )
+    assert await context.get_work_items([1]) == await devops_client.get_work_items(
+        ORGANIZATION, PROJECT, [1]
+    )
+    assert [work_item async for work_item in context.iter_work_items([1])] == [
+        work_item
+        async for work_item in devops_client.iter_work_items(ORGANIZATION, PROJECT, [1])
+    ]
+    assert await context.get_work_item_revisions(
+        [1]
+    ) == await devops_client.get_work_item_revisions(ORGANIZATION, PROJECT, [1])
+    assert (
+        await context.get_work_item_types()
+        == await devops_client.get_work_item_types(ORGANIZATION, PROJECT)
+    )
+
+
+@pytest.mark.asyncio
+async def test_project_quoted(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test names and ids are quoted in URLs, and names in WIQL."""
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/_apis/projects/Team%27s%20Project?includeCapabilities=true&includeHistory=true&api-version={DEFAULT_API_VERSION}",
+        payload=RESPONSE_JSON_DEVOPS_PROJECT,
+    )
+    wiql_url = f"{QUOTED_PROJECT_URL}/_apis/wit/wiql?api-version={DEFAULT_API_VERSION}"
+    mock_aioresponse.post(wiql_url, payload=RESPONSE_JSON_DEVOPS_WIQL_RESULT)
+
+    context = devops_client.project(ORGANIZATION, QUOTED_PROJECT_NAME)
+    assert context.url == QUOTED_PROJECT_URL
+    assert await context.get_project() is not None
+    assert await context.get_work_item_ids_from_wiql(states=["Won't Fix"])
+
+    mock_aioresponse.get(
+        f"{QUOTED_PROJECT_URL}/_apis/work/teamsettings/iterations/Sprint%201%2F2?api-version={DEFAULT_API_VERSION}",
+        payload=RESPONSE_JSON_DEVOPS_ITERATION,
+    )
+    mock_aioresponse.get(
+        f"{QUOTED_PROJECT_URL}/_apis/work/teamsettings/iterations/Sprint%201%2F2/workitems?api-version={DEFAULT_API_VERSION}",
+        payload=RESPONSE_JSON_DEVOPS_ITERATION_WORK_ITEMS,
+    )
+    assert await context.get_iteration("Sprint 1/2") is not None
+    assert await context.get_iteration_work_items("Sprint 1/2") is not None
+
+    query = mock_aioresponse.requests[("POST", URL(wiql_url))][0].kwargs["json"][
+        "query"
+    ]
+    assert "[System.TeamProject] = 'Team''s Project'" in query
+    assert "[System.State] IN('Won''t Fix')" in query
+
+
+@pytest.mark.asyncio
+async def test_authorization_header(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the authorization header is encoded once and sent on each request."""
+    assert await devops_client.authorize(pat=PAT, organization=ORGANIZATION)
+    context = devops_client.project(ORGANIZATION, PROJECT)
+    assert await context.get_build(1) is not None
+    assert await context.get_iterations() is not None
+
+    headers = [
+        call.kwargs["headers"]
+        for calls in mock_aioresponse.requests.values()
+        for call in calls
+    ]
+    assert len(headers) == 3
+    assert all(
+        header["Authorization"] == headers[0]["Authorization"] for header in headers
+    )
+    assert headers[0]["Authorization"].startswith("Basic ")
@@ -0,0 +1,98 @@
+"""Test the query module."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta, timezone
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aioresponses import aioresponses
+import pytest
+
+from aioazuredevops.client import DevOpsClient
+from aioazuredevops.query import BuildQuery, BuildQueryOrder, BuildResult, BuildStatus
+
+from . import ORGANIZATION, PROJECT, RESPONSE_JSON_DEVOPS_BUILDS
+
+
+def test_build_query_parameters() -> None:
+    """Test build queries compile to query strings."""
+    assert BuildQuery().parameters() == ""
+    assert BuildQuery(top=5).parameters() == "?$top=5"
+
+    query = BuildQuery(
+        definitions=[1, 2],
+        branch_name="refs/heads/feature/a b",
+        status_filter=[BuildStatus.COMPLETED],
+        result_filter=[BuildResult.SUCCEEDED, BuildResult.PARTIALLY_SUCCEEDED],
+        min_time=datetime(2024, 3, 1, tzinfo=UTC),
+        max_time=datetime(2024, 3, 2, 1, tzinfo=timezone(timedelta(hours=1))),
+        top=10,
+        query_order=BuildQueryOrder.FINISH_TIME_DESCENDING,
+        max_builds_per_definition=3,
+        properties=["a", "b"],
+    )
+    assert query.parameters() == (
+        "?definitions=1,2"
+        "&branchName=refs%2Fheads%2Ffeature%2Fa%20b"
+        "&statusFilter=completed"
+        "&resultFilter=succeeded,partiallySucceeded"
+        "&minTime=2024-03-01T00:00:00.000000Z"
+        "&maxTime=2024-03-02T00:00:00.000000Z"
+        "&$top=10"
+        "&queryOrder=finishTimeDescending"
+        "&maxBuildsPerDefinition=3"
+        "&properties=a,b"
+    )
+
+
+def test_build_query_cache_key() -> None:
+    """Test equal build queries are interchangeable cache keys."""
+    query = BuildQuery(definitions=[1], result_filter=[BuildResult.FAILED])
+    assert query.definitions == (1,)
+    assert query == BuildQuery(definitions=(1,), result_filter=(BuildResult.FAILED,))
+    assert {query: 1}[
+        BuildQuery(definitions=(1,), result_filter=(BuildResult.FAILED,))
+    ] == 1
+    assert query != BuildQuery(definitions=(1,))
+
+
+@pytest.mark.asyncio
+async def test_client_build_query(
+    make_devops_client: Callable[..., DevOpsClient],
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the client sends build query filters."""
+    mock_aioresponse.passthrough_unmatched = True
+    queries: list[dict[str, str]] = []
+
+    async def _builds(request: web.Request) -> web.Response:
+        queries.append(dict(request.query))
+        return web.json_response(RESPONSE_JSON_DEVOPS_BUILDS)
+
+    app = web.Application()
+    app.router.add_get(f"/{ORGANIZATION}/{PROJECT}/_apis/build/builds", _builds)
+    query = BuildQuery(
+        definitions=(1, 2),
+        branch_name="refs/heads/main",
+        result_filter=(BuildResult.FAILED,),
+        top=1,
+    )
+
+    async with TestServer(app) as server:
+        devops_client = make_devops_client(base_url=str(server.make_url("")))
+        builds = await devops_client.get_builds(ORGANIZATION, PROJECT, query)
+        assert builds
+        assert [
+            build
+            async for build in devops_client.project(ORGANIZATION, PROJECT).iter_builds(
+                query
+            )
+        ] == builds
+
+    assert len(queries) == 2
+    assert queries[0] == queries[1]
+    assert queries[0]["definitions"] == "1,2"
+    assert queries[0]["branchName"] == "refs/heads/main"
+    assert queries[0]["resultFilter"] == "failed"
+    assert queries[0]["$top"] == "1"
+    assert "api-version" in queries[0]
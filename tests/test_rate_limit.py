@@ -0,0 +1,93 @@
+"""Test the rate limit module."""
+
+from collections.abc import Callable
+
+from aioresponses import aioresponses
+import pytest
+
+from aioazuredevops.client import DEFAULT_API_VERSION, DEFAULT_BASE_URL, DevOpsClient
+from aioazuredevops.rate_limit import (
+    RATE_LIMIT_DELAY_HEADER,
+    RATE_LIMIT_LIMIT_HEADER,
+    RATE_LIMIT_REMAINING_HEADER,
+    RETRY_AFTER_HEADER,
+    RateLimitController,
+)
+
+from . import ORGANIZATION, RESPONSE_JSON_DEVOPS_PROJECT
+
+THROTTLED_PROJECT_NAME = "throttledproject"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_controller() -> None:
+    """Test the rate limit controller adjusts its limit."""
+    controller = RateLimitController(
+        initial_limit=4,
+        min_limit=1,
+        max_limit=5,
+        max_retries=1,
+    )
+
+    assert controller.limit == 4
+    assert controller.in_flight == 0
+
+    # Healthy responses increase the limit up to the maximum
+    for _ in range(10):
+        assert controller.record(200, {}) is None
+    assert controller.limit == controller.max_limit
+
+    # Delayed or nearly exhausted responses decrease the limit
+    assert controller.record(200, {RATE_LIMIT_DELAY_HEADER: "1.5"}) is None
+    assert controller.limit == 2
+    assert (
+        controller.record(
+            200,
+            {RATE_LIMIT_REMAINING_HEADER: "1", RATE_LIMIT_LIMIT_HEADER: "200"},
+        )
+        is None
+    )
+    assert controller.limit == controller.min_limit
+
+    # Throttled responses are retried after Retry-After
+    assert controller.record(429, {RETRY_AFTER_HEADER: "0"}) == 0
+    assert controller.record(503, {}, attempt=1) is None
+    assert controller.limit == controller.min_limit
+
+    async with controller:
+        assert controller.in_flight == 1
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_client(
+    make_devops_client: Callable[..., DevOpsClient],
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the client retries throttled requests."""
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/_apis/projects/{THROTTLED_PROJECT_NAME}?api-version={DEFAULT_API_VERSION}&includeCapabilities=true&includeHistory=true",
+        status=429,
+        headers={RETRY_AFTER_HEADER: "0"},
+    )
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/_apis/projects/{THROTTLED_PROJECT_NAME}?api-version={DEFAULT_API_VERSION}&includeCapabilities=true&includeHistory=true",
+        payload=RESPONSE_JSON_DEVOPS_PROJECT,
+        status=200,
+    )
+
+    controller = RateLimitController(initial_limit=2)
+    devops_client = make_devops_client(rate_limiter=controller)
+
+    assert devops_client.rate_limiter is controller
+
+    project = await devops_client.get_project(
+        organization=ORGANIZATION,
+        project=THROTTLED_PROJECT_NAME,
+    )
+
+    assert project is not None
+    assert project.id == RESPONSE_JSON_DEVOPS_PROJECT["id"]
+    # Halved by the throttled response, then increased by the retry
+    assert controller.limit == 2
+    assert controller.in_flight == 0
@@ -0,0 +1,253 @@
+"""Test the store module."""
+
+import asyncio
+from datetime import UTC, datetime
+from pathlib import Path
+
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from aioazuredevops.client import DEFAULT_API_VERSION, DEFAULT_BASE_URL, DevOpsClient
+from aioazuredevops.store import WorkItemStore
+
+from . import (
+    ORGANIZATION,
+    PROJECT,
+    RESPONSE_JSON_DEVOPS_WIQL_RESULT,
+    RESPONSE_JSON_DEVOPS_WORK_ITEM,
+    WORK_ITEM_FIELDS_PARAMETER,
+)
+
+WORK_ITEMS_URL = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={WORK_ITEM_FIELDS_PARAMETER}&ids=1"
+WIQL_CHANGED_URL = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/wiql?api-version={DEFAULT_API_VERSION}&timePrecision=true"
+WORK_ITEM_REVISIONS_URL = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields=System.Rev&ids=1"
+
+
+def test_work_item_store(tmp_path: Path) -> None:
+    """Test the work item store persists work items."""
+    path = tmp_path / "work_items.db"
+    store = WorkItemStore(path)
+
+    store.save(ORGANIZATION, PROJECT, [RESPONSE_JSON_DEVOPS_WORK_ITEM])
+    assert store.revisions(ORGANIZATION, PROJECT) == {1: 234}
+    assert store.revisions(ORGANIZATION, "otherproject") == {}
+    store.close()
+
+    # Work items outlive the store
+    store = WorkItemStore(path)
+    assert store.load(ORGANIZATION, PROJECT, [1, 2]) == {
+        1: RESPONSE_JSON_DEVOPS_WORK_ITEM
+    }
+
+    store.save(ORGANIZATION, PROJECT, [{**RESPONSE_JSON_DEVOPS_WORK_ITEM, "rev": 235}])
+    assert store.revisions(ORGANIZATION, PROJECT) == {1: 235}
+
+    store.delete(ORGANIZATION, PROJECT, [1])
+    assert store.load(ORGANIZATION, PROJECT, [1]) == {}
+    store.close()
+
+
+def test_work_item_store_watermark() -> None:
+    """Test the work item store keeps a watermark per project."""
+    store = WorkItemStore()
+    assert store.watermark(ORGANIZATION, PROJECT) is None
+
+    as_of = datetime(2024, 3, 1, 10, tzinfo=UTC)
+    store.set_watermark(ORGANIZATION, PROJECT, as_of)
+    assert store.watermark(ORGANIZATION, PROJECT) == as_of
+    assert store.watermark(ORGANIZATION, "otherproject") is None
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_work_item_store_concurrent_load() -> None:
+    """Test loads running in several threads get their own work items."""
+    store = WorkItemStore()
+    store.save(
+        ORGANIZATION,
+        PROJECT,
+        [{**RESPONSE_JSON_DEVOPS_WORK_ITEM, "id": id} for id in range(1, 1001)],
+    )
+
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(store.load, ORGANIZATION, PROJECT, range(start, 1001, 8))
+            for start in range(1, 9)
+        )
+    )
+    for start, result in enumerate(results, 1):
+        assert list(result) == list(range(start, 1001, 8))
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_get_stored_work_items(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the get_stored_work_items method only fetches stale work items."""
+    store = WorkItemStore()
+    work_items = await devops_client.get_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        ids=[1],
+    )
+
+    def _requests(method: str, url: str) -> int:
+        return len(mock_aioresponse.requests.get((method, URL(url)), []))
+
+    # Missing work items are fetched
+    assert (
+        await devops_client.get_stored_work_items(
+            organization=ORGANIZATION,
+            project=PROJECT,
+            store=store,
+        )
+        == work_items
+    )
+    assert _requests("GET", WORK_ITEMS_URL) == 2
+    assert store.watermark(ORGANIZATION, PROJECT) == datetime(
+        2021, 1, 15, 12, 0, 0, 123000, tzinfo=UTC
+    )
+
+    # Only work items changed since the watermark are fetched again
+    mock_aioresponse.post(
+        WIQL_CHANGED_URL,
+        payload={**RESPONSE_JSON_DEVOPS_WIQL_RESULT, "workItems": []},
+    )
+
+    assert (
+        await devops_client.get_stored_work_items(
+            organization=ORGANIZATION,
+            project=PROJECT,
+            store=store,
+            ids=[1],
+        )
+        == work_items
+    )
+    assert _requests("GET", WORK_ITEMS_URL) == 2
+    assert _requests("POST", WIQL_CHANGED_URL) == 1
+    assert _requests("GET", WORK_ITEM_REVISIONS_URL) == 0
+
+    mock_aioresponse.post(WIQL_CHANGED_URL, payload=RESPONSE_JSON_DEVOPS_WIQL_RESULT)
+
+    assert (
+        await devops_client.get_stored_work_items(
+            organization=ORGANIZATION,
+            project=PROJECT,
+            store=store,
+            ids=[1],
+        )
+        == work_items
+    )
+    assert _requests("GET", WORK_ITEMS_URL) == 3
+    assert _requests("GET", WORK_ITEM_REVISIONS_URL) == 0
+
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_get_stored_work_items_revisions(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test stored revisions are compared without a watermark."""
+    store = WorkItemStore()
+    store.save(ORGANIZATION, PROJECT, [RESPONSE_JSON_DEVOPS_WORK_ITEM])
+
+    def _work_item_requests() -> int:
+        return len(mock_aioresponse.requests.get(("GET", URL(WORK_ITEMS_URL)), []))
+
+    # Work items with the same revision are loaded from the store
+    mock_aioresponse.get(
+        WORK_ITEM_REVISIONS_URL,
+        payload={"count": 1, "value": [RESPONSE_JSON_DEVOPS_WORK_ITEM]},
+    )
+    assert await devops_client.get_stored_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        store=store,
+        ids=[1],
+    )
+    assert _work_item_requests() == 0
+    store.close()
+
+    # Work items with a new revision are fetched again
+    store = WorkItemStore()
+    store.save(ORGANIZATION, PROJECT, [{**RESPONSE_JSON_DEVOPS_WORK_ITEM, "rev": 1}])
+    mock_aioresponse.get(
+        WORK_ITEM_REVISIONS_URL,
+        payload={"count": 1, "value": [RESPONSE_JSON_DEVOPS_WORK_ITEM]},
+    )
+    assert await devops_client.get_stored_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        store=store,
+        ids=[1],
+    )
+    assert _work_item_requests() == 1
+    assert store.revisions(ORGANIZATION, PROJECT) == {1: 234}
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_get_stored_work_items_subsets(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test changes outside the requested ids are not skipped later."""
+    store = WorkItemStore()
+    store.save(
+        ORGANIZATION,
+        PROJECT,
+        [
+            {**RESPONSE_JSON_DEVOPS_WORK_ITEM, "rev": 1},
+            {**RESPONSE_JSON_DEVOPS_WORK_ITEM, "id": 2},
+        ],
+    )
+
+    # Without a watermark, one is only set once every stored item was compared
+    mock_aioresponse.get(
+        f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields=System.Rev&ids=2",
+        payload={
+            "count": 1,
+            "value": [{**RESPONSE_JSON_DEVOPS_WORK_ITEM, "id": 2}],
+        },
+    )
+    assert await devops_client.get_stored_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        store=store,
+        ids=[2],
+    )
+    assert store.watermark(ORGANIZATION, PROJECT) is None
+
+    # Work item 1 changed, but only work item 2 is requested
+    store.set_watermark(ORGANIZATION, PROJECT, datetime(2021, 1, 1, tzinfo=UTC))
+    mock_aioresponse.post(WIQL_CHANGED_URL, payload=RESPONSE_JSON_DEVOPS_WIQL_RESULT)
+    assert await devops_client.get_stored_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        store=store,
+        ids=[2],
+    )
+    assert store.watermark(ORGANIZATION, PROJECT) == datetime(
+        2021, 1, 15, 12, 0, 0, 123000, tzinfo=UTC
+    )
+    assert store.revisions(ORGANIZATION, PROJECT) == {2: 234}
+
+    # Work item 1 is fetched once requested, though not changed since
+    mock_aioresponse.post(
+        WIQL_CHANGED_URL,
+        payload={**RESPONSE_JSON_DEVOPS_WIQL_RESULT, "workItems": []},
+    )
+    work_items = await devops_client.get_stored_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        store=store,
+        ids=[1],
+    )
+    assert work_items is not None
+    assert [work_item.rev for work_item in work_items] == [234]
+    store.close()
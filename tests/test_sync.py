@@ -0,0 +1,114 @@
+"""Test the sync module."""
+
+from datetime import UTC, datetime
+
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from aioazuredevops.client import DEFAULT_API_VERSION, DEFAULT_BASE_URL, DevOpsClient
+from aioazuredevops.sync import WorkItemSync
+
+from . import (
+    ORGANIZATION,
+    RESPONSE_JSON_DEVOPS_WIQL_RESULT,
+    RESPONSE_JSON_DEVOPS_WORK_ITEM,
+    WORK_ITEM_FIELDS_PARAMETER,
+)
+
+SYNC_PROJECT_NAME = "syncproject"
+WIQL_URL = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{SYNC_PROJECT_NAME}/_apis/wit/wiql?api-version={DEFAULT_API_VERSION}"
+WIQL_CHANGED_URL = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{SYNC_PROJECT_NAME}/_apis/wit/wiql?api-version={DEFAULT_API_VERSION}&timePrecision=true"
+WORK_ITEMS_URL = f"{DEFAULT_BASE_URL}/{ORGANIZATION}/{SYNC_PROJECT_NAME}/_apis/wit/workitems?api-version={DEFAULT_API_VERSION}&errorPolicy=omit&fields={WORK_ITEM_FIELDS_PARAMETER}&ids=1"
+
+
+@pytest.mark.asyncio
+async def test_work_item_sync(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the work item sync reports added, changed and removed items."""
+    work_item_sync = WorkItemSync(
+        devops_client,
+        ORGANIZATION,
+        SYNC_PROJECT_NAME,
+        states=["testState"],
+    )
+
+    # The first refresh loads every work item
+    mock_aioresponse.post(
+        WIQL_URL,
+        payload={
+            **RESPONSE_JSON_DEVOPS_WIQL_RESULT,
+            "asOf": "2024-01-01T00:00:00Z",
+        },
+    )
+    mock_aioresponse.get(
+        WORK_ITEMS_URL,
+        payload={"count": 1, "value": [RESPONSE_JSON_DEVOPS_WORK_ITEM]},
+    )
+
+    changes = await work_item_sync.refresh()
+
+    assert changes is not None
+    assert [work_item.id for work_item in changes.added] == [1]
+    assert not changes.changed
+    assert not changes.removed
+    assert list(work_item_sync.work_items) == [1]
+    assert work_item_sync.watermark == datetime(2024, 1, 1, tzinfo=UTC)
+
+    # Later refreshes only fetch changed work items
+    mock_aioresponse.post(
+        WIQL_CHANGED_URL,
+        payload={
+            **RESPONSE_JSON_DEVOPS_WIQL_RESULT,
+            "asOf": "2024-01-02T00:00:00Z",
+        },
+    )
+    mock_aioresponse.get(
+        WORK_ITEMS_URL,
+        payload={
+            "count": 1,
+            "value": [{**RESPONSE_JSON_DEVOPS_WORK_ITEM, "rev": 235}],
+        },
+    )
+
+    changes = await work_item_sync.refresh()
+
+    assert changes is not None
+    assert not changes.added
+    assert [work_item.rev for work_item in changes.changed] == [235]
+    assert work_item_sync.work_items[1].rev == 235
+    assert work_item_sync.watermark == datetime(2024, 1, 2, tzinfo=UTC)
+    assert (
+        "[System.ChangedDate] >= '2024-01-01T00:00:00.000000Z'"
+        in mock_aioresponse.requests[("POST", URL(WIQL_CHANGED_URL))][0].kwargs["json"][
+            "query"
+        ]
+    )
+
+    # Failed queries leave the state untouched
+    mock_aioresponse.post(
+        WIQL_CHANGED_URL,
+        status=500,
+    )
+
+    assert await work_item_sync.refresh() is None
+    assert work_item_sync.watermark == datetime(2024, 1, 2, tzinfo=UTC)
+
+    # A full refresh removes work items that are no longer listed
+    mock_aioresponse.post(
+        WIQL_URL,
+        payload={
+            **RESPONSE_JSON_DEVOPS_WIQL_RESULT,
+            "asOf": "2024-01-03T00:00:00Z",
+            "workItems": [],
+        },
+    )
+
+    changes = await work_item_sync.refresh(full=True)
+
+    assert changes is not None
+    assert [work_item.id for work_item in changes.removed] == [1]
+    assert not work_item_sync.work_items
+    assert work_item_sync.watermark == datetime(2024, 1, 3, tzinfo=UTC)
@@ -0,0 +1,93 @@
+"""Test the table module."""
+
+from dataclasses import replace
+
+from aioresponses import aioresponses
+import pytest
+
+from aioazuredevops.client import DevOpsClient
+from aioazuredevops.models.work_item import WorkItem
+from aioazuredevops.table import NO_PRIORITY, DictionaryColumn, WorkItemTable
+
+from . import ORGANIZATION, PROJECT
+
+
+def test_dictionary_column() -> None:
+    """Test the dictionary column stores each value once."""
+    column = DictionaryColumn(["New", "Active", "New"])
+    column.extend(DictionaryColumn(["Closed", "New"]))
+
+    assert list(column) == ["New", "Active", "New", "Closed", "New"]
+    assert column.dictionary == ["New", "Active", "Closed"]
+    assert list(column.codes) == [0, 1, 0, 2, 0]
+    assert column.codes_of(["New", "Removed"]) == {0}
+    assert list(column.take([3, 1])) == ["Closed", "Active"]
+    assert column.counts() == {"New": 3, "Active": 1, "Closed": 1}
+
+    # Codes widen past one byte per row as the dictionary grows
+    column = DictionaryColumn(range(300))
+    assert column.codes.typecode == "H"
+    assert list(column) == list(range(300))
+    assert column.counts()[299] == 1
+
+
+@pytest.mark.asyncio
+async def test_work_item_table(
+    devops_client: DevOpsClient,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the work item table filters and groups work items."""
+    work_items = await devops_client.get_work_items(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        ids=[1],
+    )
+    assert work_items is not None
+
+    def _work_item(id: int, state: str, work_item_type: str, priority: int | None):
+        return replace(
+            work_items[0],
+            id=id,
+            fields=replace(
+                work_items[0].fields,
+                state=state,
+                work_item_type=work_item_type,
+                microsoft_vsts_common_priority=priority,
+            ),
+        )
+
+    rows: list[WorkItem] = [
+        _work_item(1, "New", "Bug", 1),
+        _work_item(2, "Active", "Bug", 2),
+        _work_item(3, "Active", "Task", None),
+        _work_item(4, "Closed", "Task", 2),
+    ]
+    table = WorkItemTable(rows)
+
+    assert len(table) == 4
+    assert list(table) == rows
+    assert list(table["id"]) == [1, 2, 3, 4]
+    assert list(table["microsoft_vsts_common_priority"]) == [1, 2, NO_PRIORITY, 2]
+    assert table["state"].dictionary == ["New", "Active", "Closed"]
+
+    active = table.filter(state=["New", "Active"], work_item_type="Bug")
+    assert list(active["id"]) == [1, 2]
+    assert list(table.filter(microsoft_vsts_common_priority=2)["id"]) == [2, 4]
+    assert not table.filter(state="Removed")
+
+    assert table.count_by("work_item_type") == {"Bug": 2, "Task": 2}
+    assert {
+        state: list(group["id"]) for state, group in table.group_by("state").items()
+    } == {"New": [1], "Active": [2, 3], "Closed": [4]}
+
+    # Tables are built chunk by chunk from the API
+    table = await devops_client.get_work_items_table(
+        organization=ORGANIZATION,
+        project=PROJECT,
+        ids=[1] * 300,
+    )
+    assert table is not None
+    # Each mocked chunk returns the same work item
+    assert len(table) == 2
+    assert table.row(1) == work_items[0]
+    assert table.count_by("state") == {"testState": 2}